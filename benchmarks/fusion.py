@@ -0,0 +1,67 @@
+"""Benchmark the top-k quality of merging engine results by frequency vs reciprocal rank fusion.
+
+Simulates queries over a pool of graded documents (grades 0-3). Each engine returns its top 10 of a
+noisy ordering of the pool, and engines complete in random order. A reliable engine (less noise, like
+wikipedia) has priority 2, the others 1. Results are merged with `ResultsAggregator.extract_dicts`,
+by frequency or by reciprocal rank fusion weighted by priority, and scored by the mean nDCG@10.
+
+Usage:
+    python benchmarks/fusion.py --queries 500 --engines 2 3 5
+"""
+
+import argparse
+from math import log2
+from random import Random
+
+from ddgs.results import MERGES, ResultsAggregator, TextResult
+
+POOL_SIZE = 100
+PER_ENGINE = 10
+
+
+def ndcg_at_10(grades: list[int], all_grades: list[int]) -> float:
+    """Compute the nDCG@10 of the grades of merged results, against the ideal order of the pool."""
+
+    def dcg(values: list[int]) -> float:
+        return sum((2.0**grade - 1) / log2(i + 2) for i, grade in enumerate(values[:10]))
+
+    ideal = dcg(sorted(all_grades, reverse=True))
+    return dcg(grades) / ideal if ideal else 0.0
+
+
+def run_query(rng: Random, n_engines: int) -> dict[str, float]:
+    """Merge the results of `n_engines` simulated engines, return the nDCG@10 of each merge."""
+    grades = rng.choices((3, 2, 1, 0), weights=(1, 3, 6, 10), k=POOL_SIZE)
+    engines = [("reliable", 2.0, 0.8)] + [(f"engine{i}", 1.0, 1.6) for i in range(1, n_engines)]
+    rng.shuffle(engines)  # completion order
+    results_aggregator: ResultsAggregator[TextResult] = ResultsAggregator({"href"})
+    for name, priority, noise in engines:
+        order = sorted(range(POOL_SIZE), key=lambda i: grades[i] + rng.gauss(0, noise), reverse=True)
+        items = [TextResult(title=f"doc {i}", href=f"https://doc{i}.example") for i in order[:PER_ENGINE]]
+        results_aggregator.extend(items, name, priority)
+    scores = {}
+    for merge in MERGES:
+        merged = [int(r["title"].removeprefix("doc ")) for r in results_aggregator.extract_dicts(merge)]
+        scores[merge] = ndcg_at_10([grades[i] for i in merged], grades)
+    return scores
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--engines", type=int, nargs="+", default=[2, 3, 5])
+    args = parser.parse_args()
+
+    print(f"{'engines':>8}" + "".join(f"{merge:>12}" for merge in MERGES))
+    for n_engines in args.engines:
+        rng = Random(n_engines)  # noqa: S311
+        totals = dict.fromkeys(MERGES, 0.0)
+        for _ in range(args.queries):
+            for merge, score in run_query(rng, n_engines).items():
+                totals[merge] += score
+        print(f"{n_engines:>8}" + "".join(f"{totals[merge] / args.queries:>12.3f}" for merge in MERGES))
+
+
+if __name__ == "__main__":
+    main()
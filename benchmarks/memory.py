@@ -0,0 +1,88 @@
+"""Benchmark the memory per result of the slotted result classes.
+
+Compares `TextResult` and `NewsResult` with equivalent dataclasses with a per-instance `__dict__`,
+as the result classes were before. Measured with tracemalloc, for results sharing the same field
+strings (the per-result overhead only) and for results with unique strings. Fields are stored
+without normalization (`BaseResult.lazy`), so both classes hold the same strings.
+
+Usage:
+    python benchmarks/memory.py --results 100000
+"""
+
+import argparse
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import Any
+
+from ddgs.results import BaseResult, NewsResult, TextResult
+
+
+@dataclass
+class DictTextResult:
+    """Text search result with a `__dict__`."""
+
+    title: str = ""
+    href: str = ""
+    body: str = ""
+
+
+@dataclass
+class DictNewsResult:
+    """News search result with a `__dict__`."""
+
+    date: str = ""
+    title: str = ""
+    body: str = ""
+    url: str = ""
+    image: str = ""
+    source: str = ""
+
+
+def make_results(result_cls: type[Any], n: int, *, unique: bool) -> list[Any]:
+    """Create `n` results with ~ the field sizes of real results."""
+    values = {
+        f.name: {"href": "https://www.example.com/python/page-", "url": "https://news.example.com/article-"}.get(
+            f.name, f"{f.name} of a python search result " * (4 if f.name == "body" else 1)
+        )
+        for f in fields(result_cls)
+    }
+    results = []
+    for i in range(n):
+        result = result_cls()
+        for name, value in values.items():
+            setattr(result, name, f"{value}{i}" if unique else value)
+        results.append(result)
+    return results
+
+
+def measure(create: Callable[[], list[Any]]) -> float:
+    """Return the bytes allocated per result."""
+    tracemalloc.start()
+    results = create()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(results)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=100_000)
+    args = parser.parse_args()
+
+    pairs: list[tuple[type[Any], type[BaseResult]]] = [(DictTextResult, TextResult), (DictNewsResult, NewsResult)]
+    BaseResult.lazy = True
+    print(f"results={args.results}")
+    print(f"{'class':<14}{'strings':<9}{'__dict__ B':>12}{'slots B':>10}{'saving':>10}")
+    for dict_cls, slots_cls in pairs:
+        for unique in (False, True):
+            before = measure(partial(make_results, dict_cls, args.results, unique=unique))
+            after = measure(partial(make_results, slots_cls, args.results, unique=unique))
+            label = "unique" if unique else "shared"
+            print(f"{slots_cls.__name__:<14}{label:<9}{before:>12.0f}{after:>10.0f}{1 - after / before:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
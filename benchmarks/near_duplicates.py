@@ -0,0 +1,62 @@
+"""Benchmark the near-duplicate collapsing of `ResultsAggregator` on large result sets.
+
+Aggregates `n` distinct results plus 10% near-duplicates of them (one word changed, a site name
+appended to the title, on another URL), with and without near-duplicate collapsing. The time per
+result stays about constant as `n` grows, as the LSH index only compares results sharing a band.
+
+Usage:
+    python benchmarks/near_duplicates.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import time
+from random import Random
+
+from ddgs.results import ResultsAggregator, TextResult
+
+VOCABULARY_SIZE = 5000
+BODY_WORDS = 30
+
+
+def make_results(n: int, rng: Random) -> list[TextResult]:
+    """Create `n` distinct results and `n // 10` near-duplicates, in random order."""
+    vocabulary = [f"word{i}" for i in range(VOCABULARY_SIZE)]
+    results = []
+    for i in range(n):
+        words = rng.choices(vocabulary, k=BODY_WORDS)
+        results.append(
+            TextResult(title=" ".join(words[:6]), href=f"https://site{i}.example/page", body=" ".join(words))
+        )
+    for i in rng.sample(range(n), n // 10):
+        words = results[i].body.split()
+        words[rng.randrange(BODY_WORDS)] = rng.choice(vocabulary)
+        title = f"{results[i].title} | Mirror"
+        results.append(TextResult(title=title, href=f"https://mirror{i}.example/page", body=" ".join(words)))
+    rng.shuffle(results)
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'results':>10}{'us/result':>12}{'collapsed':>12}{'us/result (off)':>18}")
+    for n in args.sizes:
+        results = make_results(n, Random(n))  # noqa: S311
+        timings = {}
+        for near_duplicates in (True, False):
+            results_aggregator: ResultsAggregator[TextResult] = ResultsAggregator(
+                {"href"}, near_duplicates=near_duplicates
+            )
+            start = time.perf_counter()
+            results_aggregator.extend(results)
+            timings[near_duplicates] = (time.perf_counter() - start) * 1e6 / len(results)
+            if near_duplicates:
+                collapsed = len(results) - len(results_aggregator)
+        print(f"{len(results):>10}{timings[True]:>12.1f}{collapsed:>12}{timings[False]:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark the CPU time of result normalization, eager vs lazy (`BaseResult.lazy`), over SERP fixtures.
+
+Each run searches a category like `DDGS` does: it extracts the results of every fixture page of the
+category (as its engines would return them) plus a duplicate of the first page, aggregates them and
+ranks them with `DDGS._rank_results`, which materializes only the `--max-results` returned results.
+In lazy mode, results dropped by `post_extract_results`, duplicates, and the fields that rankers do
+not read (see `RANKED_FIELDS`) of the results cut off by `max_results` are never normalized.
+Reports the number of normalizer calls and the time spent in normalizers per run, and the CPU time
+per run. HTML parsing dominates a run, so its CPU time is only comparable on an idle machine.
+
+Usage:
+    python benchmarks/normalization.py --runs 50 --rounds 10
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from ddgs.base import BaseSearchEngine
+from ddgs.ddgs import DDGS
+from ddgs.engines import ENGINES
+from ddgs.results import BaseResult, ResultsAggregator, _NormalizedField
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+QUERY = "python programming"
+normalizer_calls = 0
+normalizer_time = 0.0
+
+
+def count_calls(normalizer: Callable[[Any], str]) -> Callable[[Any], str]:
+    """Wrap a normalizer to count its calls and the time spent in it."""
+
+    def wrapper(value: Any) -> str:  # noqa: ANN401
+        global normalizer_calls, normalizer_time  # noqa: PLW0603
+        normalizer_calls += 1
+        start = time.perf_counter()
+        try:
+            return normalizer(value)
+        finally:
+            normalizer_time += time.perf_counter() - start
+
+    return wrapper
+
+
+def count_normalizer_calls(
+    pages: list[tuple[BaseSearchEngine[Any], bytes]], max_results: int, runs: int, *, lazy: bool
+) -> tuple[int, float]:
+    """Return the number of normalizer calls of a run and the time spent in normalizers, in microseconds."""
+    global normalizer_calls, normalizer_time
+    descriptors = [
+        d for cls in BaseResult.__subclasses__() for d in vars(cls).values() if isinstance(d, _NormalizedField)
+    ]
+    normalizers = [d.normalizer for d in descriptors]
+    for d in descriptors:
+        d.normalizer = count_calls(d.normalizer)
+    BaseResult.lazy = lazy
+    normalizer_calls, normalizer_time = 0, 0.0
+    try:
+        for _ in range(runs):
+            search(pages, max_results)
+    finally:
+        BaseResult.lazy = False
+        for d, normalizer in zip(descriptors, normalizers, strict=True):
+            d.normalizer = normalizer
+    return normalizer_calls // runs, normalizer_time * 1e6 / runs
+
+
+def search(pages: list[tuple[BaseSearchEngine[Any], bytes]], max_results: int) -> list[dict[str, Any]]:
+    """Extract, deduplicate and rank the results of the pages of a category, and a duplicate of the first."""
+    results_aggregator: ResultsAggregator[BaseResult] = ResultsAggregator({"href", "image", "url", "embed_url"})
+    for engine, html_bytes in [*pages, pages[0]]:
+        results_aggregator.extend(engine.post_extract_results(engine.extract_results(html_bytes)))
+    return DDGS._rank_results(results_aggregator, QUERY, max_results, None)
+
+
+def measure(
+    pages: list[tuple[BaseSearchEngine[Any], bytes]], max_results: int, runs: int, rounds: int
+) -> tuple[float, float]:
+    """Return the CPU time in milliseconds per run, eager and lazy, the best of `rounds` alternating rounds."""
+    times: dict[bool, list[float]] = {False: [], True: []}
+    for _ in range(rounds):
+        for lazy in (False, True):
+            BaseResult.lazy = lazy
+            start = time.process_time()
+            for _ in range(runs):
+                search(pages, max_results)
+            times[lazy].append((time.process_time() - start) * 1000 / runs)
+    BaseResult.lazy = False
+    return min(times[False]), min(times[True])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--max-results", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"runs={args.runs} rounds={args.rounds} max_results={args.max_results}")
+    categories: dict[str, list[tuple[BaseSearchEngine[Any], bytes]]] = {}
+    for path in sorted(FIXTURES.glob("*.html")):
+        category, name = path.stem.split("_", 1)
+        categories.setdefault(category, []).append((ENGINES[category][name](), path.read_bytes()))
+
+    print(
+        f"{'category':<10}{'pages':>6}{'calls eager':>13}{'lazy':>6}{'normalizers us eager':>22}{'lazy':>8}"
+        f"{'run ms eager':>14}{'lazy':>8}{'saving':>8}"
+    )
+    for category, pages in categories.items():
+        eager_calls, eager_us = count_normalizer_calls(pages, args.max_results, args.runs, lazy=False)
+        lazy_calls, lazy_us = count_normalizer_calls(pages, args.max_results, args.runs, lazy=True)
+        eager, lazy = measure(pages, args.max_results, args.runs, args.rounds)
+        print(
+            f"{category:<10}{len(pages) + 1:>6}{eager_calls:>13}{lazy_calls:>6}{eager_us:>22.1f}{lazy_us:>8.1f}"
+            f"{eager:>14.3f}{lazy:>8.3f}{1 - lazy / eager:>8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
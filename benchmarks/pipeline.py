@@ -0,0 +1,117 @@
+"""Benchmark the parsing hot path of each engine over the recorded responses in tests/fixtures, offline.
+
+For each fixture, a run does what a search does with a response: `extract_results`, `post_extract_results`,
+aggregation in `ResultsAggregator` and ranking (`DDGS._rank_results`). Reports per engine the pages per second
+in CPU time (best of `--rounds`), the microseconds per result, and the Python allocations of a run traced by
+tracemalloc (lxml trees are allocated by libxml2, untraced): the peak memory and the memory retained by the
+ranked results.
+
+Results can be saved with `--save` and compared with a saved baseline with `--compare`: the exit status is 1
+if an engine is slower or allocates more than the baseline by more than `--tolerance`. Allocations are
+deterministic; timings are only comparable on the same, otherwise idle, machine.
+
+Usage:
+    python benchmarks/pipeline.py --runs 50 --rounds 5 --save baseline.json
+    python benchmarks/pipeline.py --compare baseline.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from ddgs.base import BaseSearchEngine
+from ddgs.ddgs import DDGS
+from ddgs.engines import ENGINES
+from ddgs.results import BaseResult, ResultsAggregator
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+QUERY = "python programming"
+
+
+def run(engine: BaseSearchEngine[Any], body: bytes, ranker: str, merge: str) -> list[dict[str, Any]]:
+    """Extract, post-process, aggregate and rank the results of a response body."""
+    results = engine.post_extract_results(engine.extract_results(body))
+    results_aggregator: ResultsAggregator[BaseResult] = ResultsAggregator({"href", "image", "url", "embed_url"})
+    results_aggregator.extend(results, engine.name, engine.priority)
+    return DDGS._rank_results(results_aggregator, QUERY, None, None, ranker=ranker, merge=merge)
+
+
+def measure(engine: BaseSearchEngine[Any], body: bytes, args: argparse.Namespace) -> dict[str, float]:
+    """Return the pages per second, microseconds per result, and peak and retained KiB of a run."""
+    best = float("inf")
+    for _ in range(args.rounds):
+        start = time.process_time()
+        for _ in range(args.runs):
+            ranked = run(engine, body, args.ranker, args.merge)
+        best = min(best, (time.process_time() - start) / args.runs)
+
+    tracemalloc.start()
+    try:
+        ranked = run(engine, body, args.ranker, args.merge)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "pages_per_s": 1 / best,
+        "us_per_result": best * 1e6 / len(ranked),
+        "peak_kib": peak / 1024,
+        "retained_kib": retained / 1024,
+    }
+
+
+def compare(stats: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float) -> list[str]:
+    """Return the regressions of `stats` vs `baseline`, beyond `tolerance`."""
+    regressions = []
+    for name, values in stats.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        if values["pages_per_s"] < base["pages_per_s"] * (1 - tolerance):
+            regressions.append(f"{name}: {values['pages_per_s']:.0f} pages/s, baseline {base['pages_per_s']:.0f}")
+        if values["peak_kib"] > base["peak_kib"] * (1 + tolerance):
+            regressions.append(f"{name}: peak {values['peak_kib']:.0f} KiB, baseline {base['peak_kib']:.0f}")
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--ranker", default="simple", choices=["simple", "bm25"])
+    parser.add_argument("--merge", default="frequency", choices=["frequency", "rrf"])
+    parser.add_argument("--lazy", action="store_true", help="normalize result fields lazily (BaseResult.lazy)")
+    parser.add_argument("--save", type=Path, help="save the results to a JSON file")
+    parser.add_argument("--compare", type=Path, help="compare the results with a JSON file saved by --save")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    BaseResult.lazy = args.lazy
+    stats = {}
+    print(f"{'fixture':>22}{'KiB':>7}{'pages/s':>10}{'us/result':>11}{'peak KiB':>10}{'retained KiB':>14}")
+    for path in sorted(p for p in FIXTURES.iterdir() if p.suffix in {".html", ".json"}):
+        category, name = path.stem.split("_", 1)
+        engine = ENGINES[category][name]()
+        body = path.read_bytes()
+        stats[path.stem] = values = measure(engine, body, args)
+        print(
+            f"{path.stem:>22}{len(body) / 1024:>7.1f}{values['pages_per_s']:>10.0f}{values['us_per_result']:>11.1f}"
+            f"{values['peak_kib']:>10.0f}{values['retained_kib']:>14.1f}"
+        )
+
+    if args.save:
+        args.save.write_text(json.dumps(stats, indent=2))
+    if args.compare:
+        regressions = compare(stats, json.loads(args.compare.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
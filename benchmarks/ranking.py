@@ -0,0 +1,101 @@
+"""Benchmark the ranking quality and latency of `BM25Ranker` vs `SimpleFilterRanker`.
+
+Quality is measured on synthetic labelled result sets: for each query of 2-3 terms, docs are graded
+3 (all terms in the title and body), 2 (all terms in the body), 1 (some terms) or 0 (off-topic,
+half of them with words containing a query term, like "javascript" for "java"), and shuffled as
+results come in engine order. Reports the mean nDCG@10 and precision@10 (grade >= 2) over the queries.
+Latency is the time to rank result sets of each size, in ms.
+
+Usage:
+    python benchmarks/ranking.py --queries 200 --sizes 10 100 1000
+"""
+
+import argparse
+import time
+from math import log2
+from random import Random
+
+from ddgs.similarity import BM25Ranker, SimpleFilterRanker
+
+VOCABULARY_SIZE = 2000
+BODY_WORDS = 40
+TITLE_WORDS = 8
+RANKERS: dict[str, SimpleFilterRanker | BM25Ranker] = {"simple": SimpleFilterRanker(), "bm25": BM25Ranker()}
+
+
+def make_doc(rng: Random, vocabulary: list[str], title_terms: list[str], body_terms: list[str]) -> dict[str, str]:
+    """Create a doc of random words, with the given terms inserted in its title and body."""
+    title = rng.choices(vocabulary, k=TITLE_WORDS - len(title_terms)) + title_terms
+    body = rng.choices(vocabulary, k=BODY_WORDS - len(body_terms)) + body_terms
+    rng.shuffle(title)
+    rng.shuffle(body)
+    return {"title": " ".join(title), "href": f"https://{rng.getrandbits(64):x}.example", "body": " ".join(body)}
+
+
+def make_result_set(rng: Random, vocabulary: list[str], n: int) -> tuple[str, list[tuple[int, dict[str, str]]]]:
+    """Create a query and `n` graded docs, in random order."""
+    terms = rng.sample(vocabulary, rng.choice((2, 3)))
+    graded = []
+    for _ in range(n):
+        grade = rng.choices((3, 2, 1, 0), weights=(1, 2, 3, 6))[0]
+        if grade == 3:
+            doc = make_doc(rng, vocabulary, terms, terms * 2)
+        elif grade == 2:
+            doc = make_doc(rng, vocabulary, [], terms)
+        elif grade == 1:
+            some = rng.sample(terms, len(terms) - 1)
+            doc = make_doc(rng, vocabulary, some[:1], some)
+        else:
+            confusers = [f"{term}script" for term in terms] if rng.random() < 0.5 else []
+            doc = make_doc(rng, vocabulary, confusers[:1], confusers)
+        graded.append((grade, doc))
+    return " ".join(terms), graded
+
+
+def ndcg_at_10(grades: list[int]) -> float:
+    """Compute the nDCG@10 of the grades of ranked docs."""
+
+    def dcg(values: list[int]) -> float:
+        return sum((2.0**grade - 1) / log2(i + 2) for i, grade in enumerate(values[:10]))
+
+    ideal = dcg(sorted(grades, reverse=True))
+    return dcg(grades) / ideal if ideal else 0.0
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    rng = Random(0)  # noqa: S311
+    vocabulary = [f"w{i:04d}" for i in range(VOCABULARY_SIZE)]
+
+    print(f"{'ranker':>8}{'nDCG@10':>10}{'P@10':>8}")
+    result_sets = [make_result_set(rng, vocabulary, 50) for _ in range(args.queries)]
+    for name, ranker in RANKERS.items():
+        ndcg = precision = 0.0
+        for query, graded in result_sets:
+            grade_of = {doc["href"]: grade for grade, doc in graded}
+            grades = [grade_of[doc["href"]] for doc in ranker.rank([doc for _, doc in graded], query)]
+            ndcg += ndcg_at_10(grades)
+            precision += sum(grade >= 2 for grade in grades[:10]) / 10
+        print(f"{name:>8}{ndcg / len(result_sets):>10.3f}{precision / len(result_sets):>8.3f}")
+
+    print(f"\n{'docs':>8}" + "".join(f"{name + ' ms':>12}" for name in RANKERS))
+    for n in args.sizes:
+        query, graded = make_result_set(rng, vocabulary, n)
+        docs = [doc for _, doc in graded]
+        row = f"{n:>8}"
+        for ranker in RANKERS.values():
+            runs = max(1, 1000 // n)
+            start = time.perf_counter()
+            for _ in range(runs):
+                ranker.rank(docs, query)
+            row += f"{(time.perf_counter() - start) * 1000 / runs:>12.3f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark the engine scheduler of `DDGS._search_sync` with simulated engine latencies.
+
+Compares the current as-completed scheduler, with and without hedged requests, with the previous
+batch scheduler, which submitted `max_workers` engines and waited for the whole batch before
+submitting the next one.
+
+Usage:
+    python benchmarks/scheduler.py --runs 200 --max-results 30
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from random import Random
+from typing import Any
+
+from ddgs.base import BaseSearchEngine
+from ddgs.ddgs import DDGS
+from ddgs.results import ResultsAggregator, TextResult
+
+# (name, provider, priority, median latency in seconds)
+ENGINES = [
+    ("wikipedia", "wikipedia", 2, 0.02),
+    ("grokipedia", "grokipedia", 1.9, 0.03),
+    ("brave", "brave", 1, 0.04),
+    ("duckduckgo", "bing", 1, 0.03),
+    ("yahoo", "bing", 1, 0.04),
+    ("google", "google", 1, 0.03),
+    ("startpage", "google", 1, 0.05),
+    ("mojeek", "mojeek", 1, 0.04),
+    ("yandex", "yandex", 1, 0.05),
+]
+SLOW_PROBABILITY = 0.1  # chance that an engine has a "slow moment"
+SLOW_FACTOR = 10
+EMPTY_PROBABILITY = 0.2  # chance that an engine returns no results (captcha, empty page)
+
+
+class FakeEngine(BaseSearchEngine[TextResult]):
+    """Engine that sleeps for a simulated latency and returns 10 unique results, or none."""
+
+    category = "text"
+    search_url = ""
+    search_method = "GET"
+
+    def __init__(self, latency: float, *, empty: bool) -> None:
+        super().__init__()
+        self.latency = latency
+        self.empty = empty
+
+    def build_payload(self, *args: Any, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401, ARG002
+        """Build a payload for the search request."""
+        return {}
+
+    def search(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401, ARG002
+        """Sleep for a simulated latency and return results."""
+        time.sleep(self.latency)
+        if self.empty:
+            return []
+        results = []
+        for i in range(10):
+            result = TextResult()
+            result.title = f"{query} {self.name} {i}"
+            result.href = f"https://{self.name}.example/{i}"
+            result.body = f"{query} body"
+            results.append(result)
+        return results
+
+
+def make_engines(rng: Random) -> list[BaseSearchEngine[Any]]:
+    """Create fake engines with random latencies, in the order `DDGS._get_engines` would return them."""
+    engines: list[BaseSearchEngine[Any]] = []
+    for name, provider, priority, median_latency in ENGINES:
+        latency = rng.lognormvariate(0, 0.3) * median_latency
+        if rng.random() < SLOW_PROBABILITY:
+            latency *= SLOW_FACTOR
+        engine_cls = type(
+            f"Fake{name.title()}", (FakeEngine,), {"name": name, "provider": provider, "priority": priority}
+        )
+        engines.append(engine_cls(latency, empty=rng.random() < EMPTY_PROBABILITY))
+    rng.shuffle(engines)
+    engines.sort(key=lambda e: e.priority, reverse=True)
+    return engines
+
+
+class BenchDDGS(DDGS):
+    """DDGS with fake engines. The n-th search of every BenchDDGS sees the same engine latencies."""
+
+    def __init__(self, seed: int, hedge_percentile: float | None = None) -> None:
+        super().__init__(hedge_percentile=hedge_percentile)
+        self.rng = Random(seed)  # noqa: S311
+
+    def _get_engines(self, category: str, backend: str) -> list[BaseSearchEngine[Any]]:  # noqa: ARG002
+        return make_engines(self.rng)
+
+
+def batch_search(ddgs: BenchDDGS, query: str, max_results: int) -> list[dict[str, Any]]:
+    """Previous `_search_sync` scheduler: wait for each batch of engines before submitting more."""
+    engines = ddgs._get_engines("text", "auto")
+    seen_providers: set[str] = set()
+    results_aggregator: ResultsAggregator[TextResult] = ResultsAggregator({"href"})
+    max_workers = ddgs._get_max_workers(engines, max_results)
+    futures: dict[Any, BaseSearchEngine[Any]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for i, engine in enumerate(engines, start=1):
+            if engine.provider in seen_providers:
+                continue
+            futures[executor.submit(engine.search, query)] = engine
+            if len(futures) >= max_workers or i >= max_workers:
+                done, not_done = wait(futures, timeout=ddgs._timeout, return_when="FIRST_EXCEPTION")
+                for f, f_engine in futures.items():
+                    if f in done and (r := f.result()):
+                        results_aggregator.extend(r)
+                        seen_providers.add(f_engine.provider)
+                futures = {f: futures[f] for f in not_done}
+            if len(results_aggregator) >= max_results:
+                break
+    return ddgs._rank_results(results_aggregator, query, max_results, None)
+
+
+def measure(search: Callable[[BenchDDGS], list[dict[str, Any]]], ddgs: BenchDDGS, runs: int) -> list[float]:
+    """Return latencies in milliseconds of `runs` calls of `search`."""
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        search(ddgs)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--max-results", type=int, default=30)
+    args = parser.parse_args()
+
+    scenarios: dict[str, tuple[Callable[[BenchDDGS], list[dict[str, Any]]], float | None]] = {
+        "batch (previous)": (lambda d: batch_search(d, "python", args.max_results), None),
+        "as-completed": (lambda d: d.text("python", max_results=args.max_results), None),
+        # latency stats for hedging are collected by the previous scenarios
+        "hedged p90": (lambda d: d.text("python", max_results=args.max_results), 0.9),
+    }
+    print(f"runs={args.runs} max_results={args.max_results}")
+    print(f"{'scheduler':<18}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}")
+    for label, (search, hedge_percentile) in scenarios.items():
+        latencies = measure(search, BenchDDGS(seed=42, hedge_percentile=hedge_percentile), args.runs)
+        q = statistics.quantiles(latencies, n=100)
+        print(f"{label:<18}{q[49]:>10.1f}{q[89]:>10.1f}{q[98]:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark `_normalize_text` and `_normalize_texts` vs the normalization without fast paths.
+
+SERP text samples cover the cases engines return: plain ASCII titles, snippets with <b> highlighting and
+HTML entities, dates with separators, accented Latin, Cyrillic and CJK text, and text with zero-width
+or non-breaking spaces, newlines and tabs. Pages have 10 results with a unique title and body of a kind
+of text, and a source name, which repeat within a page. Reports the time per field, in microseconds.
+
+Usage:
+    python benchmarks/text_normalization.py --pages 2000
+"""
+
+import argparse
+import time
+import unicodedata
+from collections.abc import Callable
+from html import unescape
+from random import Random
+
+from ddgs.utils import _REGEX_STRIP_TAGS, _normalize_text, _normalize_texts
+
+SAMPLES = {
+    "ascii": [
+        "Welcome to Python.org",
+        (
+            "The official home of the Python Programming Language. Python is a programming language that lets you "
+            "work quickly and integrate systems more effectively."
+        ),
+        "Python (programming language) - Wikipedia",
+    ],
+    "html": [
+        (
+            "<b>Python</b> is a high-level, general-purpose programming language. Its design philosophy emphasizes "
+            "code readability with the use of significant indentation."
+        ),
+        "Learn <b>Python</b> &amp; Django in 30 days &#8211; the complete guide",
+        "Tom &amp; Jerry &quot;The Movie&quot; reviews",
+    ],
+    "unicode": [
+        "Jan 5, 2024 \u00b7 Python 3.12 is the latest stable release \u2014 what\u2019s new",
+        "Café de Flore \u2013 Les meilleures crêpes à la française",
+        "Python \u2014 высокоуровневый язык",
+        "Pythonは汎用のプログラミング言語である",
+    ],
+    "controls": [
+        "Learn Python\u200b in 10\u00a0minutes",
+        "Python tutorial\n\tfor beginners ",
+    ],
+}
+SOURCES = ["Wikipedia", "GitHub", "Stack Overflow", "Real Python", "YouTube"]
+
+
+def normalize_text_baseline(raw: str) -> str:
+    """Normalize text with every step, as `_normalize_text` did without fast paths."""
+    if not raw:
+        return ""
+    text = _REGEX_STRIP_TAGS.sub("", raw)
+    text = unescape(text)
+    text = unicodedata.normalize("NFC", text)
+    c_to_none = {ord(ch): None for ch in set(text) if unicodedata.category(ch)[0] == "C"}
+    if c_to_none:
+        text = text.translate(c_to_none)
+    return " ".join(text.split())
+
+
+def measure(normalize: Callable[[list[str]], list[str]], pages: list[list[str]], rounds: int) -> float:
+    """Return the time per field in microseconds, the best of `rounds` rounds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for page in pages:
+            normalize(page)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / sum(len(page) for page in pages)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = Random(0)  # noqa: S311
+    all_samples = [sample for samples in SAMPLES.values() for sample in samples]
+    for sample in all_samples:
+        assert _normalize_text(sample) == normalize_text_baseline(sample)  # noqa: S101
+
+    def make_page(n: int, samples: list[str]) -> list[str]:
+        fields = [f"{rng.choice(samples)} {n}-{i}" for i in range(20)]  # unique titles and bodies
+        return fields + rng.choices(SOURCES, k=10)
+
+    cases = {name: [make_page(n, samples) for n in range(args.pages)] for name, samples in SAMPLES.items()}
+    cases["mixed"] = [make_page(n, all_samples) for n in range(args.pages)]
+
+    print(f"{'text':>10}{'baseline us':>14}{'fast path us':>14}{'speedup':>9}{'batch us':>11}{'speedup':>9}")
+    for name, pages in cases.items():
+        baseline = measure(lambda page: [normalize_text_baseline(raw) for raw in page], pages, args.rounds)
+        fast = measure(lambda page: [_normalize_text(raw) for raw in page], pages, args.rounds)
+        batch = measure(_normalize_texts, pages, args.rounds)
+        print(
+            f"{name:>10}{baseline:>14.2f}{fast:>14.2f}{baseline / fast:>8.1f}x{batch:>11.2f}{baseline / batch:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
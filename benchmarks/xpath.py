@@ -0,0 +1,65 @@
+"""Benchmark the parse throughput of `BaseSearchEngine.extract_results` over recorded SERP fixtures.
+
+Compares extraction with xpath expressions compiled once per thread (`compile_xpath`), as `extract_results` does,
+with the previous extraction, which compiled the xpath strings of every element of every result.
+
+Usage:
+    python benchmarks/xpath.py --runs 200
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any
+
+from ddgs.base import BaseSearchEngine
+from ddgs.engines import ENGINES
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def extract_results_uncompiled(engine: BaseSearchEngine[Any], html_text: str) -> list[Any]:
+    """Previous `extract_results`: evaluate xpath strings with `.xpath()`."""
+    tree = engine.extract_tree(engine.pre_process_html(html_text))
+    items = tree.xpath(engine.items_xpath)
+    results = []
+    for item in items:
+        result = engine.result_type()
+        for key, value in engine.elements_xpath.items():
+            data = " ".join("".join(item.xpath(value)).split())
+            result.__setattr__(key, data)
+        results.append(result)
+    return results
+
+
+def measure(engine: BaseSearchEngine[Any], html_text: str, runs: int, *, compiled: bool) -> float:
+    """Return the number of pages parsed per second."""
+    extract = engine.extract_results if compiled else lambda text: extract_results_uncompiled(engine, text)
+    start = time.perf_counter()
+    for _ in range(runs):
+        extract(html_text)
+    return runs / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"runs={args.runs}")
+    print(f"{'fixture':<28}{'string pages/s':>16}{'compiled pages/s':>18}{'speedup':>10}")
+    for path in sorted(FIXTURES.glob("*.html")):
+        category, name = path.stem.split("_", 1)
+        engine = ENGINES[category][name]()
+        if type(engine).extract_results is not BaseSearchEngine.extract_results:
+            continue  # the engine has its own extraction
+        html_text = path.read_text(encoding="utf-8")
+        engine.extract_results(html_text)  # warm up the compiled xpath cache
+        string = measure(engine, html_text, args.runs, compiled=False)
+        compiled = measure(engine, html_text, args.runs, compiled=True)
+        print(f"{path.name:<28}{string:>16.0f}{compiled:>18.0f}{compiled / string:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,10 @@ import threading
 from typing import TYPE_CHECKING, Any, cast
 
 __version__ = "9.14.4"
-__all__ = ("DDGS",)
+__all__ = ("DDGS", "AsyncDDGS")
 
 if TYPE_CHECKING:
-    from .ddgs import DDGS
+    from .ddgs import DDGS, AsyncDDGS
 
 # A do-nothing logging handler
 # https://docs.python.org/3/howto/logging.html#configuring-logging-for-a-library
@@ -50,3 +50,13 @@ class _DDGSProxy(metaclass=_ProxyMeta):
 
 
 DDGS: type[DDGS] = cast("type[DDGS]", _DDGSProxy)  # type: ignore[no-redef]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Lazy-load AsyncDDGS."""
+    if name == "AsyncDDGS":
+        async_cls = importlib.import_module(".ddgs", package=__name__).AsyncDDGS
+        globals()["AsyncDDGS"] = async_cls
+        return async_cls
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,6 +1,5 @@
 """FastAPI application for DDGS API."""
 
-import asyncio
 import logging
 import os
 from typing import Any
@@ -9,7 +8,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
-from ddgs import DDGS
+from ddgs import AsyncDDGS
 from ddgs.utils import _expand_proxy_tb_alias
 
 # Configure logging
@@ -35,9 +34,9 @@ app.add_middleware(
 )
 
 
-def _get_ddgs() -> DDGS:
-    """Create a DDGS instance with proxy configuration from environment."""
-    return DDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY")))
+def _get_ddgs() -> AsyncDDGS:
+    """Create an AsyncDDGS instance with proxy configuration from environment."""
+    return AsyncDDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY")))
 
 
 # Pydantic models for request/response
@@ -148,16 +147,14 @@ async def health_check() -> HealthResponse:
 async def search_text(request: TextSearchRequest) -> SearchResponse:
     """Perform a text search."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().text(
-                query=request.query,
-                region=request.region,
-                safesearch=request.safesearch,
-                timelimit=request.timelimit,
-                max_results=request.max_results,
-                page=request.page,
-                backend=request.backend,
-            )
+        results = await _get_ddgs().text(
+            query=request.query,
+            region=request.region,
+            safesearch=request.safesearch,
+            timelimit=request.timelimit,
+            max_results=request.max_results,
+            page=request.page,
+            backend=request.backend,
         )
 
         return SearchResponse(results=results)
@@ -178,16 +175,14 @@ async def search_text_get(
 ) -> SearchResponse:
     """Perform a text search via GET request."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().text(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                max_results=max_results,
-                page=page,
-                backend=backend,
-            )
+        results = await _get_ddgs().text(
+            query=query,
+            region=region,
+            safesearch=safesearch,
+            timelimit=timelimit,
+            max_results=max_results,
+            page=page,
+            backend=backend,
         )
 
         return SearchResponse(results=results)
@@ -200,21 +195,19 @@ async def search_text_get(
 async def search_images(request: ImagesSearchRequest) -> SearchResponse:
     """Perform an image search."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().images(
-                query=request.query,
-                region=request.region,
-                safesearch=request.safesearch,
-                timelimit=request.timelimit,
-                max_results=request.max_results,
-                page=request.page,
-                backend=request.backend,
-                size=request.size,
-                color=request.color,
-                type_image=request.type_image,
-                layout=request.layout,
-                license_image=request.license_image,
-            )
+        results = await _get_ddgs().images(
+            query=request.query,
+            region=request.region,
+            safesearch=request.safesearch,
+            timelimit=request.timelimit,
+            max_results=request.max_results,
+            page=request.page,
+            backend=request.backend,
+            size=request.size,
+            color=request.color,
+            type_image=request.type_image,
+            layout=request.layout,
+            license_image=request.license_image,
         )
 
         return SearchResponse(results=results)
@@ -240,21 +233,19 @@ async def search_images_get(
 ) -> SearchResponse:
     """Perform an image search via GET request."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().images(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                max_results=max_results,
-                page=page,
-                backend=backend,
-                size=size,
-                color=color,
-                type_image=type_image,
-                layout=layout,
-                license_image=license_image,
-            )
+        results = await _get_ddgs().images(
+            query=query,
+            region=region,
+            safesearch=safesearch,
+            timelimit=timelimit,
+            max_results=max_results,
+            page=page,
+            backend=backend,
+            size=size,
+            color=color,
+            type_image=type_image,
+            layout=layout,
+            license_image=license_image,
         )
 
         return SearchResponse(results=results)
@@ -267,16 +258,14 @@ async def search_images_get(
 async def search_news(request: NewsSearchRequest) -> SearchResponse:
     """Perform a news search."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().news(
-                query=request.query,
-                region=request.region,
-                safesearch=request.safesearch,
-                timelimit=request.timelimit,
-                max_results=request.max_results,
-                page=request.page,
-                backend=request.backend,
-            )
+        results = await _get_ddgs().news(
+            query=request.query,
+            region=request.region,
+            safesearch=request.safesearch,
+            timelimit=request.timelimit,
+            max_results=request.max_results,
+            page=request.page,
+            backend=request.backend,
         )
 
         return SearchResponse(results=results)
@@ -297,16 +286,14 @@ async def search_news_get(
 ) -> SearchResponse:
     """Perform a news search via GET request."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().news(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                max_results=max_results,
-                page=page,
-                backend=backend,
-            )
+        results = await _get_ddgs().news(
+            query=query,
+            region=region,
+            safesearch=safesearch,
+            timelimit=timelimit,
+            max_results=max_results,
+            page=page,
+            backend=backend,
         )
 
         return SearchResponse(results=results)
@@ -319,19 +306,17 @@ async def search_news_get(
 async def search_videos(request: VideosSearchRequest) -> SearchResponse:
     """Perform a video search."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().videos(
-                query=request.query,
-                region=request.region,
-                safesearch=request.safesearch,
-                timelimit=request.timelimit,
-                max_results=request.max_results,
-                page=request.page,
-                backend=request.backend,
-                resolution=request.resolution,
-                duration=request.duration,
-                license_videos=request.license_videos,
-            )
+        results = await _get_ddgs().videos(
+            query=request.query,
+            region=request.region,
+            safesearch=request.safesearch,
+            timelimit=request.timelimit,
+            max_results=request.max_results,
+            page=request.page,
+            backend=request.backend,
+            resolution=request.resolution,
+            duration=request.duration,
+            license_videos=request.license_videos,
         )
 
         return SearchResponse(results=results)
@@ -355,19 +340,17 @@ async def search_videos_get(
 ) -> SearchResponse:
     """Perform a video search via GET request."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().videos(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                max_results=max_results,
-                page=page,
-                backend=backend,
-                resolution=resolution,
-                duration=duration,
-                license_videos=license_videos,
-            )
+        results = await _get_ddgs().videos(
+            query=query,
+            region=region,
+            safesearch=safesearch,
+            timelimit=timelimit,
+            max_results=max_results,
+            page=page,
+            backend=backend,
+            resolution=resolution,
+            duration=duration,
+            license_videos=license_videos,
         )
 
         return SearchResponse(results=results)
@@ -380,13 +363,11 @@ async def search_videos_get(
 async def search_books(request: BooksSearchRequest) -> SearchResponse:
     """Perform a book search."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().books(
-                query=request.query,
-                max_results=request.max_results,
-                page=request.page,
-                backend=request.backend,
-            )
+        results = await _get_ddgs().books(
+            query=request.query,
+            max_results=request.max_results,
+            page=request.page,
+            backend=request.backend,
         )
 
         return SearchResponse(results=results)
@@ -404,13 +385,11 @@ async def search_books_get(
 ) -> SearchResponse:
     """Perform a book search via GET request."""
     try:
-        results = await asyncio.to_thread(
-            lambda: _get_ddgs().books(
-                query=query,
-                max_results=max_results,
-                page=page,
-                backend=backend,
-            )
+        results = await _get_ddgs().books(
+            query=query,
+            max_results=max_results,
+            page=page,
+            backend=backend,
         )
 
         return SearchResponse(results=results)
@@ -423,11 +402,9 @@ async def search_books_get(
 async def extract_content(request: ExtractRequest) -> dict[str, str | bytes]:
     """Extract text content from a URL."""
     try:
-        return await asyncio.to_thread(
-            lambda: _get_ddgs().extract(
-                url=request.url,
-                fmt=request.format,
-            )
+        return await _get_ddgs().extract(
+            url=request.url,
+            fmt=request.format,
         )
     except Exception as e:
         logger.warning("Error extracting content: %s", e)
@@ -438,11 +415,9 @@ async def extract_content(request: ExtractRequest) -> dict[str, str | bytes]:
 async def extract_content_get(url: str, fmt: str = "text_markdown") -> dict[str, str | bytes]:
     """Extract text content from a URL via GET request."""
     try:
-        return await asyncio.to_thread(
-            lambda: _get_ddgs().extract(
-                url=url,
-                fmt=fmt,
-            )
+        return await _get_ddgs().extract(
+            url=url,
+            fmt=fmt,
         )
     except Exception as e:
         logger.warning("Error extracting content (GET): %s", e)
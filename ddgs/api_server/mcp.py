@@ -1,13 +1,12 @@
 """MCP server for DDGS."""
 
-import asyncio
 import logging
 import os
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
-from ddgs import DDGS
+from ddgs import AsyncDDGS
 from ddgs.utils import _expand_proxy_tb_alias
 
 logger = logging.getLogger(__name__)
@@ -41,16 +40,14 @@ async def search_text(
         List of search results with title, href, and body
 
     """
-    results = await asyncio.to_thread(
-        lambda: DDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).text(
-            query=query,
-            region=region,
-            safesearch=safesearch,
-            timelimit=timelimit,
-            max_results=max_results,
-            page=page,
-            backend=backend,
-        )
+    results = await AsyncDDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).text(
+        query=query,
+        region=region,
+        safesearch=safesearch,
+        timelimit=timelimit,
+        max_results=max_results,
+        page=page,
+        backend=backend,
     )
     return list(results)
 
@@ -90,21 +87,19 @@ async def search_images(
         List of image search results with title, image URL, and source
 
     """
-    results = await asyncio.to_thread(
-        lambda: DDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).images(
-            query=query,
-            region=region,
-            safesearch=safesearch,
-            timelimit=timelimit,
-            max_results=max_results,
-            page=page,
-            backend=backend,
-            size=size,
-            color=color,
-            type_image=type_image,
-            layout=layout,
-            license_image=license_image,
-        )
+    results = await AsyncDDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).images(
+        query=query,
+        region=region,
+        safesearch=safesearch,
+        timelimit=timelimit,
+        max_results=max_results,
+        page=page,
+        backend=backend,
+        size=size,
+        color=color,
+        type_image=type_image,
+        layout=layout,
+        license_image=license_image,
     )
     return list(results)
 
@@ -134,16 +129,14 @@ async def search_news(
         List of news results with title, URL, source, and date
 
     """
-    results = await asyncio.to_thread(
-        lambda: DDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).news(
-            query=query,
-            region=region,
-            safesearch=safesearch,
-            timelimit=timelimit,
-            max_results=max_results,
-            page=page,
-            backend=backend,
-        )
+    results = await AsyncDDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).news(
+        query=query,
+        region=region,
+        safesearch=safesearch,
+        timelimit=timelimit,
+        max_results=max_results,
+        page=page,
+        backend=backend,
     )
     return list(results)
 
@@ -179,19 +172,17 @@ async def search_videos(
         List of video search results with title, URL, and metadata
 
     """
-    results = await asyncio.to_thread(
-        lambda: DDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).videos(
-            query=query,
-            region=region,
-            safesearch=safesearch,
-            timelimit=timelimit,
-            max_results=max_results,
-            page=page,
-            backend=backend,
-            resolution=resolution,
-            duration=duration,
-            license_videos=license_videos,
-        )
+    results = await AsyncDDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).videos(
+        query=query,
+        region=region,
+        safesearch=safesearch,
+        timelimit=timelimit,
+        max_results=max_results,
+        page=page,
+        backend=backend,
+        resolution=resolution,
+        duration=duration,
+        license_videos=license_videos,
     )
     return list(results)
 
@@ -215,13 +206,11 @@ async def search_books(
         List of book search results with title, author, and metadata
 
     """
-    results = await asyncio.to_thread(
-        lambda: DDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).books(
-            query=query,
-            max_results=max_results,
-            page=page,
-            backend=backend,
-        )
+    results = await AsyncDDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).books(
+        query=query,
+        max_results=max_results,
+        page=page,
+        backend=backend,
     )
     return list(results)
 
@@ -238,9 +227,7 @@ async def extract_content(url: str, fmt: str = "text_markdown") -> dict[str, str
         Dictionary with url and content keys.
 
     """
-    return await asyncio.to_thread(
-        lambda: DDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).extract(
-            url=url,
-            fmt=fmt,
-        )
+    return await AsyncDDGS(proxy=_expand_proxy_tb_alias(os.environ.get("DDGS_PROXY"))).extract(
+        url=url,
+        fmt=fmt,
     )
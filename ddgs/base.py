@@ -1,19 +1,42 @@
 """Base class for search engines."""
 
 import logging
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from functools import cached_property
 from typing import Any, ClassVar, Generic, Literal, TypeVar
 
 from lxml import html
 from lxml.etree import HTMLParser as LHTMLParser
+from lxml.etree import XPath, _Element
 
-from .http_client import HttpClient
-from .results import BooksResult, ImagesResult, NewsResult, TextResult, VideosResult
+from .exceptions import RatelimitException
+from .http_client import AsyncHttpClient, HttpClient, Response
+from .results import BaseResult, BooksResult, ImagesResult, NewsResult, TextResult, VideosResult
+from .utils import _normalize_texts
 
 logger = logging.getLogger(__name__)
-T = TypeVar("T")
+T = TypeVar("T", bound=BaseResult)
+
+
+class _XPathCache(threading.local):
+    def __init__(self) -> None:
+        self.xpaths: dict[str, XPath] = {}
+
+
+_xpath_cache = _XPathCache()
+
+
+def compile_xpath(expr: str) -> Callable[..., Any]:
+    """Compile an xpath expression once per thread, and reuse it for every search of every engine.
+
+    An XPath object evaluates one expression at a time, so threads don't share them.
+    """
+    xpaths = _xpath_cache.xpaths
+    if (xpath := xpaths.get(expr)) is None:
+        xpath = xpaths[expr] = XPath(expr)
+    return xpath
 
 
 class BaseSearchEngine(ABC, Generic[T]):
@@ -35,8 +58,16 @@ class BaseSearchEngine(ABC, Generic[T]):
     def __init__(self, proxy: str | None = None, timeout: int | None = None, *, verify: bool | str = True) -> None:
         self.http_client = HttpClient(proxy=proxy, timeout=timeout, verify=verify)
         self.http_client.client.headers_update(self.headers_update)
+        self._client_kwargs: dict[str, Any] = {"proxy": proxy, "timeout": timeout, "verify": verify}
         self.results: list[T] = []
 
+    @cached_property
+    def async_http_client(self) -> AsyncHttpClient:
+        """Get async HTTP client. Created on first use by `asearch`."""
+        client = AsyncHttpClient(**self._client_kwargs)
+        client.client.headers_update(self.headers_update)
+        return client
+
     @property
     def result_type(self) -> type[T]:
         """Get result type based on category."""
@@ -62,37 +93,106 @@ class BaseSearchEngine(ABC, Generic[T]):
         """Build a payload for the search request."""
         raise NotImplementedError
 
+    def _get_search_url(self, region: str) -> str:  # noqa: ARG002
+        """Get the url of the search request. Engines with a url per region override this."""
+        return self.search_url
+
+    async def abuild_payload(
+        self,
+        query: str,
+        region: str,
+        safesearch: str,
+        timelimit: str | None,
+        page: int,
+        **kwargs: str,
+    ) -> dict[str, Any]:
+        """Build a payload for the async search request.
+
+        Engines whose `build_payload` makes HTTP requests override this to make them asynchronously.
+        """
+        return self.build_payload(
+            query=query, region=region, safesearch=safesearch, timelimit=timelimit, page=page, **kwargs
+        )
+
+    def set_cookies(self, url: str, cookies: Mapping[str, str]) -> None:
+        """Set cookies on the sync and, if already created, the async HTTP client."""
+        self.http_client.client.set_cookies(url, cookies)
+        if "async_http_client" in self.__dict__:
+            self.async_http_client.client.set_cookies(url, cookies)
+
+    def _check_status(self, resp: Response) -> bool:
+        """Check if the response is successful. Raise RatelimitException on 429 Too Many Requests."""
+        if resp.status_code == 200:
+            return True
+        if resp.status_code == 429:
+            msg = f"{self.name}: 429 Too Many Requests"
+            raise RatelimitException(msg)
+        return False
+
+    @staticmethod
+    def _get_body(resp: Response) -> str | bytes:
+        """Get the response body as bytes if it is UTF-8, so lxml parses it without a decoded copy."""
+        if resp.encoding and resp.encoding.lower().replace("-", "") == "utf8":
+            return resp.content
+        return resp.text
+
     def request(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
         """Make a request to the search engine."""
         resp = self.http_client.request(*args, **kwargs)
-        if resp.status_code == 200:
-            return resp.text
+        if self._check_status(resp):
+            return self._get_body(resp)
+        return None
+
+    async def arequest(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Make an async request to the search engine."""
+        resp = await self.async_http_client.request(*args, **kwargs)
+        if self._check_status(resp):
+            return self._get_body(resp)
         return None
 
     @cached_property
     def parser(self) -> LHTMLParser:
-        """Get HTML parser."""
-        return LHTMLParser(remove_blank_text=True, remove_comments=True, remove_pis=True, collect_ids=False)
+        """Get HTML parser. Bytes are decoded as UTF-8, see `_get_body`."""
+        return LHTMLParser(
+            encoding="utf-8", remove_blank_text=True, remove_comments=True, remove_pis=True, collect_ids=False
+        )
 
-    def extract_tree(self, html_text: str) -> html.Element:
-        """Extract html tree from html text."""
+    def extract_tree(self, html_text: str | bytes) -> html.Element:
+        """Extract html tree from html text or UTF-8 bytes."""
         return html.fromstring(html_text, parser=self.parser)
 
-    def pre_process_html(self, html_text: str) -> str:
+    def pre_process_html(self, html_text: str | bytes) -> str | bytes:
         """Pre-process html_text before extracting results."""
         return html_text
 
-    def extract_results(self, html_text: str) -> list[T]:
-        """Extract search results from html text."""
+    def extract_results(self, html_text: str | bytes) -> list[T]:
+        """Extract search results from html text or UTF-8 bytes."""
         html_text = self.pre_process_html(html_text)
         tree = self.extract_tree(html_text)
-        items = tree.xpath(self.items_xpath)
+        return self.extract_results_from_tree(tree)
+
+    def extract_results_from_tree(self, tree: _Element) -> list[T]:
+        """Extract search results from an html tree.
+
+        Unless results are normalized lazily (`BaseResult.lazy`), the text fields of the page are normalized
+        at once with `_normalize_texts`, so texts repeated in the page are normalized once.
+        """
+        items = compile_xpath(self.items_xpath)(tree)
+        columns = {}
+        for key, value in self.elements_xpath.items():
+            xpath = compile_xpath(value)
+            columns[key] = [" ".join("".join(xpath(item)).split()) for item in items]
+        normalized = set() if BaseResult.lazy else columns.keys() & self.result_type._text_fields
+        for key in normalized:
+            columns[key] = _normalize_texts(columns[key])
         results = []
-        for item in items:
+        for i in range(len(items)):
             result = self.result_type()
-            for key, value in self.elements_xpath.items():
-                data = " ".join("".join(item.xpath(value)).split())
-                result.__setattr__(key, data)
+            for key, values in columns.items():
+                if key in normalized:
+                    result._set_normalized(key, values[i])
+                else:
+                    result.__setattr__(key, values[i])
             results.append(result)
         return results
 
@@ -113,10 +213,29 @@ class BaseSearchEngine(ABC, Generic[T]):
         payload = self.build_payload(
             query=query, region=region, safesearch=safesearch, timelimit=timelimit, page=page, **kwargs
         )
-        if self.search_method == "GET":
-            html_text = self.request(self.search_method, self.search_url, params=payload)
-        else:
-            html_text = self.request(self.search_method, self.search_url, data=payload)
+        request_kwargs = {"params": payload} if self.search_method == "GET" else {"data": payload}
+        html_text = self.request(self.search_method, self._get_search_url(region), **request_kwargs)
+        if not html_text:
+            return None
+        results = self.extract_results(html_text)
+        return self.post_extract_results(results)
+
+    async def asearch(
+        self,
+        query: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        page: int = 1,
+        **kwargs: str,
+    ) -> list[T] | None:
+        """Search the engine asynchronously."""
+        _ = self.async_http_client  # create before building the payload, so cookies are set on it
+        payload = await self.abuild_payload(
+            query=query, region=region, safesearch=safesearch, timelimit=timelimit, page=page, **kwargs
+        )
+        request_kwargs = {"params": payload} if self.search_method == "GET" else {"data": payload}
+        html_text = await self.arequest(self.search_method, self._get_search_url(region), **request_kwargs)
         if not html_text:
             return None
         results = self.extract_results(html_text)
@@ -0,0 +1,231 @@
+"""Batch search of many queries through one shared worker pool."""
+
+from collections import Counter
+from collections.abc import Generator, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import DDGSException
+from .results import BaseResult, ResultsAggregator
+
+if TYPE_CHECKING:
+    from .base import BaseSearchEngine
+    from .ddgs import DDGS
+
+DEFAULT_MAX_WORKERS_PER_ENGINE = 2
+
+
+class _BatchQuery:
+    """State of a query in a batch."""
+
+    def __init__(
+        self,
+        query: str,
+        engines: list["BaseSearchEngine[Any]"],
+        max_workers: int,
+        cache_key: str,
+        *,
+        near_duplicates: bool = False,
+    ) -> None:
+        self.query = query
+        self.engines = engines
+        self.max_workers = max_workers
+        self.cache_key = cache_key
+        self.tried: set[BaseSearchEngine[Any]] = set()
+        self.seen_providers: set[str] = set()
+        self.running = 0
+        self.results_aggregator: ResultsAggregator[BaseResult] = ResultsAggregator(
+            {"href", "image", "url", "embed_url"}, near_duplicates=near_duplicates
+        )
+        self.err: Exception | None = None
+
+    def has_engines_left(self) -> bool:
+        """Check if there are untried engines of providers without results."""
+        return any(e not in self.tried and e.provider not in self.seen_providers for e in self.engines)
+
+
+class BatchSearch:
+    """Search many queries in one category through one shared worker pool.
+
+    Every (query, engine) request is submitted to the same thread pool. Each query is searched like
+    `DDGS._search_sync` (engines in priority order, one per provider, until `max_results`), while
+    `max_workers` caps the requests in flight in total and `max_workers_per_engine` per engine.
+    Identical queries are searched once. See `DDGS.batch`.
+    """
+
+    def __init__(
+        self,
+        ddgs: "DDGS",
+        category: str,
+        *,
+        ordered: bool = True,
+        max_workers: int = 10,
+        max_workers_per_engine: int | Mapping[str, int] = DEFAULT_MAX_WORKERS_PER_ENGINE,
+        max_results: int | None = 10,
+        backend: str = "auto",
+        ranker: str = "simple",
+        merge: str = "frequency",
+        near_duplicates: bool = False,
+        **search_kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        self.ddgs = ddgs
+        self.category = category
+        self.ordered = ordered
+        self.max_workers = max_workers
+        self.max_workers_per_engine = max_workers_per_engine
+        self.max_results = max_results
+        self.backend = backend
+        self.ranker = ranker
+        self.merge = merge
+        self.near_duplicates = near_duplicates
+        self.search_kwargs = search_kwargs
+
+        self._active: dict[str, _BatchQuery] = {}  # queries being searched, in input order
+        self._positions: dict[str, list[int]] = {}  # query -> positions in the input waiting for its results
+        self._results: dict[str, list[dict[str, Any]] | DDGSException] = {}  # results of finished queries
+        self._ready: dict[int, tuple[str, list[dict[str, Any]] | DDGSException]] = {}  # position -> results
+        self._futures: dict[Future[list[Any] | None], tuple[_BatchQuery, BaseSearchEngine[Any]]] = {}
+        self._engine_running: Counter[str] = Counter()
+
+    def _get_engine_limit(self, engine: "BaseSearchEngine[Any]") -> int:
+        if isinstance(self.max_workers_per_engine, Mapping):
+            return self.max_workers_per_engine.get(engine.name, DEFAULT_MAX_WORKERS_PER_ENGINE)
+        return self.max_workers_per_engine
+
+    def _add_query(self, position: int, query: str) -> None:
+        """Start searching a query, or reuse the results of an identical one."""
+        if query in self._results:
+            self._ready[position] = (query, self._results[query])
+            return
+        self._positions.setdefault(query, []).append(position)
+        if query in self._active:
+            return
+        if not query:
+            msg = "query is mandatory."
+            self._finish(query, DDGSException(msg))
+            return
+        try:
+            self.ddgs._check_ranking(self.ranker, self.merge)
+            cache_key, cached = self.ddgs._get_cache_key(
+                self.category,
+                query,
+                self.max_results,
+                backend=self.backend,
+                deep=False,  # as in `DDGS._search_sync`, so that batches and searches share cache entries
+                ranker=self.ranker,
+                merge=self.merge,
+                near_duplicates=self.near_duplicates,
+                **self.search_kwargs,
+            )
+            if cached is not None:
+                self._finish(query, cached)
+                return
+            engines = self.ddgs._get_engines(self.category, self.backend)
+        except DDGSException as ex:
+            self._finish(query, ex)
+            return
+        engines = [e for e in engines if self._get_engine_limit(e) > 0]  # a limit of 0 disables the engine
+        max_workers = self.ddgs._get_max_workers(engines, self.max_results)
+        self._active[query] = _BatchQuery(query, engines, max_workers, cache_key, near_duplicates=self.near_duplicates)
+
+    def _finish(self, query: str, results: list[dict[str, Any]] | DDGSException) -> None:
+        self._results[query] = results
+        for position in self._positions.pop(query, []):
+            self._ready[position] = (query, results)
+
+    def _finish_query(self, state: _BatchQuery) -> None:
+        """Rank the results of a query, or keep the error if there are none."""
+        del self._active[state.query]
+        results: list[dict[str, Any]] | DDGSException
+        try:
+            results = self.ddgs._rank_results(
+                state.results_aggregator, state.query, self.max_results, state.err, ranker=self.ranker, merge=self.merge
+            )
+        except DDGSException as ex:
+            results = ex
+        else:
+            if self.ddgs._cache is not None:
+                self.ddgs._cache.set(state.cache_key, self.category, self.max_results, results)
+        self._finish(state.query, results)
+
+    def _next_engine(self, state: _BatchQuery) -> "BaseSearchEngine[Any] | None":
+        """Get the next engine of a query that is below its concurrency limit."""
+        for engine in state.engines:
+            if (
+                engine not in state.tried
+                and engine.provider not in state.seen_providers
+                and self._engine_running[engine.name] < self._get_engine_limit(engine)
+            ):
+                return engine
+        return None
+
+    def _fill_workers(self, executor: ThreadPoolExecutor) -> None:
+        """Submit requests of the active queries, in input order, up to the concurrency limits."""
+        for state in list(self._active.values()):
+            needed = self.ddgs._get_workers_needed(state.max_workers, self.max_results, len(state.results_aggregator))
+            while len(self._futures) < self.max_workers and state.running < needed:
+                engine = self._next_engine(state)
+                if engine is None:
+                    break
+                f = executor.submit(self.ddgs._timed_search, engine, state.query, **self.search_kwargs)
+                self._futures[f] = (state, engine)
+                state.tried.add(engine)
+                state.running += 1
+                self._engine_running[engine.name] += 1
+            if not state.running and not state.has_engines_left():
+                self._finish_query(state)
+
+    def _process(self, f: Future[list[Any] | None]) -> None:
+        """Process a completed request."""
+        state, engine = self._futures.pop(f)
+        self._engine_running[engine.name] -= 1
+        if state.query not in self._active:
+            return  # the query already has enough results
+        state.running -= 1
+        try:
+            if r := f.result():
+                state.results_aggregator.extend(r, engine.name, engine.priority)
+                state.seen_providers.add(engine.provider)
+        except Exception as ex:  # noqa: BLE001
+            state.err = ex
+        if self.max_results and len(state.results_aggregator) >= self.max_results:
+            self._finish_query(state)
+
+    def _pop_ready(self, next_position: int) -> Generator[tuple[str, list[dict[str, Any]] | DDGSException], None, int]:
+        """Yield results that are ready to be delivered, return the next position to deliver (if ordered)."""
+        if not self.ordered:
+            while self._ready:
+                yield self._ready.pop(next(iter(self._ready)))
+            return next_position
+        while next_position in self._ready:
+            yield self._ready.pop(next_position)
+            next_position += 1
+        return next_position
+
+    def run(self, queries: Iterable[str]) -> Generator[tuple[str, list[dict[str, Any]] | DDGSException], None, None]:
+        """Search the queries, yield (query, results or exception) tuples."""
+        queries_iter = enumerate(queries)
+        input_exhausted = False
+        next_position = 0
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while True:
+                # Keep about as many queries active as workers, to bound memory on large batches
+                while not input_exhausted and len(self._active) < self.max_workers:
+                    item = next(queries_iter, None)
+                    if item is None:
+                        input_exhausted = True
+                    else:
+                        self._add_query(*item)
+                self._fill_workers(executor)
+                next_position = yield from self._pop_ready(next_position)
+                if not self._futures:
+                    if input_exhausted and not self._active:
+                        break
+                    continue
+                done, _ = wait(self._futures, return_when=FIRST_COMPLETED)
+                for f in done:
+                    self._process(f)
+        finally:
+            # Requests of queries with enough results are not waited for
+            executor.shutdown(wait=False, cancel_futures=True)
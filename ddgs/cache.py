@@ -0,0 +1,240 @@
+"""Search results cache."""
+
+import json
+import sqlite3
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from time import monotonic, time
+from typing import Any
+
+DEFAULT_TTL = {"text": 3600, "images": 3600, "videos": 3600, "news": 300, "books": 86400}
+
+
+def make_cache_key(
+    category: str,
+    query: str,
+    *,
+    region: str,
+    safesearch: str,
+    timelimit: str | None,
+    page: int,
+    backend: str,
+    **kwargs: Any,  # noqa: ANN401
+) -> str:
+    """Make a cache key from normalized search arguments."""
+    backends = sorted({x.strip().lower() for x in backend.split(",")})
+    key = [
+        category,
+        " ".join(query.lower().split()),
+        region.lower(),
+        safesearch.lower(),
+        timelimit,
+        page,
+        ",".join(backends),
+        sorted((k, str(v)) for k, v in kwargs.items()),
+    ]
+    return json.dumps(key, ensure_ascii=False)
+
+
+class BaseCache(ABC):
+    """Base class of search result caches, with a TTL per category and hit/miss counters.
+
+    Results cached for `max_results=n` are returned for searches with `max_results <= n`.
+    Subclasses implement the storage of entries: `_load`, `_store` and `clear`.
+
+    Args:
+        ttl: Time to live in seconds, for all categories or per category (e.g. {"news": 60}).
+            Defaults to 1 hour, 5 minutes for news, 1 day for books.
+
+    """
+
+    def __init__(self, ttl: float | Mapping[str, float] = DEFAULT_TTL) -> None:
+        self.ttl = {k: float(ttl) for k in DEFAULT_TTL} if isinstance(ttl, (int, float)) else {**DEFAULT_TTL, **ttl}
+        self.hits = 0
+        self.misses = 0
+        self._counters_lock = threading.Lock()
+
+    @abstractmethod
+    def _load(self, key: str) -> tuple[int | None, list[dict[str, Any]]] | None:
+        """Load (max_results, results) of a search, or None if missing or expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _store(self, key: str, ttl: float, max_results: int | None, results: list[dict[str, Any]]) -> None:
+        """Store results of a search for `ttl` seconds."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached results and reset the counters."""
+        raise NotImplementedError
+
+    def get(self, key: str, max_results: int | None) -> list[dict[str, Any]] | None:
+        """Get cached results of a search, or None if they are missing, expired or too few."""
+        entry = self._load(key)
+        hit = entry is not None and (entry[0] is None or (max_results is not None and max_results <= entry[0]))
+        with self._counters_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is None or not hit:
+            return None
+        results = entry[1][:max_results] if max_results else entry[1]
+        return [dict(r) for r in results]
+
+    def set(self, key: str, category: str, max_results: int | None, results: list[dict[str, Any]]) -> None:
+        """Cache results of a search."""
+        ttl = self.ttl.get(category, 0)
+        if ttl > 0:
+            self._store(key, ttl, max_results, results)
+
+    def _reset_counters(self) -> None:
+        with self._counters_lock:
+            self.hits = self.misses = 0
+
+
+class ResultCache(BaseCache):
+    """Thread-safe in-memory cache of search results, with LRU eviction and a TTL per category.
+
+    Args:
+        maxsize: The maximum number of cached searches. Defaults to 1024.
+        ttl: Time to live in seconds, for all categories or per category (e.g. {"news": 60}).
+            Defaults to 1 hour, 5 minutes for news, 1 day for books.
+
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | Mapping[str, float] = DEFAULT_TTL) -> None:
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        # key -> (expires_at, max_results, results)
+        self._data: OrderedDict[str, tuple[float, int | None, list[dict[str, Any]]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached searches, including expired ones."""
+        return len(self._data)
+
+    def _load(self, key: str) -> tuple[int | None, list[dict[str, Any]]] | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1], entry[2]
+
+    def _store(self, key: str, ttl: float, max_results: int | None, results: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._data[key] = (monotonic() + ttl, max_results, [dict(r) for r in results])
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the counters."""
+        with self._lock:
+            self._data.clear()
+        self._reset_counters()
+
+
+class SQLiteCache(BaseCache):
+    """Cache of search results in a SQLite database, shared by threads and processes.
+
+    The database uses the WAL journal mode, so processes can read while another one writes.
+    Results are stored as zlib-compressed JSON. Every `evict_interval` writes, expired results
+    are removed, then the least recently used ones while the payloads exceed `max_size` bytes (see `evict`).
+
+    Args:
+        path: The path of the database file.
+        ttl: Time to live in seconds, for all categories or per category (e.g. {"news": 60}).
+            Defaults to 1 hour, 5 minutes for news, 1 day for books.
+        max_size: The maximum size of compressed payloads in bytes. Defaults to 100 MiB.
+        evict_interval: The number of writes between evictions. Defaults to 100.
+
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: float | Mapping[str, float] = DEFAULT_TTL,
+        max_size: int = 100 * 2**20,
+        evict_interval: int = 100,
+    ) -> None:
+        super().__init__(ttl)
+        self.path = Path(path)
+        self.max_size = max_size
+        self.evict_interval = evict_interval
+        self._writes = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")  # only applies to a new database
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, expires_at REAL, accessed_at REAL, max_results INTEGER, payload BLOB)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)")
+
+    def __len__(self) -> int:
+        """Return the number of cached searches, including expired ones."""
+        with self._lock:
+            n: int = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return n
+
+    def _load(self, key: str) -> tuple[int | None, list[dict[str, Any]]] | None:
+        now = time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT max_results, payload FROM results WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        return row[0], json.loads(zlib.decompress(row[1]))
+
+    def _store(self, key: str, ttl: float, max_results: int | None, results: list[dict[str, Any]]) -> None:
+        payload = zlib.compress(json.dumps(results, ensure_ascii=False).encode())
+        now = time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", (key, now + ttl, now, max_results, payload)
+            )
+            self._writes += 1
+            evict = self._writes % self.evict_interval == 0
+        if evict:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove expired results, then the least recently used ones while the payloads exceed `max_size`."""
+        with self._lock:
+            self._conn.execute("DELETE FROM results WHERE expires_at <= ?", (time(),))
+            rows = self._conn.execute("SELECT key, LENGTH(payload) FROM results ORDER BY accessed_at DESC").fetchall()
+            size = 0
+            evicted = []
+            for key, length in rows:
+                size += length
+                if size > self.max_size:
+                    evicted.append((key,))
+            self._conn.executemany("DELETE FROM results WHERE key = ?", evicted)
+            self._conn.execute("PRAGMA incremental_vacuum")
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.execute("PRAGMA incremental_vacuum")
+        self._reset_counters()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
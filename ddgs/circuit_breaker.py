@@ -0,0 +1,101 @@
+"""Per-engine circuit breaker."""
+
+import threading
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Literal
+
+
+@dataclass
+class _Circuit:
+    state: Literal["closed", "open", "half-open"] = "closed"
+    failures: int = 0  # consecutive failures
+    trips: int = 0  # consecutive times the circuit was opened, sets the cooldown
+    opened_at: float = 0.0
+    cooldown: float = 0.0
+    probe_in_flight: bool = False
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breakers of search engines, keyed by engine (e.g. "text:google").
+
+    - closed: requests are allowed. After `failure_threshold` consecutive failures
+      (timeouts, connection errors, ...) the circuit opens, at once on rate limits.
+    - open: requests are not allowed for the cooldown, which starts at `cooldown` seconds
+      and doubles every time the circuit opens again, up to `max_cooldown`.
+    - half-open: after the cooldown, a single probe request is allowed. If it succeeds,
+      the circuit closes; if it fails, the circuit opens again.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 30, max_cooldown: float = 900) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def _get_state(self, circuit: _Circuit) -> Literal["closed", "open", "half-open"]:
+        if circuit.state == "open" and monotonic() - circuit.opened_at >= circuit.cooldown:
+            circuit.state = "half-open"
+        return circuit.state
+
+    def is_available(self, key: str) -> bool:
+        """Check if requests to an engine may be allowed, without claiming the half-open probe."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return True
+            state = self._get_state(circuit)
+            return state == "closed" or (state == "half-open" and not circuit.probe_in_flight)
+
+    def allow(self, key: str) -> bool:
+        """Check if a request to an engine is allowed. In the half-open state, this claims the probe request."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return True
+            state = self._get_state(circuit)
+            if state == "half-open" and not circuit.probe_in_flight:
+                circuit.probe_in_flight = True
+                return True
+            return state == "closed"
+
+    def record_success(self, key: str) -> None:
+        """Record a request that the engine answered. Closes the circuit."""
+        with self._lock:
+            if key in self._circuits:
+                self._circuits[key] = _Circuit()
+
+    def record_failure(self, key: str, *, trip: bool = False) -> None:
+        """Record a failed request, e.g. timed out. Opens the circuit at the threshold, or at once if `trip`."""
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            circuit.probe_in_flight = False
+            if trip or circuit.state == "half-open" or circuit.failures >= self.failure_threshold:
+                circuit.state = "open"
+                circuit.opened_at = monotonic()
+                circuit.cooldown = min(self.cooldown * 2**circuit.trips, self.max_cooldown)
+                circuit.trips += 1
+                circuit.failures = 0
+
+    def release_probe(self, key: str) -> None:
+        """Release a claimed probe request that was cancelled before it completed."""
+        with self._lock:
+            if circuit := self._circuits.get(key):
+                circuit.probe_in_flight = False
+
+    def states(self) -> dict[str, dict[str, Any]]:
+        """Get the state of every engine that has failed, e.g. for dashboards."""
+        with self._lock:
+            now = monotonic()
+            return {
+                key: {
+                    "state": self._get_state(circuit),
+                    "failures": circuit.failures,
+                    "trips": circuit.trips,
+                    "cooldown": circuit.cooldown,
+                    "retry_in": max(0.0, circuit.opened_at + circuit.cooldown - now) if circuit.trips else 0.0,
+                }
+                for key, circuit in self._circuits.items()
+            }
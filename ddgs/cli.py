@@ -14,6 +14,7 @@ import click
 import primp
 
 from . import __version__
+from .cache import SQLiteCache
 from .ddgs import DDGS
 from .utils import _expand_proxy_tb_alias
 
@@ -98,6 +99,10 @@ def _print_data(data: list[dict[str, str]], *, no_color: bool = False) -> None:
                 input()
 
 
+def _get_cache(path: str | None) -> SQLiteCache | None:
+    return SQLiteCache(path) if path else None
+
+
 def _sanitize_query(query: str) -> str:
     return (
         query.replace("filetype", "")
@@ -216,6 +221,7 @@ def version() -> str:
 @click.option("-th", "--threads", default=10, help="download threads, default=10")
 @click.option("-pr", "--proxy", help="the proxy to send requests, example: socks5h://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
+@click.option("-ca", "--cache", help="path to a SQLite cache of search results, shared across runs")
 @click.option("-nc", "--no-color", is_flag=True, default=False, help="disable color output")
 def text(
     query: str,
@@ -230,13 +236,14 @@ def text(
     download_directory: str | None,
     threads: int,
     proxy: str | None,
+    cache: str | None,
     *,
     download: bool,
     verify: bool,
     no_color: bool,
 ) -> None:
     """CLI function to perform a DDGS text metasearch."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).text(
+    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify, cache=_get_cache(cache)).text(
         query=query,
         keywords=keywords,  # deprecated
         region=region,
@@ -315,6 +322,7 @@ def text(
 @click.option("-th", "--threads", default=10, help="download threads, default=10")
 @click.option("-pr", "--proxy", help="the proxy to send requests, example: socks5h://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
+@click.option("-ca", "--cache", help="path to a SQLite cache of search results, shared across runs")
 @click.option("-nc", "--no-color", is_flag=True, default=False, help="disable color output")
 def images(
     query: str,
@@ -334,13 +342,14 @@ def images(
     threads: int,
     output: str | None,
     proxy: str | None,
+    cache: str | None,
     *,
     download: bool,
     verify: bool,
     no_color: bool,
 ) -> None:
     """CLI function to perform a DDGS images metasearch."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).images(
+    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify, cache=_get_cache(cache)).images(
         query=query,
         keywords=keywords,  # deprecated
         region=region,
@@ -394,6 +403,7 @@ def images(
 @click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
 @click.option("-pr", "--proxy", help="the proxy to send requests, example: socks5h://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
+@click.option("-ca", "--cache", help="path to a SQLite cache of search results, shared across runs")
 @click.option("-nc", "--no-color", is_flag=True, default=False, help="disable color output")
 def videos(
     query: str,
@@ -409,12 +419,13 @@ def videos(
     license_videos: str | None,
     output: str | None,
     proxy: str | None,
+    cache: str | None,
     *,
     verify: bool,
     no_color: bool,
 ) -> None:
     """CLI function to perform a DDGS videos metasearch."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).videos(
+    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify, cache=_get_cache(cache)).videos(
         query=query,
         keywords=keywords,  # deprecated
         region=region,
@@ -453,6 +464,7 @@ def videos(
 @click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
 @click.option("-pr", "--proxy", help="the proxy to send requests, example: socks5h://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
+@click.option("-ca", "--cache", help="path to a SQLite cache of search results, shared across runs")
 @click.option("-nc", "--no-color", is_flag=True, default=False, help="disable color output")
 def news(
     query: str,
@@ -465,12 +477,13 @@ def news(
     backend: str,
     output: str | None,
     proxy: str | None,
+    cache: str | None,
     *,
     verify: bool,
     no_color: bool,
 ) -> None:
     """CLI function to perform a DDGS news metasearch."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).news(
+    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify, cache=_get_cache(cache)).news(
         query=query,
         keywords=keywords,  # deprecated
         region=region,
@@ -503,6 +516,7 @@ def news(
 @click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
 @click.option("-pr", "--proxy", help="the proxy to send requests, example: socks5h://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
+@click.option("-ca", "--cache", help="path to a SQLite cache of search results, shared across runs")
 @click.option("-nc", "--no-color", is_flag=True, default=False, help="disable color output")
 def books(
     query: str,
@@ -512,12 +526,13 @@ def books(
     backend: str,
     output: str | None,
     proxy: str | None,
+    cache: str | None,
     *,
     verify: bool,
     no_color: bool,
 ) -> None:
     """CLI function to perform a DDGS books metasearch."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).books(
+    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify, cache=_get_cache(cache)).books(
         query=query,
         keywords=keywords,  # deprecated
         max_results=max_results,
@@ -1,23 +1,37 @@
 """DDGS class implementation."""
 
+import asyncio
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, wait
+from collections.abc import Awaitable, Callable, Generator, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from functools import partial
 from math import ceil
 from random import random, shuffle
+from time import monotonic
 from types import TracebackType
-from typing import Any, ClassVar
+from typing import Any, ClassVar, NoReturn
 
 from .base import BaseSearchEngine
+from .batch import DEFAULT_MAX_WORKERS_PER_ENGINE, BatchSearch
+from .cache import BaseCache, make_cache_key
+from .circuit_breaker import CircuitBreaker
 from .engines import ENGINES
-from .exceptions import DDGSException, TimeoutException
-from .http_client import HttpClient
-from .results import ResultsAggregator
-from .similarity import SimpleFilterRanker
+from .exceptions import DDGSException, RatelimitException, TimeoutException
+from .http_client import AsyncHttpClient, HttpClient
+from .rate_limiter import RateLimiter, rate_limiter
+from .results import MERGES, BaseResult, ResultsAggregator
+from .similarity import RANKERS, BM25Ranker, SimpleFilterRanker
+from .stats import EngineStats, engine_key
 from .utils import _expand_proxy_tb_alias
 
 logger = logging.getLogger(__name__)
 
+DEEP_PAGES_CONCURRENCY = 4  # pages of an engine requested at once by deep searches
+DEEP_MAX_PAGES = 20  # pages of an engine requested at most by deep searches
+RANKED_FIELDS = ("title", "body", "description", "href")  # fields of results read by the rankers
+
 
 class DDGS:
     """DDGS | Dux Distributed Global Search.
@@ -29,8 +43,22 @@ class DDGS:
         timeout: The timeout for the search. Defaults to 5.
         verify: bool (True to verify, False to skip) or str path to a PEM file. Defaults to True.
 
+        hedge_percentile: Opt-in hedged requests, e.g. 0.9. If an engine hasn't responded within this
+            percentile of its observed latencies, the next engine of another provider is started alongside it,
+            and the first one to return results is used. Defaults to None (no hedging).
+        cache: Optional cache of search results: `ResultCache` (in memory) or `SQLiteCache` (on disk,
+            shared across processes), e.g. `ResultCache(maxsize=1000, ttl={"news": 60})`. Defaults to None (no caching).
+
     Attributes:
         threads: The maximum number of threads per search. Defaults to None (automatic, based on max_results).
+        adaptive: Order engines of the same priority by their observed success rate, number of results
+            and latency (see `EngineStats.sample_score`) instead of randomly. Defaults to True.
+        engine_stats: Per-engine statistics collected at runtime, shared by all DDGS instances.
+            Use `DDGS.engine_stats.save(path)` and `DDGS.engine_stats.load(path)` to persist them.
+        circuit_breaker: Per-engine circuit breakers, shared by all DDGS instances. Engines that keep timing out
+            or are rate limited are skipped for a cooldown. Use `DDGS.circuit_breaker.states()` to inspect them.
+        rate_limiter: Process-wide rate limiter of engine requests, e.g.
+            `DDGS.rate_limiter.limit_engine("google", rate=0.5, burst=3)`. No limits by default.
 
     Raises:
         DDGSException: If an error occurs during the search.
@@ -42,6 +70,10 @@ class DDGS:
     """
 
     threads: ClassVar[int | None] = None
+    adaptive: ClassVar[bool] = True
+    engine_stats: ClassVar[EngineStats] = EngineStats()
+    circuit_breaker: ClassVar[CircuitBreaker] = CircuitBreaker()
+    rate_limiter: ClassVar[RateLimiter] = rate_limiter
 
     def __init__(
         self,
@@ -49,10 +81,17 @@ class DDGS:
         timeout: int | None = 5,
         *,
         verify: bool | str = True,
+        hedge_percentile: float | None = None,
+        cache: BaseCache | None = None,
     ) -> None:
+        if hedge_percentile is not None and not 0 < hedge_percentile < 1:
+            msg = f"hedge_percentile must be between 0 and 1, got {hedge_percentile}"
+            raise ValueError(msg)
         self._proxy = _expand_proxy_tb_alias(proxy) or os.environ.get("DDGS_PROXY")
         self._timeout = timeout
         self._verify = verify
+        self._hedge_percentile = hedge_percentile
+        self._cache = cache
         self._engines_cache: dict[
             type[BaseSearchEngine[Any]], BaseSearchEngine[Any]
         ] = {}  # dict[engine_class, engine_instance]
@@ -128,11 +167,329 @@ class DDGS:
             logger.warning("backend is not set. Using 'auto'")
             return self._get_engines(category, "auto")
 
-        # sorting by `engine.priority`
-        instances.sort(key=lambda e: (e.priority, random), reverse=True)
-        return instances
+        return self._sort_engines(self._skip_open_circuits(instances))
+
+    def _skip_open_circuits(self, engines: list[BaseSearchEngine[Any]]) -> list[BaseSearchEngine[Any]]:
+        """Skip engines whose circuit is open (see `DDGS.circuit_breaker`)."""
+        available = [e for e in engines if self.circuit_breaker.is_available(engine_key(e))]
+        if not available:
+            msg = "All engines are temporarily disabled after timeouts or rate limits. Try again later."
+            raise DDGSException(msg)
+        return available
+
+    def _sort_engines(self, engines: list[BaseSearchEngine[Any]]) -> list[BaseSearchEngine[Any]]:
+        """Sort engines by `engine.priority`, then by their sampled usefulness (if `DDGS.adaptive`)."""
+        if DDGS.adaptive:
+            scores = {e: self.engine_stats.sample_score(engine_key(e)) for e in engines}
+            engines.sort(key=lambda e: (e.priority, scores[e]), reverse=True)
+        else:
+            engines.sort(key=lambda e: (e.priority, random), reverse=True)
+        return engines
+
+    def _get_max_workers(self, engines: list[BaseSearchEngine[Any]], max_results: int | None) -> int:
+        """Get the number of engines to query concurrently."""
+        len_unique_providers = len({engine.provider for engine in engines})
+        max_workers = min(len_unique_providers, ceil(max_results / 10) + 1) if max_results else len_unique_providers
+        if DDGS.threads:
+            max_workers = min(max_workers, DDGS.threads)
+        return max_workers
+
+    @staticmethod
+    def _get_ranker(ranker: str) -> SimpleFilterRanker | BM25Ranker:
+        """Get a ranker instance by name (see `RANKERS`)."""
+        if ranker_class := RANKERS.get(ranker):
+            return ranker_class()
+        msg = f"Ranker {ranker!r} does not exist. Available: {', '.join(RANKERS)}"
+        raise DDGSException(msg)
+
+    @staticmethod
+    def _check_ranking(ranker: str, merge: str) -> None:
+        """Raise DDGSException if the ranker or the merge of results does not exist."""
+        DDGS._get_ranker(ranker)
+        if merge not in MERGES:
+            msg = f"Merge {merge!r} does not exist. Available: {', '.join(MERGES)}"
+            raise DDGSException(msg)
+
+    @staticmethod
+    def _rank_results(
+        results_aggregator: ResultsAggregator[Any],
+        query: str,
+        max_results: int | None,
+        err: Exception | None,
+        *,
+        ranker: str = "simple",
+        merge: str = "frequency",
+    ) -> list[dict[str, Any]]:
+        """Rank aggregated results, or raise the last engine error if there are none.
 
-    def _search_sync(  # noqa: C901
+        Results are ranked by `RANKED_FIELDS` and only the returned ones are materialized as dicts,
+        so in lazy mode (see `BaseResult.lazy`) their other fields are not normalized.
+        """
+        items = results_aggregator.extract_items(merge)
+        docs = [{name: getattr(item, name) for name in RANKED_FIELDS if name in item._field_names} for item in items]
+        ranked = DDGS._get_ranker(ranker).rank(docs, query)
+
+        if not ranked:
+            DDGS._raise_no_results(err)
+        doc_items = {id(doc): item for doc, item in zip(docs, items, strict=True)}
+        return [doc_items[id(doc)].to_dict() for doc in (ranked[:max_results] if max_results else ranked)]
+
+    @staticmethod
+    def _raise_no_results(err: Exception | None) -> NoReturn:
+        """Raise the last engine error, or DDGSException if there was none."""
+        if "timed out" in f"{err}":
+            raise TimeoutException(err)
+        raise DDGSException(err or "No results found.")
+
+    @staticmethod
+    def _get_workers_needed(max_workers: int, max_results: int | None, n_results: int) -> int:
+        """Get the number of engines that must be running to collect the remaining results (~10 per engine)."""
+        return min(max_workers, ceil((max_results - n_results) / 10)) if max_results else max_workers
+
+    def _get_cache_key(
+        self,
+        category: str,
+        query: str,
+        max_results: int | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> tuple[str, list[dict[str, Any]] | None]:
+        """Get the cache key of a search and its cached results, if `cache` is set."""
+        if self._cache is None:
+            return "", None
+        key = make_cache_key(category, query, **kwargs)
+        return key, self._cache.get(key, max_results)
+
+    @staticmethod
+    def _record_error(engine: BaseSearchEngine[Any], ex: Exception) -> None:
+        """Record a failed request in `DDGS.engine_stats` and `DDGS.circuit_breaker`."""
+        key = engine_key(engine)
+        DDGS.engine_stats.record(key, None, 0)
+        DDGS.circuit_breaker.record_failure(key, trip=isinstance(ex, RatelimitException))
+
+    @staticmethod
+    def _record_results(engine: BaseSearchEngine[Any], latency: float, results: list[Any] | None) -> None:
+        """Record a completed request in `DDGS.engine_stats` and `DDGS.circuit_breaker`."""
+        key = engine_key(engine)
+        DDGS.engine_stats.record(key, latency, len(results or ()))
+        DDGS.circuit_breaker.record_success(key)
+
+    def _timed_search(self, engine: BaseSearchEngine[Any], query: str, **kwargs: Any) -> list[Any] | None:  # noqa: ANN401
+        """Run `engine.search` if its circuit and its rate limiter allow it, and record the outcome.
+
+        Requests skipped by the rate limiter are not recorded, and the wait for a token is not latency.
+        """
+        key = engine_key(engine)
+        if not self.circuit_breaker.allow(key):
+            return None  # the circuit opened, or another search is probing the engine
+        if not self.rate_limiter.acquire(engine):
+            self.circuit_breaker.release_probe(key)
+            logger.info("%s: request skipped, over the rate limit", engine.name)
+            return None
+        start = monotonic()
+        try:
+            results = engine.search(query, **kwargs)
+        except Exception as ex:
+            self._record_error(engine, ex)
+            raise
+        self._record_results(engine, monotonic() - start, results)
+        return results
+
+    def _deep_search(
+        self,
+        engine: BaseSearchEngine[Any],
+        query: str,
+        *,
+        max_results: int | None,
+        page: int = 1,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[Any] | None:
+        """Fetch consecutive pages of an engine concurrently, starting at `page`.
+
+        Pages are requested in waves of up to `DEEP_PAGES_CONCURRENCY`, sized by the results per page
+        still needed for `max_results`, up to `DEEP_MAX_PAGES`. Results are deduplicated across pages.
+        Fetching stops at the first empty or failed page, or page with only duplicates (e.g. past the last page).
+        """
+        results_aggregator: ResultsAggregator[BaseResult] = ResultsAggregator({"href", "image", "url", "embed_url"})
+        results: list[Any] = []
+        per_page = 10
+        next_page, last_page = page, page + DEEP_MAX_PAGES - 1
+        executor = ThreadPoolExecutor(max_workers=DEEP_PAGES_CONCURRENCY, thread_name_prefix="DDGS-pages")
+        try:
+            while next_page <= last_page and not (max_results and len(results) >= max_results):
+                needed = ceil((max_results - len(results)) / per_page) if max_results else DEEP_PAGES_CONCURRENCY
+                pages = range(next_page, min(next_page + min(needed, DEEP_PAGES_CONCURRENCY), last_page + 1))
+                futures = [executor.submit(self._timed_search, engine, query, page=p, **kwargs) for p in pages]
+                next_page = pages.stop
+                for f in futures:
+                    try:
+                        r = f.result()
+                    except Exception:
+                        if not results:
+                            raise
+                        r = None
+                    new_items = results_aggregator.extend(r) if r else []
+                    if not new_items:
+                        return results
+                    if not results:
+                        per_page = len(new_items)
+                    results.extend(new_items)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def _get_hedge_delays(self, running: dict[Future[Any], tuple[BaseSearchEngine[Any], float]]) -> dict[Any, float]:
+        """Get the seconds left until each running engine exceeds its `hedge_percentile` latency."""
+        if not self._hedge_percentile:
+            return {}
+        now = monotonic()
+        delays = {}
+        for f, (engine, started) in running.items():
+            latency = self.engine_stats.latency_percentile(engine_key(engine), self._hedge_percentile)
+            if latency is not None:
+                delays[f] = started + latency - now
+        return delays
+
+    def _iter_engines(  # noqa: C901
+        self,
+        engines: list[BaseSearchEngine[Any]],
+        max_workers: int,
+        workers_needed: Callable[[], int],
+        query: str,
+        *,
+        deep: bool = False,
+        **search_kwargs: Any,  # noqa: ANN401
+    ) -> Generator[tuple[BaseSearchEngine[Any], list[Any] | Exception], None, None]:
+        """Run engines in a thread pool and yield `(engine, results or exception)` as each one completes.
+
+        `max_workers` engines are submitted at first. Whenever an engine completes, more engines are
+        submitted right away until `workers_needed()` are running, without waiting for the others.
+        Engines whose provider has already returned results are skipped. Closing the generator
+        returns immediately, abandoning engines that are still running.
+
+        With `hedge_percentile` set, an engine that runs longer than that percentile of its observed
+        latencies is hedged: the next engine of another provider is started alongside it, and whichever
+        of the two returns results first is used, the other one is abandoned.
+
+        With `deep`, each engine fetches several pages (see `_deep_search`).
+        """
+        search: Callable[..., list[Any] | None] = self._deep_search if deep else self._timed_search
+        pending = list(engines)
+        seen_providers: set[str] = set()
+        futures: dict[Future[list[Any] | None], tuple[BaseSearchEngine[Any], float]] = {}  # future: (engine, start)
+        hedged: set[Future[list[Any] | None]] = set()  # futures already considered for hedging
+        partners: dict[Future[list[Any] | None], Future[list[Any] | None]] = {}  # hedged <-> hedge, both ways
+
+        def submit_next_engine(exclude_provider: str | None = None) -> Future[list[Any] | None] | None:
+            for i, engine in enumerate(pending):
+                if engine.provider in seen_providers or engine.provider == exclude_provider:
+                    continue
+                del pending[i]
+                f = executor.submit(search, engine, query, **search_kwargs)
+                futures[f] = (engine, monotonic())
+                return f
+            return None
+
+        def fill_workers(n: int) -> None:
+            while len(futures) - len(partners) // 2 < n and submit_next_engine():
+                pass
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers * 2 if self._hedge_percentile else max_workers,
+            thread_name_prefix="DDGS",
+        )
+        try:
+            fill_workers(max_workers)
+            while futures:
+                delays = {f: d for f, d in self._get_hedge_delays(futures).items() if f not in hedged}
+                timeout = max(0, min(delays.values())) if delays else None
+                done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    for f, delay in delays.items():
+                        if delay <= 0:
+                            hedged.add(f)
+                            if hedge := submit_next_engine(exclude_provider=futures[f][0].provider):
+                                hedged.add(hedge)
+                                partners[f], partners[hedge] = hedge, f
+                                logger.debug("Hedging engine %s with %s", futures[f][0].name, futures[hedge][0].name)
+                    continue
+                for f in done:
+                    engine, _ = futures.pop(f)
+                    partner = partners.pop(f, None)
+                    if partner is not None:
+                        partners.pop(partner, None)
+                    try:
+                        if r := f.result():
+                            seen_providers.add(engine.provider)
+                            if partner is not None and partner in futures:
+                                del futures[partner]  # abandon the slower one of a hedged pair
+                                partner.cancel()
+                            yield engine, r
+                    except Exception as ex:  # noqa: BLE001
+                        logger.info("Error in engine %s: %r", engine.name, ex)
+                        yield engine, ex
+                fill_workers(workers_needed())
+        finally:
+            # Don't wait for engines still running when the caller stops early (e.g. max_results is reached):
+            # their requests complete in the background within the timeout and release their connections
+            # back to the engine's HTTP client pool; their results are discarded.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search_iter(
+        self,
+        category: str,
+        query: str,
+        keywords: str | None = None,
+        *,
+        max_results: int | None = 10,
+        backend: str = "auto",
+        deep: bool = False,
+        ranker: str = "simple",
+        merge: str = "frequency",
+        near_duplicates: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[dict[str, Any]]:
+        """Yield search results as each engine completes.
+
+        Each engine's results are deduplicated against everything yielded so far and ranked
+        within their batch. Arguments are the same as for `_search_sync`.
+        """
+        query = keywords or query
+        if not query:
+            msg = "query is mandatory."
+            raise DDGSException(msg)
+
+        self._check_ranking(ranker, merge)  # batches come from one engine, in its order: `merge` has no effect
+        results_ranker = self._get_ranker(ranker)
+        engines = self._get_engines(category, backend)
+        results_aggregator: ResultsAggregator[BaseResult] = ResultsAggregator(
+            {"href", "image", "url", "embed_url"}, near_duplicates=near_duplicates
+        )
+        count, err = 0, None
+        max_workers = self._get_max_workers(engines, max_results)
+        engines_results = self._iter_engines(
+            engines,
+            max_workers,
+            lambda: self._get_workers_needed(max_workers, max_results, count),
+            query,
+            deep=deep,
+            **({"max_results": max_results} if deep else {}),
+            **kwargs,
+        )
+        with closing(engines_results):
+            for engine, r in engines_results:
+                if isinstance(r, Exception):
+                    err = r
+                    continue
+                new_items = results_aggregator.extend(r, engine.name, engine.priority)
+                for result in results_ranker.rank([item.to_dict() for item in new_items], query):
+                    yield result
+                    count += 1
+                    if max_results and count >= max_results:
+                        return
+        if not count:
+            self._raise_no_results(err)
+
+    def _search_sync(
         self,
         category: str,
         query: str,
@@ -144,6 +501,10 @@ class DDGS:
         max_results: int | None = 10,
         page: int = 1,
         backend: str = "auto",
+        deep: bool = False,
+        ranker: str = "simple",
+        merge: str = "frequency",
+        near_duplicates: bool = False,
         **kwargs: str,
     ) -> list[dict[str, Any]]:
         """Perform a search across engines in the given category.
@@ -158,6 +519,15 @@ class DDGS:
             max_results: The maximum number of results to return. Defaults to 10.
             page: The page of results to return. Defaults to 1.
             backend: A single or comma-delimited backends. Defaults to "auto".
+            deep: Fetch several pages of each engine concurrently, starting at `page`, to collect
+                large `max_results` (e.g. 200) from fewer engines. Defaults to False.
+            ranker: The ranker of the results: "simple" (`SimpleFilterRanker`) or "bm25" (`BM25Ranker`).
+                Defaults to "simple".
+            merge: The order of the results before ranking: "frequency" (number of engines returning them)
+                or "rrf" (reciprocal rank fusion of their rank in each engine, weighted by engine priority).
+                Defaults to "frequency".
+            near_duplicates: Collapse results whose title and body are near-duplicates of a previous result
+                (mirrors, AMP pages, syndicated copies) into it. Defaults to False.
             **kwargs: Additional keyword arguments to pass to the search engines.
 
         Returns:
@@ -169,58 +539,57 @@ class DDGS:
             msg = "query is mandatory."
             raise DDGSException(msg)
 
+        search_args = {"region": region, "safesearch": safesearch, "timelimit": timelimit, "page": page}
+        self._check_ranking(ranker, merge)  # fail before searching if the ranker or merge does not exist
+        cache_key, cached = self._get_cache_key(
+            category,
+            query,
+            max_results,
+            backend=backend,
+            deep=deep,
+            ranker=ranker,
+            merge=merge,
+            near_duplicates=near_duplicates,
+            **search_args,
+            **kwargs,
+        )
+        if cached is not None:
+            return cached
+
         engines = self._get_engines(category, backend)
-        len_unique_providers = len({engine.provider for engine in engines})
-        seen_providers: set[str] = set()
 
         # Perform search
-        results_aggregator: ResultsAggregator[set[str]] = ResultsAggregator({"href", "image", "url", "embed_url"})
-        max_workers = min(len_unique_providers, ceil(max_results / 10) + 1) if max_results else len_unique_providers
-        if DDGS.threads:
-            max_workers = min(max_workers, DDGS.threads)
-        futures, err = {}, None
-        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="DDGS") as executor:
-            for i, engine in enumerate(engines, start=1):
-                if engine.provider in seen_providers:
+        results_aggregator: ResultsAggregator[BaseResult] = ResultsAggregator(
+            {"href", "image", "url", "embed_url"}, near_duplicates=near_duplicates
+        )
+        max_workers = self._get_max_workers(engines, max_results)
+        err = None
+        engines_results = self._iter_engines(
+            engines,
+            max_workers,
+            lambda: self._get_workers_needed(max_workers, max_results, len(results_aggregator)),
+            query,
+            deep=deep,
+            **({"max_results": max_results} if deep else {}),
+            region=region,
+            safesearch=safesearch,
+            timelimit=timelimit,
+            page=page,
+            **kwargs,
+        )
+        with closing(engines_results):
+            for engine, r in engines_results:
+                if isinstance(r, Exception):
+                    err = r
                     continue
-                future = executor.submit(
-                    engine.search,
-                    query,
-                    region=region,
-                    safesearch=safesearch,
-                    timelimit=timelimit,
-                    page=page,
-                    **kwargs,
-                )
-                futures[future] = engine
-
-                if len(futures) >= max_workers or i >= max_workers:
-                    done, not_done = wait(futures, timeout=self._timeout, return_when="FIRST_EXCEPTION")
-                    for f, f_engine in futures.items():
-                        if f in done:
-                            try:
-                                if r := f.result():
-                                    results_aggregator.extend(r)
-                                    seen_providers.add(f_engine.provider)
-                            except Exception as ex:  # noqa: BLE001
-                                err = ex
-                                logger.info("Error in engine %s: %r", f_engine.name, ex)
-                    futures = {f: futures[f] for f in not_done}
-
+                results_aggregator.extend(r, engine.name, engine.priority)
                 if max_results and len(results_aggregator) >= max_results:
                     break
 
-        results = results_aggregator.extract_dicts()
-        # Rank results
-        ranker = SimpleFilterRanker()
-        results = ranker.rank(results, query)
-
-        if results:
-            return results[:max_results] if max_results else results
-
-        if "timed out" in f"{err}":
-            raise TimeoutException(err)
-        raise DDGSException(err or "No results found.")
+        results = self._rank_results(results_aggregator, query, max_results, err, ranker=ranker, merge=merge)
+        if self._cache is not None:
+            self._cache.set(cache_key, category, max_results, results)
+        return results
 
     def text(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:  # noqa: ANN401
         """Perform a text search."""
@@ -242,6 +611,90 @@ class DDGS:
         """Perform a book search."""
         return self._search_sync("books", query, **kwargs)
 
+    def text_iter(self, query: str, **kwargs: Any) -> Iterator[dict[str, Any]]:  # noqa: ANN401
+        """Perform a text search, yielding results as each engine completes."""
+        return self._search_iter("text", query, **kwargs)
+
+    def images_iter(self, query: str, **kwargs: Any) -> Iterator[dict[str, Any]]:  # noqa: ANN401
+        """Perform an image search, yielding results as each engine completes."""
+        return self._search_iter("images", query, **kwargs)
+
+    def news_iter(self, query: str, **kwargs: Any) -> Iterator[dict[str, Any]]:  # noqa: ANN401
+        """Perform a news search, yielding results as each engine completes."""
+        return self._search_iter("news", query, **kwargs)
+
+    def videos_iter(self, query: str, **kwargs: Any) -> Iterator[dict[str, Any]]:  # noqa: ANN401
+        """Perform a video search, yielding results as each engine completes."""
+        return self._search_iter("videos", query, **kwargs)
+
+    def books_iter(self, query: str, **kwargs: Any) -> Iterator[dict[str, Any]]:  # noqa: ANN401
+        """Perform a book search, yielding results as each engine completes."""
+        return self._search_iter("books", query, **kwargs)
+
+    def batch(
+        self,
+        queries: Iterable[str],
+        category: str = "text",
+        *,
+        ordered: bool = True,
+        max_workers: int = 10,
+        max_workers_per_engine: int | Mapping[str, int] = DEFAULT_MAX_WORKERS_PER_ENGINE,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        max_results: int | None = 10,
+        page: int = 1,
+        backend: str = "auto",
+        ranker: str = "simple",
+        merge: str = "frequency",
+        near_duplicates: bool = False,
+        **kwargs: str,
+    ) -> Iterator[tuple[str, list[dict[str, Any]] | DDGSException]]:
+        """Search many queries through one shared worker pool.
+
+        Args:
+            queries: The search queries. Identical queries are searched once.
+            category: The category of search engines (e.g., 'text', 'images', etc.). Defaults to "text".
+            ordered: Yield results in the order of `queries` (True) or as soon as they are ready (False).
+                Defaults to True.
+            max_workers: The maximum number of requests in flight. Defaults to 10.
+            max_workers_per_engine: The maximum number of requests in flight per engine,
+                for all engines or per engine name (e.g. {"google": 1}); 0 disables an engine. Defaults to 2.
+            region: The region to use for the search (e.g., us-en, uk-en, ru-ru, etc.).
+            safesearch: The safesearch setting (e.g., on, moderate, off).
+            timelimit: The timelimit for the search (e.g., d, w, m, y) or custom date range.
+            max_results: The maximum number of results per query. Defaults to 10.
+            page: The page of results to return. Defaults to 1.
+            backend: A single or comma-delimited backends. Defaults to "auto".
+            ranker: The ranker of the results: "simple" or "bm25". Defaults to "simple".
+            merge: The order of the results before ranking: "frequency" or "rrf". Defaults to "frequency".
+            near_duplicates: Collapse near-duplicate results (see `_search_sync`). Defaults to False.
+            **kwargs: Additional keyword arguments to pass to the search engines.
+
+        Returns:
+            An iterator of (query, results) tuples, where results is the list of results of the query,
+            or the DDGSException raised if it has none.
+
+        """
+        batch_search = BatchSearch(
+            self,
+            category,
+            ordered=ordered,
+            max_workers=max_workers,
+            max_workers_per_engine=max_workers_per_engine,
+            max_results=max_results,
+            backend=backend,
+            ranker=ranker,
+            merge=merge,
+            near_duplicates=near_duplicates,
+            region=region,
+            safesearch=safesearch,
+            timelimit=timelimit,
+            page=page,
+            **kwargs,
+        )
+        return batch_search.run(queries)
+
     def extract(self, url: str, fmt: str = "text_markdown") -> dict[str, str | bytes]:
         """Fetch a URL and extract its content.
 
@@ -267,3 +720,261 @@ class DDGS:
             "content": resp.content,
         }
         return {"url": url, "content": content_map.get(fmt, resp.text_markdown)}
+
+
+class AsyncDDGS:
+    """DDGS | Dux Distributed Global Search, asyncio version.
+
+    Engines are queried concurrently as coroutines on the running event loop instead of worker threads.
+
+    Args:
+        proxy: The proxy to use for the search. Defaults to None.
+        timeout: The timeout for the search. Defaults to 5.
+        verify: bool (True to verify, False to skip) or str path to a PEM file. Defaults to True.
+        cache: Optional cache of search results, see `DDGS`. Defaults to None (no caching).
+
+    Raises:
+        DDGSException: If an error occurs during the search.
+
+    Example:
+        >>> from ddgs import AsyncDDGS
+        >>> results = await AsyncDDGS().text("python")
+
+    """
+
+    def __init__(
+        self,
+        proxy: str | None = None,
+        timeout: int | None = 5,
+        *,
+        verify: bool | str = True,
+        cache: BaseCache | None = None,
+    ) -> None:
+        self._ddgs = DDGS(proxy=proxy, timeout=timeout, verify=verify, cache=cache)
+
+    async def __aenter__(self) -> "AsyncDDGS":  # noqa: PYI034
+        """Enter the async context manager and return the AsyncDDGS instance."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """Exit the async context manager."""
+
+    async def _get_cache_key(
+        self,
+        category: str,
+        query: str,
+        max_results: int | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> tuple[str, list[dict[str, Any]] | None]:
+        """Run `DDGS._get_cache_key` in a worker thread: cache I/O (e.g. SQLiteCache) would block the event loop."""
+        if self._ddgs._cache is None:
+            return "", None
+        return await asyncio.to_thread(self._ddgs._get_cache_key, category, query, max_results, **kwargs)
+
+    async def _timed_asearch(self, engine: BaseSearchEngine[Any], query: str, **kwargs: Any) -> list[Any] | None:  # noqa: ANN401
+        """Run `engine.asearch` if its circuit and its rate limiter allow it, see `DDGS._timed_search`."""
+        key = engine_key(engine)
+        if not DDGS.circuit_breaker.allow(key):
+            return None  # the circuit opened, or another search is probing the engine
+        try:
+            if not await DDGS.rate_limiter.aacquire(engine):
+                DDGS.circuit_breaker.release_probe(key)
+                logger.info("%s: request skipped, over the rate limit", engine.name)
+                return None
+            start = monotonic()
+            results = await engine.asearch(query, **kwargs)
+        except asyncio.CancelledError:
+            DDGS.circuit_breaker.release_probe(key)
+            raise
+        except Exception as ex:
+            DDGS._record_error(engine, ex)
+            raise
+        DDGS._record_results(engine, monotonic() - start, results)
+        return results
+
+    async def _deep_asearch(
+        self,
+        engine: BaseSearchEngine[Any],
+        query: str,
+        *,
+        max_results: int | None,
+        page: int = 1,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[Any] | None:
+        """Fetch consecutive pages of an engine concurrently, see `DDGS._deep_search`."""
+        results_aggregator: ResultsAggregator[BaseResult] = ResultsAggregator({"href", "image", "url", "embed_url"})
+        results: list[Any] = []
+        per_page = 10
+        next_page, last_page = page, page + DEEP_MAX_PAGES - 1
+        while next_page <= last_page and not (max_results and len(results) >= max_results):
+            needed = ceil((max_results - len(results)) / per_page) if max_results else DEEP_PAGES_CONCURRENCY
+            pages = range(next_page, min(next_page + min(needed, DEEP_PAGES_CONCURRENCY), last_page + 1))
+            pages_results = await asyncio.gather(
+                *(self._timed_asearch(engine, query, page=p, **kwargs) for p in pages), return_exceptions=True
+            )
+            next_page = pages.stop
+            for r in pages_results:
+                if isinstance(r, BaseException):
+                    if not results:
+                        raise r
+                    r = None  # noqa: PLW2901
+                new_items = results_aggregator.extend(r) if r else []
+                if not new_items:
+                    return results
+                if not results:
+                    per_page = len(new_items)
+                results.extend(new_items)
+        return results
+
+    async def _search_async(  # noqa: C901
+        self,
+        category: str,
+        query: str,
+        keywords: str | None = None,
+        *,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        max_results: int | None = 10,
+        page: int = 1,
+        backend: str = "auto",
+        deep: bool = False,
+        ranker: str = "simple",
+        merge: str = "frequency",
+        near_duplicates: bool = False,
+        **kwargs: str,
+    ) -> list[dict[str, Any]]:
+        """Perform a search across engines in the given category.
+
+        Same arguments and semantics as `DDGS._search_sync`. A new engine is started
+        as soon as a running one finishes; pending engines are cancelled once
+        `max_results` is reached.
+        """
+        query = keywords or query
+        if not query:
+            msg = "query is mandatory."
+            raise DDGSException(msg)
+
+        search_args = {"region": region, "safesearch": safesearch, "timelimit": timelimit, "page": page}
+        self._ddgs._check_ranking(ranker, merge)  # fail before searching if the ranker or merge does not exist
+        cache_key, cached = await self._get_cache_key(
+            category,
+            query,
+            max_results,
+            backend=backend,
+            deep=deep,
+            ranker=ranker,
+            merge=merge,
+            near_duplicates=near_duplicates,
+            **search_args,
+            **kwargs,
+        )
+        if cached is not None:
+            return cached
+
+        engines = self._ddgs._get_engines(category, backend)
+        seen_providers: set[str] = set()
+
+        # Perform search
+        results_aggregator: ResultsAggregator[BaseResult] = ResultsAggregator(
+            {"href", "image", "url", "embed_url"}, near_duplicates=near_duplicates
+        )
+        max_workers = self._ddgs._get_max_workers(engines, max_results)
+        engines_iter = iter(engines)
+        tasks: dict[asyncio.Task[list[Any] | None], BaseSearchEngine[Any]] = {}
+        err: Exception | None = None
+        search: Callable[..., Awaitable[list[Any] | None]] = (
+            partial(self._deep_asearch, max_results=max_results) if deep else self._timed_asearch
+        )
+
+        def start_next_engine() -> bool:
+            for engine in engines_iter:
+                if engine.provider in seen_providers:
+                    continue
+                coro = search(
+                    engine, query, region=region, safesearch=safesearch, timelimit=timelimit, page=page, **kwargs
+                )
+                tasks[asyncio.ensure_future(coro)] = engine
+                return True
+            return False
+
+        try:
+            while len(tasks) < max_workers and start_next_engine():
+                pass
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    engine = tasks.pop(task)
+                    try:
+                        if r := task.result():
+                            results_aggregator.extend(r, engine.name, engine.priority)
+                            seen_providers.add(engine.provider)
+                    except Exception as ex:  # noqa: BLE001
+                        err = ex
+                        logger.info("Error in engine %s: %r", engine.name, ex)
+
+                if max_results and len(results_aggregator) >= max_results:
+                    break
+                needed = self._ddgs._get_workers_needed(max_workers, max_results, len(results_aggregator))
+                while len(tasks) < needed and start_next_engine():
+                    pass
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        results = self._ddgs._rank_results(results_aggregator, query, max_results, err, ranker=ranker, merge=merge)
+        if self._ddgs._cache is not None:
+            await asyncio.to_thread(self._ddgs._cache.set, cache_key, category, max_results, results)
+        return results
+
+    async def text(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+        """Perform a text search."""
+        return await self._search_async("text", query, **kwargs)
+
+    async def images(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+        """Perform an image search."""
+        return await self._search_async("images", query, **kwargs)
+
+    async def news(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+        """Perform a news search."""
+        return await self._search_async("news", query, **kwargs)
+
+    async def videos(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+        """Perform a video search."""
+        return await self._search_async("videos", query, **kwargs)
+
+    async def books(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+        """Perform a book search."""
+        return await self._search_async("books", query, **kwargs)
+
+    async def extract(self, url: str, fmt: str = "text_markdown") -> dict[str, str | bytes]:
+        """Fetch a URL and extract its content.
+
+        Args:
+            url: The URL to fetch and extract content from.
+            fmt: Output format: "text_markdown", "text_plain", "text_rich", "text" (raw HTML), "content" (raw bytes).
+
+        Returns:
+            A dictionary with 'url' and 'content' keys.
+
+        """
+        ddgs = self._ddgs
+        client = AsyncHttpClient(proxy=ddgs._proxy, timeout=ddgs._timeout, verify=ddgs._verify)
+        resp = await client.get(url)
+        if resp.status_code != 200:
+            msg = f"Failed to fetch {url}: HTTP {resp.status_code}"
+            raise DDGSException(msg)
+
+        content_map: dict[str, str | bytes] = {
+            "text_markdown": resp.text_markdown,
+            "text_plain": resp.text_plain,
+            "text_rich": resp.text_rich,
+            "text": resp.text,
+            "content": resp.content,
+        }
+        return {"url": url, "content": content_map.get(fmt, resp.text_markdown)}
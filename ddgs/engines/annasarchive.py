@@ -42,8 +42,10 @@ class AnnasArchive(BaseSearchEngine[BooksResult]):
         """Build a payload for the search request."""
         return {"q": query, "page": f"{page}"}
 
-    def pre_process_html(self, html_text: str) -> str:
+    def pre_process_html(self, html_text: str | bytes) -> str | bytes:
         """Pre-process the HTML text before parsing it."""
+        if isinstance(html_text, bytes):
+            return html_text.replace(b"<!--", b"").replace(b"-->", b"")
         return html_text.replace("<!--", "").replace("-->", "")
 
     def post_extract_results(self, results: list[BooksResult]) -> list[BooksResult]:
@@ -3,9 +3,13 @@
 import json
 from typing import Any
 
-from ddgs.base import BaseSearchEngine
+from ddgs.base import BaseSearchEngine, compile_xpath
 from ddgs.results import ImagesResult
 
+METADATA_XPATH = ".//a[@class='iusc']/@m"
+DIMENSION_XPATH = ".//div[contains(@class, 'img_info')][./span]/span[@class='nowrap']/text()"
+SOURCE_XPATH = ".//div[@class='lnkw']//a/text()"
+
 
 class BingImages(BaseSearchEngine[ImagesResult]):
     """Bing images search engine."""
@@ -42,25 +46,28 @@ class BingImages(BaseSearchEngine[ImagesResult]):
             )
         return payload
 
-    def extract_results(self, html_text: str) -> list[ImagesResult]:
+    def extract_results(self, html_text: str | bytes) -> list[ImagesResult]:
         """Extract search results from html text."""
         html_text = self.pre_process_html(html_text)
         tree = self.extract_tree(html_text)
-        items = tree.xpath(self.items_xpath)
+        items = compile_xpath(self.items_xpath)(tree)
+        metadata_xpath = compile_xpath(METADATA_XPATH)
+        dimension_xpath = compile_xpath(DIMENSION_XPATH)
+        source_xpath = compile_xpath(SOURCE_XPATH)
         results = []
         for item in items:
             result = ImagesResult()
-            if metadata := item.xpath(".//a[@class='iusc']/@m"):
+            if metadata := metadata_xpath(item):
                 m = json.loads(metadata[0])
                 result.title = m.get("t")
                 result.image = m.get("murl")
                 result.thumbnail = m.get("turl")
                 result.url = m.get("purl")
-                if dimension := item.xpath(".//div[contains(@class, 'img_info')][./span]/span[@class='nowrap']/text()"):
+                if dimension := dimension_xpath(item):
                     width, height = dimension[0].replace("×", "x").split("x")  # noqa: RUF001
                     result.width = width.strip()
                     result.height = height.split()[0].strip()
-                if source := item.xpath(".//div[@class='lnkw']//a/text()"):
+                if source := source_xpath(item):
                     result.source = source[0]
                 results.append(result)
         return results
@@ -1,5 +1,6 @@
 """Duckduckgo search engine implementation."""
 
+import asyncio
 from collections.abc import Mapping
 from typing import Any, ClassVar, TypeVar
 
@@ -54,3 +55,17 @@ class Duckduckgo(BaseSearchEngine[TextResult]):
     def post_extract_results(self, results: list[TextResult]) -> list[TextResult]:
         """Post-process search results."""
         return [r for r in results if not r.href.startswith("https://duckduckgo.com/y.js?")]
+
+    async def asearch(
+        self,
+        query: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        page: int = 1,
+        **kwargs: str,
+    ) -> list[TextResult] | None:
+        """Search the engine in a worker thread. Temporary, HttpClient2 has no async variant."""
+        return await asyncio.to_thread(
+            self.search, query, region=region, safesearch=safesearch, timelimit=timelimit, page=page, **kwargs
+        )
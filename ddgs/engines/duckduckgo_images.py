@@ -4,12 +4,11 @@ import json
 from collections.abc import Mapping
 from typing import Any, ClassVar
 
-from ddgs.base import BaseSearchEngine
+from ddgs.engines.duckduckgo_vqd import BaseDuckduckgoVqd
 from ddgs.results import ImagesResult
-from ddgs.utils import _extract_vqd
 
 
-class DuckduckgoImages(BaseSearchEngine[ImagesResult]):
+class DuckduckgoImages(BaseDuckduckgoVqd[ImagesResult]):
     """Duckduckgo images search engine."""
 
     name = "duckduckgo"
@@ -39,11 +38,6 @@ class DuckduckgoImages(BaseSearchEngine[ImagesResult]):
         "source": "source",
     }
 
-    def _get_vqd(self, query: str) -> str:
-        """Get vqd value for a search query using DuckDuckGo."""
-        resp_content = self.http_client.request("GET", "https://duckduckgo.com", params={"q": query}).content
-        return _extract_vqd(resp_content, query)
-
     def build_payload(
         self,
         query: str,
@@ -71,7 +65,7 @@ class DuckduckgoImages(BaseSearchEngine[ImagesResult]):
             "o": "json",
             "q": query,
             "l": region,
-            "vqd": self._get_vqd(query),
+            "vqd": kwargs.get("vqd") or self._get_vqd(query),
             "p": safesearch_base[safesearch.lower()],
             "ct": "AT",
         }
@@ -81,7 +75,7 @@ class DuckduckgoImages(BaseSearchEngine[ImagesResult]):
             payload["s"] = f"{(page - 1) * 100}"
         return payload
 
-    def extract_results(self, html_text: str) -> list[ImagesResult]:
+    def extract_results(self, html_text: str | bytes) -> list[ImagesResult]:
         """Extract search results from html text."""
         json_data = json.loads(html_text)
         items = json_data.get("results", [])
@@ -4,12 +4,11 @@ import json
 from collections.abc import Mapping
 from typing import Any, ClassVar
 
-from ddgs.base import BaseSearchEngine
+from ddgs.engines.duckduckgo_vqd import BaseDuckduckgoVqd
 from ddgs.results import NewsResult
-from ddgs.utils import _extract_vqd
 
 
-class DuckduckgoNews(BaseSearchEngine[NewsResult]):
+class DuckduckgoNews(BaseDuckduckgoVqd[NewsResult]):
     """Duckduckgo news search engine."""
 
     name = "duckduckgo"
@@ -28,11 +27,6 @@ class DuckduckgoNews(BaseSearchEngine[NewsResult]):
         "source": "source",
     }
 
-    def _get_vqd(self, query: str) -> str:
-        """Get vqd value for a search query using DuckDuckGo."""
-        resp_content = self.http_client.request("GET", "https://duckduckgo.com", params={"q": query}).content
-        return _extract_vqd(resp_content, query)
-
     def build_payload(
         self,
         query: str,
@@ -40,7 +34,7 @@ class DuckduckgoNews(BaseSearchEngine[NewsResult]):
         safesearch: str,
         timelimit: str | None,
         page: int = 1,
-        **kwargs: str,  # noqa: ARG002
+        **kwargs: str,
     ) -> dict[str, Any]:
         """Build a payload for the search request."""
         safesearch_base = {"on": "1", "moderate": "-1", "off": "-2"}
@@ -49,7 +43,7 @@ class DuckduckgoNews(BaseSearchEngine[NewsResult]):
             "o": "json",
             "noamp": "1",
             "q": query,
-            "vqd": self._get_vqd(query),
+            "vqd": kwargs.get("vqd") or self._get_vqd(query),
             "p": safesearch_base[safesearch.lower()],
         }
         if timelimit:
@@ -58,7 +52,7 @@ class DuckduckgoNews(BaseSearchEngine[NewsResult]):
             payload["s"] = f"{(page - 1) * 30}"
         return payload
 
-    def extract_results(self, html_text: str) -> list[NewsResult]:
+    def extract_results(self, html_text: str | bytes) -> list[NewsResult]:
         """Extract search results from lxml tree."""
         json_data = json.loads(html_text)
         items = json_data.get("results", [])
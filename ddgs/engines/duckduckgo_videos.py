@@ -4,12 +4,11 @@ import json
 from collections.abc import Mapping
 from typing import Any, ClassVar
 
-from ddgs.base import BaseSearchEngine
+from ddgs.engines.duckduckgo_vqd import BaseDuckduckgoVqd
 from ddgs.results import VideosResult
-from ddgs.utils import _extract_vqd
 
 
-class DuckduckgoVideos(BaseSearchEngine[VideosResult]):
+class DuckduckgoVideos(BaseDuckduckgoVqd[VideosResult]):
     """Duckduckgo videos search engine."""
 
     name = "duckduckgo"
@@ -35,11 +34,6 @@ class DuckduckgoVideos(BaseSearchEngine[VideosResult]):
         "uploader": "uploader",
     }
 
-    def _get_vqd(self, query: str) -> str:
-        """Get vqd value for a search query using DuckDuckGo."""
-        resp_content = self.http_client.request("GET", "https://duckduckgo.com", params={"q": query}).content
-        return _extract_vqd(resp_content, query)
-
     def build_payload(
         self,
         query: str,
@@ -62,7 +56,7 @@ class DuckduckgoVideos(BaseSearchEngine[VideosResult]):
             "l": region,
             "o": "json",
             "q": query,
-            "vqd": self._get_vqd(query),
+            "vqd": kwargs.get("vqd") or self._get_vqd(query),
             "f": f"{timelimit},{resolution},{duration},{license_videos}",
             "p": safesearch_base[safesearch.lower()],
         }
@@ -70,7 +64,7 @@ class DuckduckgoVideos(BaseSearchEngine[VideosResult]):
             payload["s"] = f"{(page - 1) * 60}"
         return payload
 
-    def extract_results(self, html_text: str) -> list[VideosResult]:
+    def extract_results(self, html_text: str | bytes) -> list[VideosResult]:
         """Extract search results from lxml tree."""
         json_data = json.loads(html_text)
         items = json_data.get("results", [])
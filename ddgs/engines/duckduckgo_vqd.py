@@ -0,0 +1,65 @@
+"""Base class of Duckduckgo search engines that need a vqd token."""
+
+from typing import Any, ClassVar, TypeVar
+
+from ddgs.base import BaseSearchEngine
+from ddgs.results import BaseResult
+from ddgs.utils import _extract_vqd, _TokenCache
+
+T = TypeVar("T", bound=BaseResult)
+
+
+class BaseDuckduckgoVqd(BaseSearchEngine[T]):
+    """Base class of Duckduckgo images, news and videos search engines.
+
+    Their requests need the vqd token of the query, which is scraped from duckduckgo.com.
+    Tokens are cached per query and shared by these engines, so every page of a query after
+    the first one costs a single request. A token is forgotten when a request with it fails.
+    """
+
+    vqd_cache: ClassVar[_TokenCache] = _TokenCache(ttl=600)
+
+    def _get_vqd(self, query: str) -> str:
+        """Get vqd value for a search query using DuckDuckGo."""
+        if vqd := self.vqd_cache.get(query):
+            return vqd
+        resp_content = self.http_client.request("GET", "https://duckduckgo.com", params={"q": query}).content
+        vqd = _extract_vqd(resp_content, query)
+        self.vqd_cache.set(query, vqd)
+        return vqd
+
+    async def _aget_vqd(self, query: str) -> str:
+        """Get vqd value for a search query using DuckDuckGo asynchronously."""
+        if vqd := self.vqd_cache.get(query):
+            return vqd
+        resp = await self.async_http_client.request("GET", "https://duckduckgo.com", params={"q": query})
+        vqd = _extract_vqd(resp.content, query)
+        self.vqd_cache.set(query, vqd)
+        return vqd
+
+    async def abuild_payload(
+        self,
+        query: str,
+        region: str,
+        safesearch: str,
+        timelimit: str | None,
+        page: int = 1,
+        **kwargs: str,
+    ) -> dict[str, Any]:
+        """Build a payload for the async search request."""
+        vqd = await self._aget_vqd(query)
+        return self.build_payload(query, region, safesearch, timelimit, page, vqd=vqd, **kwargs)
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Make a request to the search engine. Forget the vqd if the request fails (e.g. 403, bad vqd)."""
+        html_text = super().request(*args, **kwargs)
+        if not html_text:
+            self.vqd_cache.invalidate(kwargs["params"]["q"])
+        return html_text
+
+    async def arequest(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Make an async request to the search engine. Forget the vqd if the request fails (e.g. 403, bad vqd)."""
+        html_text = await super().arequest(*args, **kwargs)
+        if not html_text:
+            self.vqd_cache.invalidate(kwargs["params"]["q"])
+        return html_text
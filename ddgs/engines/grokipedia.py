@@ -34,7 +34,7 @@ class Grokipedia(BaseSearchEngine[TextResult]):
         payload: dict[str, Any] = {"query": query, "limit": "1"}
         return payload
 
-    def extract_results(self, html_text: str) -> list[TextResult]:
+    def extract_results(self, html_text: str | bytes) -> list[TextResult]:
         """Extract search results from html text."""
         json_data = json.loads(html_text)
         items = json_data.get("results", [])
@@ -6,6 +6,7 @@ from typing import Any, ClassVar
 
 from ddgs.base import BaseSearchEngine
 from ddgs.results import TextResult
+from ddgs.utils import _TokenCache
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +29,46 @@ class Startpage(BaseSearchEngine[TextResult]):
         "body": ".//p//text()",
     }
 
+    def __init__(self, proxy: str | None = None, timeout: int | None = None, *, verify: bool | str = True) -> None:
+        super().__init__(proxy=proxy, timeout=timeout, verify=verify)
+        # sc token of the homepage search form, shared by searches of this instance
+        self._sc_cache = _TokenCache(ttl=600, maxsize=1)
+
+    def _extract_sc(self, html_text: str) -> str:
+        """Extract sc param from the homepage and cache it."""
+        tree = self.extract_tree(html_text)
+        sc_elements = tree.xpath('//form[@id="search"]//input[@name="sc"]/@value')
+        sc = sc_elements[0] if sc_elements else ""
+        if sc:
+            self._sc_cache.set("sc", sc)
+        return sc
+
     def get_sc(self) -> str:
         """Get sc param."""
+        if sc := self._sc_cache.get("sc"):
+            return sc
         resp_text = self.http_client.request("GET", "https://www.startpage.com/").text
-        tree = self.extract_tree(resp_text)
-        sc_elements = tree.xpath('//form[@id="search"]//input[@name="sc"]/@value')
-        self._sc = sc_elements[0] if sc_elements else ""
-        return self._sc
+        return self._extract_sc(resp_text)
+
+    async def aget_sc(self) -> str:
+        """Get sc param asynchronously."""
+        if sc := self._sc_cache.get("sc"):
+            return sc
+        resp = await self.async_http_client.request("GET", "https://www.startpage.com/")
+        return self._extract_sc(resp.text)
+
+    async def abuild_payload(
+        self,
+        query: str,
+        region: str,
+        safesearch: str,
+        timelimit: str | None,
+        page: int = 1,
+        **kwargs: str,
+    ) -> dict[str, Any]:
+        """Build a payload for the async Startpage search request."""
+        sc = await self.aget_sc()
+        return self.build_payload(query, region, safesearch, timelimit, page, sc=sc, **kwargs)
 
     def build_payload(
         self,
@@ -43,7 +77,7 @@ class Startpage(BaseSearchEngine[TextResult]):
         safesearch: str,
         timelimit: str | None,
         page: int = 1,
-        **kwargs: str,  # noqa: ARG002
+        **kwargs: str,
     ) -> dict[str, Any]:
         """Build a payload for the Startpage search request."""
         country, lang = region.lower().split("-")
@@ -52,7 +86,7 @@ class Startpage(BaseSearchEngine[TextResult]):
             "query": query,
             "cat": "web",
             "t": "device",
-            "sc": self.get_sc(),
+            "sc": kwargs["sc"] if "sc" in kwargs else self.get_sc(),
             "lui": "english",
             "language": "english",
             "abp": "1",
@@ -68,3 +102,23 @@ class Startpage(BaseSearchEngine[TextResult]):
             payload["with_date"] = timelimit
 
         return payload
+
+    def post_extract_results(self, results: list[TextResult]) -> list[TextResult]:
+        """Post-process search results. Refresh the sc param if there are none (e.g. it expired)."""
+        if not results:
+            self._sc_cache.invalidate("sc")
+        return results
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Make a request to the search engine. Refresh the sc param if the request fails."""
+        html_text = super().request(*args, **kwargs)
+        if not html_text:
+            self._sc_cache.invalidate("sc")
+        return html_text
+
+    async def arequest(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Make an async request to the search engine. Refresh the sc param if the request fails."""
+        html_text = await super().arequest(*args, **kwargs)
+        if not html_text:
+            self._sc_cache.invalidate("sc")
+        return html_text
@@ -3,7 +3,6 @@
 import json
 import logging
 from typing import Any
-from urllib.parse import quote
 
 from ddgs.base import BaseSearchEngine
 from ddgs.results import TextResult
@@ -12,54 +11,61 @@ logger = logging.getLogger(__name__)
 
 
 class Wikipedia(BaseSearchEngine[TextResult]):
-    """Wikipedia text search engine."""
+    """Wikipedia text search engine.
+
+    A single MediaWiki API request finds the best matching article (fuzzy title search,
+    as opensearch) and returns its title, url and plain text intro.
+    """
 
     name = "wikipedia"
     category = "text"
     provider = "wikipedia"
     priority = 2
 
-    search_url = "https://{lang}.wikipedia.org/w/api.php?action=opensearch&search={query}"
+    search_url = "https://{lang}.wikipedia.org/w/api.php"
     search_method = "GET"
 
+    def _get_search_url(self, region: str) -> str:
+        """Get the API url of the Wikipedia language of the region."""
+        _country, lang = region.lower().split("-")
+        return self.search_url.format(lang=lang)
+
     def build_payload(
         self,
         query: str,
-        region: str,
+        region: str,  # noqa: ARG002
         safesearch: str,  # noqa: ARG002
         timelimit: str | None,  # noqa: ARG002
         page: int = 1,  # noqa: ARG002
         **kwargs: str,  # noqa: ARG002
     ) -> dict[str, Any]:
         """Build a payload for the search request."""
-        _country, lang = region.lower().split("-")
-        encoded_query = quote(query)
-        self.search_url = (
-            f"https://{lang}.wikipedia.org/w/api.php?action=opensearch&profile=fuzzy&limit=1&search={encoded_query}"
-        )
-        payload: dict[str, Any] = {}
-        self.lang = lang  # used in extract_results
-        return payload
+        return {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "generator": "prefixsearch",
+            "gpssearch": query,
+            "gpsprofile": "fuzzy",
+            "gpslimit": "1",
+            "prop": "extracts|info",
+            "inprop": "url",
+            "exintro": "1",
+            "explaintext": "1",
+            "redirects": "1",
+        }
 
-    def extract_results(self, html_text: str) -> list[TextResult]:
+    def extract_results(self, html_text: str | bytes) -> list[TextResult]:
         """Extract search results from html text."""
         json_data = json.loads(html_text)
-        if not json_data[1]:
+        pages = json_data.get("query", {}).get("pages", [])
+        if not pages:
             return []
 
         result = TextResult()
-        result.title = json_data[1][0]
-        result.href = json_data[3][0]
-
-        # Add body
-        encoded_query = quote(result.title)
-        resp_data = self.request(
-            "GET",
-            f"https://{self.lang}.wikipedia.org/w/api.php?action=query&format=json&prop=extracts&titles={encoded_query}&explaintext=0&exintro=0&redirects=1",
-        )
-        if resp_data:
-            json_data = json.loads(resp_data)
-            result.body = next(iter(json_data["query"]["pages"].values())).get("extract", "")
+        result.title = pages[0].get("title", "")
+        result.href = pages[0].get("fullurl", "")
+        result.body = pages[0].get("extract", "")
         if "may refer to:" in result.body:
             return []
 
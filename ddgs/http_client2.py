@@ -23,12 +23,13 @@ random = SystemRandom()
 class Response:
     """HTTP response."""
 
-    __slots__ = ("content", "status_code", "text")
+    __slots__ = ("content", "encoding", "status_code", "text")
 
-    def __init__(self, status_code: int, content: bytes, text: str) -> None:
+    def __init__(self, status_code: int, content: bytes, text: str, encoding: str | None = None) -> None:
         self.status_code = status_code
         self.content = content
         self.text = text
+        self.encoding = encoding
 
 
 class HttpClient2:
@@ -66,7 +67,9 @@ class HttpClient2:
         with Patch():
             try:
                 resp = self.client.request(*args, **kwargs)
-                return Response(status_code=resp.status_code, content=resp.content, text=resp.text)
+                return Response(
+                    status_code=resp.status_code, content=resp.content, text=resp.text, encoding=resp.encoding
+                )
             except Exception as ex:
                 if "timed out" in f"{ex}":
                     msg = f"Request timed out: {ex!r}"
@@ -0,0 +1,97 @@
+"""Token-bucket rate limiter of search engines."""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseSearchEngine
+
+
+@dataclass
+class _Bucket:
+    rate: float  # tokens per second
+    burst: int  # maximum number of tokens
+    tokens: float
+    updated: float
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """Thread-safe token-bucket rate limiter, keyed by engine name and by provider.
+
+    A request takes a token from the bucket of the engine name and of its provider, if they
+    have a limit. Buckets refill at `rate` tokens per second, up to `burst` tokens.
+    Over the limit, requests wait for a token, or are skipped if `wait` is False.
+
+    Args:
+        wait: Wait for a token (True) or skip the request (False) when over the limit. Defaults to True.
+
+    Example:
+        >>> from ddgs import DDGS
+        >>> DDGS.rate_limiter.limit_engine("google", rate=0.5, burst=3)
+        >>> DDGS.rate_limiter.limit_provider("bing", rate=2, burst=5)  # duckduckgo, yahoo, bing
+
+    """
+
+    def __init__(self, *, wait: bool = True) -> None:
+        self.wait = wait
+        self._lock = threading.Lock()
+        self._engines: dict[str, _Bucket] = {}
+        self._providers: dict[str, _Bucket] = {}
+
+    def limit_engine(self, name: str, rate: float, burst: int = 1) -> None:
+        """Limit requests of engines with this name (e.g. "google") to `rate` per second, with bursts of `burst`."""
+        with self._lock:
+            self._engines[name] = _Bucket(rate, burst, burst, time.monotonic())
+
+    def limit_provider(self, provider: str, rate: float, burst: int = 1) -> None:
+        """Limit requests of engines of this provider (e.g. "bing") to `rate` per second, with bursts of `burst`."""
+        with self._lock:
+            self._providers[provider] = _Bucket(rate, burst, burst, time.monotonic())
+
+    def clear(self) -> None:
+        """Remove all limits."""
+        with self._lock:
+            self._engines.clear()
+            self._providers.clear()
+
+    def _try_acquire(self, engine: "BaseSearchEngine[Any]") -> float:
+        """Take a token for a request of the engine, or return the seconds to wait for one."""
+        with self._lock:
+            buckets = [b for b in (self._engines.get(engine.name), self._providers.get(engine.provider)) if b]
+            now = time.monotonic()
+            for bucket in buckets:
+                bucket.refill(now)
+            wait = max((bucket.wait_time() for bucket in buckets), default=0.0)
+            if wait <= 0:
+                for bucket in buckets:
+                    bucket.tokens -= 1
+            return wait
+
+    def acquire(self, engine: "BaseSearchEngine[Any]") -> bool:
+        """Take a token for a request of the engine, waiting for it if `wait`. Return False if skipped."""
+        while (wait := self._try_acquire(engine)) > 0:
+            if not self.wait:
+                return False
+            time.sleep(wait)
+        return True
+
+    async def aacquire(self, engine: "BaseSearchEngine[Any]") -> bool:
+        """Take a token for a request of the engine asynchronously, waiting for it if `wait`."""
+        while (wait := self._try_acquire(engine)) > 0:
+            if not self.wait:
+                return False
+            await asyncio.sleep(wait)
+        return True
+
+
+rate_limiter = RateLimiter()
@@ -6,14 +6,59 @@ from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from typing import Any, ClassVar, Generic, TypeVar
 
-from .utils import _normalize_date, _normalize_text, _normalize_url
+from .utils import _canonicalize_url, _minhash, _normalize_date, _normalize_text, _normalize_url
 
-T = TypeVar("T")
+R = TypeVar("R", bound="BaseResult")
+
+MERGES = ("frequency", "rrf")  # orders of aggregated results, see `ResultsAggregator.extract_items`
+RRF_K = 60  # rank constant of reciprocal rank fusion, see `ResultsAggregator.extract_items`
+
+
+class _NormalizedField:
+    """Result field that is normalized when set or, in lazy mode, on first read. Wraps the slot of the field."""
+
+    def __init__(self, name: str, normalizer: Callable[[Any], str], slot: Any, bit: int) -> None:  # noqa: ANN401
+        self.name = name
+        self.normalizer = normalizer
+        self.slot = slot
+        self.bit = bit  # bit of the field in `BaseResult._pending`
+
+    def __get__(self, obj: "BaseResult | None", objtype: type | None = None) -> Any:  # noqa: ANN401
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj)
+        if obj._pending & self.bit:
+            obj._pending &= ~self.bit
+            value = self.normalizer(value)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: "BaseResult", value: Any) -> None:  # noqa: ANN401
+        if value and BaseResult.lazy:
+            obj._pending |= self.bit
+        else:
+            obj._pending &= ~self.bit
+            if value:
+                value = self.normalizer(value)
+        self.slot.__set__(obj, value)
 
 
 class BaseResult:
-    """Base class for all results. Contains normalization functions."""
+    """Base class for all results. Contains normalization functions.
+
+    Results are slotted dataclasses: fields are stored in `__slots__`, without a per-instance `__dict__`.
+    Fields with a normalizer are normalized when they are set. If `BaseResult.lazy` is True,
+    raw values are stored and normalized on first read, by attribute access or `to_dict()`,
+    so results dropped by engines or deduplicated by `ResultsAggregator` are never normalized.
+    """
+
+    __slots__ = ("_pending",)
+    _pending: int  # bits of the fields not normalized yet, in lazy mode
 
+    lazy: ClassVar[bool] = False
+    key_field: ClassVar[str]  # field that identifies the result, see `ResultsAggregator`
+    _field_names: ClassVar[tuple[str, ...]] = ()
+    _text_fields: ClassVar[frozenset[str]] = frozenset()  # fields normalized by `_normalize_text`
     _normalizers: ClassVar[Mapping[str, Callable[[Any], str]]] = {
         "title": _normalize_text,
         "body": _normalize_text,
@@ -27,26 +72,80 @@ class BaseResult:
         "info": _normalize_text,
     }
 
-    def __setattr__(self, name: str, value: str) -> None:
-        """Override setattr to apply normalization functions to certain attributes."""
-        if value and (normalizer := self._normalizers.get(name)):
-            value = normalizer(value)
-        object.__setattr__(self, name, value)
+    def __new__(cls: type[R], *args: Any, **kwargs: Any) -> R:  # noqa: ANN401, ARG004, PYI019
+        """Create a result with no fields pending normalization."""
+        obj = super().__new__(cls)
+        obj._pending = 0
+        return obj
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Wrap the slots of fields with a normalizer in `_NormalizedField` descriptors.
 
-@dataclass
+        `dataclass(slots=True)` creates the class again with `__slots__`, only that class is processed.
+        """
+        super().__init_subclass__(**kwargs)
+        if "__slots__" not in cls.__dict__:
+            return
+        cls._field_names = tuple(cls.__slots__)
+        cls._text_fields = frozenset(name for name in cls._field_names if cls._normalizers.get(name) is _normalize_text)
+        for i, name in enumerate(cls._field_names):
+            if normalizer := cls._normalizers.get(name):
+                setattr(cls, name, _NormalizedField(name, normalizer, cls.__dict__[name], 1 << i))
+
+    def _get_raw(self, name: str) -> Any:  # noqa: ANN401
+        """Get the value of a field, without normalizing it in lazy mode."""
+        field = type(self).__dict__.get(name)
+        if isinstance(field, _NormalizedField):
+            return field.slot.__get__(self)
+        return getattr(self, name, "")
+
+    def _set_normalized(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Set a field with a normalizer to a value it already normalized, e.g. with `_normalize_texts`."""
+        field = type(self).__dict__[name]
+        self._pending &= ~field.bit
+        field.slot.__set__(self, value)
+
+    def key(self) -> str:
+        """Return the value of `key_field`, which identifies the result."""
+        return str(getattr(self, self.key_field))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields of the result as a new dict."""
+        return {name: getattr(self, name) for name in self._field_names}
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state for pickle and copy, with raw values of fields not normalized yet."""
+        state = {name: self._get_raw(name) for name in self._field_names}
+        state["_pending"] = self._pending
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state, without normalizing the values again."""
+        for name, value in state.items():
+            field = type(self).__dict__.get(name)
+            if isinstance(field, _NormalizedField):
+                field.slot.__set__(self, value)
+            else:
+                object.__setattr__(self, name, value)
+
+
+@dataclass(slots=True)
 class TextResult(BaseResult):
     """Text search result."""
 
+    key_field: ClassVar[str] = "href"
+
     title: str = ""
     href: str = ""
     body: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ImagesResult(BaseResult):
     """Image search result."""
 
+    key_field: ClassVar[str] = "image"
+
     title: str = ""
     image: str = ""
     thumbnail: str = ""
@@ -56,10 +155,12 @@ class ImagesResult(BaseResult):
     source: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsResult(BaseResult):
     """News search result."""
 
+    key_field: ClassVar[str] = "url"
+
     date: str = ""
     title: str = ""
     body: str = ""
@@ -68,10 +169,12 @@ class NewsResult(BaseResult):
     source: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class VideosResult(BaseResult):
     """Video search result."""
 
+    key_field: ClassVar[str] = "embed_url"
+
     title: str = ""
     content: str = ""
     description: str = ""
@@ -87,10 +190,12 @@ class VideosResult(BaseResult):
     uploader: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BooksResult(BaseResult):
     """Book search result."""
 
+    key_field: ClassVar[str] = "url"
+
     title: str = ""
     author: str = ""
     publisher: str = ""
@@ -99,50 +204,154 @@ class BooksResult(BaseResult):
     thumbnail: str = ""
 
 
-class ResultsAggregator(ABC, Generic[T]):
+class _NearDuplicateIndex:
+    """LSH index of MinHash signatures (see `_minhash`), to find near-duplicates in ~constant time.
+
+    Signatures are split in `bands` bands; items sharing a band are candidates, which are
+    near-duplicates if at least `threshold` of their signature bins are equal.
+    """
+
+    def __init__(self, bands: int = 32, threshold: float = 0.8) -> None:
+        self.bands = bands
+        self.threshold = threshold
+        self._buckets: list[dict[tuple[int, ...], list[str]]] = [{} for _ in range(bands)]
+        self._signatures: dict[str, tuple[int, ...]] = {}
+
+    def _split(self, signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        rows = len(signature) // self.bands
+        return [signature[i * rows : (i + 1) * rows] for i in range(self.bands)]
+
+    def find(self, signature: tuple[int, ...]) -> str | None:
+        """Return the key of a near-duplicate of the signature, or None."""
+        candidates: set[str] = set()
+        for band, buckets in zip(self._split(signature), self._buckets, strict=True):
+            for key in buckets.get(band, ()):
+                if key in candidates:
+                    continue
+                candidates.add(key)
+                other = self._signatures[key]
+                if sum(a == b for a, b in zip(signature, other, strict=True)) >= self.threshold * len(signature):
+                    return key
+        return None
+
+    def add(self, key: str, signature: tuple[int, ...]) -> None:
+        """Add the signature of an item."""
+        self._signatures[key] = signature
+        for band, buckets in zip(self._split(signature), self._buckets, strict=True):
+            buckets.setdefault(band, []).append(key)
+
+
+class ResultsAggregator(ABC, Generic[R]):
     """Aggregates incoming results.
 
-    Items are deduplicated by `cache_field`. Append just increments a counter;
-    `extract_results` returns items sorted by descending frequency.
+    Items are deduplicated by the canonical URL (see `_canonicalize_url`) of their `cache_field`,
+    keeping the richest variant. With `near_duplicates`, items with a body that are near-duplicates
+    of a previous item (mirrors, AMP pages, syndicated copies), by MinHash of their title and body,
+    are collapsed into it.
+    Append increments a counter and records the best rank each engine gave the item in `ranks`;
+    `extract_items` returns items sorted by descending frequency, or by reciprocal rank fusion.
     """
 
-    def __init__(self, cache_fields: set[str]) -> None:
+    def __init__(self, cache_fields: set[str], *, near_duplicates: bool = False) -> None:
         if not cache_fields:
             msg = "At least one cache_field must be provided"
             raise ValueError(msg)
         self.cache_fields = set(cache_fields)
         self._counter: Counter[str] = Counter()
-        self._cache: dict[str, T] = {}
-
-    def _get_key(self, item: T) -> str:
-        for key in item.__dict__:
+        self._cache: dict[str, R] = {}
+        self._near_duplicates = _NearDuplicateIndex() if near_duplicates else None
+        self._aliases: dict[str, str] = {}  # key of a collapsed near-duplicate -> key of its survivor
+        self.ranks: dict[str, dict[str, int]] = {}  # key -> {engine: best rank (1-based) of the item}
+        self._weights: dict[str, float] = {}  # engine -> weight of its ranks in reciprocal rank fusion
+
+    def _get_key(self, item: R) -> str:
+        if item.key_field in self.cache_fields:
+            return _canonicalize_url(item.key())
+        for key in item._field_names:
             if key in self.cache_fields:
-                return str(item.__dict__[key])
+                return _canonicalize_url(str(getattr(item, key)))
         msg = f"Item {item!r} has none of the cache fields {self.cache_fields}"
         raise AttributeError(msg)
 
+    @staticmethod
+    def _get_signature(item: BaseResult) -> tuple[int, ...] | None:
+        """Get the MinHash signature of the title and body of an item, or None if it has no body.
+
+        In lazy mode, the signature is computed before normalization, so items are not normalized.
+        """
+        body = item._get_raw("body")
+        return _minhash(f"{item._get_raw('title')} {body}") if body else None
+
+    @staticmethod
+    def _get_richness(item: BaseResult) -> tuple[int, int]:
+        """Get the number of non-empty fields and the length of the body of an item.
+
+        In lazy mode, fields are compared before normalization, so duplicates are never normalized.
+        """
+        raw_values = [item._get_raw(name) for name in item._field_names]
+        return sum(1 for value in raw_values if value), len(item._get_raw("body"))
+
     def __len__(self) -> int:
         """Return the number of items in the cache."""
         return len(self._cache)
 
-    def append(self, item: T) -> None:
+    def append(self, item: R, engine: str = "", rank: int = 0) -> bool:
         """Add an item to the cache.
 
         Register an occurrence of `item`. First time we see its key,
-        we store the item; every time we bump the counter.
+        we store the item; every time we bump the counter and, if `engine` is given,
+        record its `rank` in the results of the engine.
+        Return True if the key was seen for the first time.
         """
         key = self._get_key(item)
-        if key not in self._cache or len(item.__dict__.get("body", "")) > len(
-            self._cache[key].__dict__.get("body", ""),
-        ):
+        key = self._aliases.get(key, key)
+        is_new = key not in self._cache
+        if is_new and self._near_duplicates is not None and (signature := self._get_signature(item)):
+            if survivor := self._near_duplicates.find(signature):
+                self._aliases[key] = key = survivor
+                is_new = False
+            else:
+                self._near_duplicates.add(key, signature)
+        if is_new or self._get_richness(item) > self._get_richness(self._cache[key]):
             self._cache[key] = item
         self._counter[key] += 1
+        if engine:
+            ranks = self.ranks.setdefault(key, {})
+            ranks[engine] = min(rank, ranks.get(engine, rank))
+        return is_new
 
-    def extend(self, items: list[T]) -> None:
-        """Add a list of items to the cache."""
-        for item in items:
-            self.append(item)
+    def extend(self, items: list[R], engine: str = "", weight: float = 1) -> list[R]:
+        """Add a list of items to the cache. Return the items whose keys were seen for the first time.
+
+        If `engine` is given, items are ranked in the order of the list, and `weight`
+        (e.g. the engine priority) is the weight of the engine in reciprocal rank fusion.
+        """
+        if engine:
+            self._weights[engine] = weight
+        return [item for rank, item in enumerate(items, 1) if self.append(item, engine, rank)]
+
+    def _get_rrf_score(self, key: str) -> float:
+        """Get the weighted reciprocal rank fusion score of an item: sum of weight / (RRF_K + rank) over engines."""
+        return sum(self._weights[engine] / (RRF_K + rank) for engine, rank in self.ranks.get(key, {}).items())
+
+    def extract_items(self, merge: str = "frequency") -> list[R]:
+        """Return a list of items, not materialized as dicts.
+
+        Args:
+            merge: The order of the items: "frequency" (descending number of occurrences)
+                or "rrf" (descending reciprocal rank fusion score, see `_get_rrf_score`).
+                Ties keep the order in which items were first seen. Defaults to "frequency".
+
+        """
+        if merge == "frequency":
+            keys = [key for key, _ in self._counter.most_common()]
+        elif merge == "rrf":
+            keys = sorted(self._cache, key=self._get_rrf_score, reverse=True)
+        else:
+            msg = f"Unknown merge {merge!r}, expected one of {MERGES}"
+            raise ValueError(msg)
+        return [self._cache[key] for key in keys]
 
-    def extract_dicts(self) -> list[dict[str, Any]]:
-        """Return a list of items, sorted by descending frequency. Each item is returned as a dict."""
-        return [self._cache[key].__dict__ for key, _ in self._counter.most_common()]
+    def extract_dicts(self, merge: str = "frequency") -> list[dict[str, Any]]:
+        """Return a list of items, each as a dict, in the order of `extract_items`."""
+        return [item.to_dict() for item in self.extract_items(merge)]
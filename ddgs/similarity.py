@@ -1,6 +1,8 @@
-"""Simple filter ranker."""
+"""Rankers of search results."""
 
 import re
+from collections import Counter
+from math import log
 from typing import Final
 
 
@@ -70,3 +72,76 @@ class SimpleFilterRanker:
 
         # final ranking
         return wiki_hits + both + title_only + body_only + neither
+
+
+class BM25Ranker:
+    """BM25F ranker.
+
+    Scores docs by BM25F over their title and body/description fields: term frequencies are
+    length-normalized per field (`b`), weighted per field (`title_weight`, `body_weight`) and
+    saturated once (`k1`). Document frequencies and field lengths are computed in one pass over
+    the docs, so scores are relative to the result set. Query tokens are whole words, matched
+    case-insensitively. Docs are sorted by descending score; ties keep their input order
+    (the frequency order of `ResultsAggregator`). Wikimedia category pages are skipped.
+    """
+
+    _words: Final = re.compile(r"\w+")
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        title_weight: float = 2.0,
+        body_weight: float = 1.0,
+    ) -> None:
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.body_weight = body_weight
+
+    def _tokenize(self, text: str) -> list[str]:
+        """Get the words of the lower-cased text."""
+        return self._words.findall(text.lower())
+
+    def rank(self, docs: list[dict[str, str]], query: str) -> list[dict[str, str]]:
+        """Rank a list of docs based on a query string."""
+        terms = set(self._tokenize(query))
+        kept = []
+        stats = []  # per doc: (title length, body length, title term counts, body term counts)
+        df: Counter[str] = Counter()
+        for doc in docs:
+            title = doc.get("title", "")
+            # Skip Wikimedia category pages
+            if "Category:" in title and "Wikimedia" in title:
+                continue
+            # fallback to 'description' if no 'body'
+            title_tokens = self._tokenize(title)
+            body_tokens = self._tokenize(doc.get("body", doc.get("description", "")))
+            title_tf = {t: n for t in terms if (n := title_tokens.count(t))}
+            body_tf = {t: n for t in terms if (n := body_tokens.count(t))}
+            df.update(title_tf.keys() | body_tf.keys())
+            kept.append(doc)
+            stats.append((len(title_tokens), len(body_tokens), title_tf, body_tf))
+        if not kept or not terms:
+            return kept
+
+        n_docs = len(kept)
+        avg_title = sum(s[0] for s in stats) / n_docs or 1.0
+        avg_body = sum(s[1] for s in stats) / n_docs or 1.0
+        idf = {t: log(1 + (n_docs - n + 0.5) / (n + 0.5)) for t, n in df.items()}
+        k1, b = self.k1, self.b
+        scores = []
+        for title_len, body_len, title_tf, body_tf in stats:
+            score = 0.0
+            if title_tf or body_tf:
+                title_norm = self.title_weight / (1 - b + b * title_len / avg_title)
+                body_norm = self.body_weight / (1 - b + b * body_len / avg_body)
+                for t in title_tf.keys() | body_tf.keys():
+                    tf = title_tf.get(t, 0) * title_norm + body_tf.get(t, 0) * body_norm
+                    score += idf[t] * tf / (k1 + tf)
+            scores.append(score)
+        order = sorted(range(n_docs), key=scores.__getitem__, reverse=True)  # stable: ties keep input order
+        return [kept[i] for i in order]
+
+
+RANKERS: Final[dict[str, type[SimpleFilterRanker | BM25Ranker]]] = {"simple": SimpleFilterRanker, "bm25": BM25Ranker}
@@ -0,0 +1,86 @@
+"""Per-engine runtime statistics."""
+
+import json
+import threading
+from collections import defaultdict, deque
+from pathlib import Path
+from random import SystemRandom
+from statistics import median
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseSearchEngine
+
+random = SystemRandom()
+
+
+def engine_key(engine: "BaseSearchEngine[Any]") -> str:
+    """Get the statistics key of an engine, e.g. "text:google"."""
+    return f"{engine.category}:{engine.name}"
+
+
+class EngineStats:
+    """Thread-safe statistics of search engines, collected at runtime.
+
+    Keeps a sliding window of the latest response latencies and request outcomes
+    (number of results, 0 for empty pages and errors) of every engine.
+    """
+
+    def __init__(self, window: int = 100, min_samples: int = 10) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._latencies: defaultdict[str, deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+        self._outcomes: defaultdict[str, deque[int]] = defaultdict(lambda: deque(maxlen=self.window))
+
+    def record(self, key: str, latency: float | None, n_results: int) -> None:
+        """Record a request of an engine: its latency in seconds (None if it failed) and number of results."""
+        with self._lock:
+            if latency is not None:
+                self._latencies[key].append(latency)
+            self._outcomes[key].append(n_results)
+
+    def latency_percentile(self, key: str, percentile: float) -> float | None:
+        """Get the latency percentile (0 < percentile < 1) of an engine, or None if there are too few samples."""
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(percentile * len(samples)))]
+
+    def sample_score(self, key: str) -> float:
+        """Sample the expected usefulness of an engine (Thompson sampling).
+
+        The success rate (share of requests with results) is drawn from its Beta posterior and
+        weighted by the mean number of results per successful request (up to 10) and by the median latency.
+        Engines without statistics get a random score, so they are tried; engines that keep failing
+        get low scores, but are still tried now and then.
+        """
+        with self._lock:
+            outcomes = list(self._outcomes.get(key, ()))
+            latencies = list(self._latencies.get(key, ()))
+        successes = sum(1 for n in outcomes if n)
+        success_rate = random.betavariate(successes + 1, len(outcomes) - successes + 1)
+        mean_yield = sum(outcomes) / successes if successes else 10
+        latency = median(latencies) if latencies else 0
+        return success_rate * min(mean_yield, 10) / 10 / (1 + latency)
+
+    def save(self, path: str | Path) -> None:
+        """Save statistics to a JSON file."""
+        with self._lock:
+            data = {
+                "latencies": {k: list(v) for k, v in self._latencies.items()},
+                "outcomes": {k: list(v) for k, v in self._outcomes.items()},
+            }
+        Path(path).write_text(json.dumps(data), encoding="utf-8")
+
+    def load(self, path: str | Path) -> None:
+        """Load statistics saved by `save`, replacing the current ones."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        with self._lock:
+            self._latencies.clear()
+            self._outcomes.clear()
+            for k, v in data.get("latencies", {}).items():
+                self._latencies[k].extend(v)
+            for k, v in data.get("outcomes", {}).items():
+                self._outcomes[k].extend(v)
@@ -1,15 +1,27 @@
 """Utilities."""
 
 import re
+import threading
 import unicodedata
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable
 from contextlib import suppress
 from datetime import datetime, timezone
 from html import unescape
-from urllib.parse import unquote
+from itertools import pairwise
+from time import monotonic
+from urllib.parse import unquote, urlsplit
 
 from .exceptions import DDGSException
 
 _REGEX_STRIP_TAGS = re.compile("<.*?>")
+_REGEX_WORDS = re.compile(r"\w+")
+_MINHASH_BITS = 7
+_MINHASH_BINS = 1 << _MINHASH_BITS
+_TRACKING_PARAMS = frozenset(
+    ("gclid", "dclid", "fbclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid", "_ga", "_gl", "srsltid", "ref_src")
+)
 
 
 def _extract_vqd(html_bytes: bytes, query: str) -> str:
@@ -28,38 +40,161 @@ def _extract_vqd(html_bytes: bytes, query: str) -> str:
     raise DDGSException(msg)
 
 
+class _TokenCache:
+    """Thread-safe cache of session tokens (e.g. DuckDuckGo vqd), with a TTL and LRU eviction."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._tokens: OrderedDict[str, tuple[float, str]] = OrderedDict()  # key -> (expires_at, token)
+
+    def get(self, key: str) -> str | None:
+        """Get a token, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= monotonic():
+                del self._tokens[key]
+                return None
+            self._tokens.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, token: str) -> None:
+        """Cache a token."""
+        with self._lock:
+            self._tokens[key] = (monotonic() + self.ttl, token)
+            self._tokens.move_to_end(key)
+            while len(self._tokens) > self.maxsize:
+                self._tokens.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Remove a token, e.g. after it was rejected."""
+        with self._lock:
+            self._tokens.pop(key, None)
+
+
 def _normalize_url(url: str) -> str:
     """Unquote URL and replace spaces with '+'."""
     return unquote(url).replace(" ", "+") if url else ""
 
 
+def _canonicalize_url(url: str) -> str:
+    """Get a canonical key of a URL, equal for URLs of the same page. Not a valid URL.
+
+    Ignore the scheme (http/https), "www.", default ports, the fragment, trailing slashes,
+    tracking params (utm_*, gclid, fbclid, ...) and the order of the other query params.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+    host = (parts.hostname or "").removeprefix("www.")
+    if port and port not in {80, 443}:
+        host = f"{host}:{port}"
+    path = parts.path.rstrip("/")
+    params = [
+        param
+        for param in parts.query.split("&")
+        if param and not (name := param.split("=", 1)[0].lower()).startswith("utm_") and name not in _TRACKING_PARAMS
+    ]
+    if params:
+        return f"{host}{path}?{'&'.join(sorted(params))}"
+    return f"{host}{path}"
+
+
+def _minhash(text: str, min_shingles: int = 8) -> tuple[int, ...] | None:
+    """Get a MinHash signature of the word bigrams of a text, with one permutation hashing.
+
+    Each bigram is hashed once with crc32 (stable across processes, unlike `hash`) into one of
+    `_MINHASH_BINS` bins, which keeps the minimum hash.
+    Empty bins take the value of the next non-empty one. The fraction of equal bins of two signatures
+    estimates the Jaccard similarity of the texts. Html tags are ignored.
+    Return None if there are fewer than `min_shingles` bigrams.
+    """
+    tokens = _REGEX_WORDS.findall(_REGEX_STRIP_TAGS.sub(" ", text).lower())
+    shingles = set(pairwise(tokens))
+    if len(shingles) < min_shingles:
+        return None
+    bins = [-1] * _MINHASH_BINS
+    for first, second in shingles:
+        h = zlib.crc32(f"{first} {second}".encode())
+        i, value = h & (_MINHASH_BINS - 1), h >> _MINHASH_BITS
+        if bins[i] < 0 or value < bins[i]:
+            bins[i] = value
+    next_value = next(value for value in bins if value >= 0)
+    for i in reversed(range(_MINHASH_BINS)):
+        if bins[i] < 0:
+            bins[i] = next_value
+        else:
+            next_value = bins[i]
+    return tuple(bins)
+
+
+class _ControlCharsTable(dict[int, int | None]):
+    """Translate table that removes "C" category characters, filled in as characters are looked up."""
+
+    def __missing__(self, key: int) -> int | None:
+        value = None if unicodedata.category(chr(key))[0] == "C" else key
+        self[key] = value
+        return value
+
+
+_ASCII_CONTROL_CHARS: dict[int, int | None] = dict.fromkeys([*range(32), 127])
+_CONTROL_CHARS = _ControlCharsTable(_ASCII_CONTROL_CHARS)
+
+
 def _normalize_text(raw: str) -> str:
     """Normalize text.
 
     Strip HTML tags, unescape HTML entities, normalize Unicode,
     remove "c" category characters, and collapse whitespace.
+    Steps that cannot change the text are skipped (e.g. all of them for plain ASCII text).
     """
     if not raw:
         return ""
 
     # 1. Strip HTML tags
-    text = _REGEX_STRIP_TAGS.sub("", raw)
+    text = _REGEX_STRIP_TAGS.sub("", raw) if "<" in raw else raw
 
     # 2. Unescape HTML entities
-    text = unescape(text)
-
-    # 3. Unicode normalization
-    text = unicodedata.normalize("NFC", text)
-
-    # 4. Remove "C" category characters
-    c_to_none = {ord(ch): None for ch in set(text) if unicodedata.category(ch)[0] == "C"}
-    if c_to_none:
-        text = text.translate(c_to_none)
+    if "&" in text:
+        text = unescape(text)
+
+    if text.isascii():
+        # 3. ASCII is NFC; 4. remove control characters
+        if text.isprintable():
+            if "  " not in text and not text.startswith(" ") and not text.endswith(" "):
+                return text
+        else:
+            text = text.translate(_ASCII_CONTROL_CHARS)
+    else:
+        # 3. Unicode normalization
+        text = unicodedata.normalize("NFC", text)
+        # 4. Remove "C" category characters, which are all non-printable
+        if not text.isprintable():
+            text = text.translate(_CONTROL_CHARS)
 
     # 5. Collapse whitespace
     return " ".join(text.split())
 
 
+def _normalize_texts(raws: Iterable[str]) -> list[str]:
+    """Normalize a page of texts (see `_normalize_text`). Repeated texts (e.g. source names) are normalized once."""
+    normalized: dict[str, str] = {}
+    texts = []
+    for raw in raws:
+        text = normalized.get(raw)
+        if text is None:
+            text = normalized[raw] = _normalize_text(raw)
+        texts.append(text)
+    return texts
+
+
 def _normalize_date(date: int | str) -> str:
     """Normalize date from integer to ISO format if applicable."""
     return datetime.fromtimestamp(date, timezone.utc).isoformat() if isinstance(date, int) else date
@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+import pytest
+from conftest import FakeEngine, make_results
+
+from ddgs.cache import ResultCache
+from ddgs.ddgs import DDGS
+from ddgs.exceptions import DDGSException
+from ddgs.results import TextResult
+
+
+class CountingEngine(FakeEngine):
+    lock = threading.Lock()
+    running: ClassVar[Counter[str]] = Counter()
+    peak: ClassVar[Counter[str]] = Counter()
+    searched: ClassVar[Counter[str]] = Counter()
+
+    def search(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401, ARG002
+        with self.lock:
+            self.running[self.name] += 1
+            self.peak[self.name] = max(self.peak[self.name], self.running[self.name])
+            self.searched[query] += 1
+        time.sleep(0.01)
+        with self.lock:
+            self.running[self.name] -= 1
+        return make_results(self.name, query)
+
+
+@pytest.fixture
+def ddgs(use_engines: Callable[..., list[FakeEngine]]) -> DDGS:
+    use_engines(CountingEngine, ("one", "two", "three"))
+    CountingEngine.peak.clear()
+    CountingEngine.searched.clear()
+    return DDGS()
+
+
+def test_batch_ordered(ddgs: DDGS) -> None:
+    queries = [f"query{i % 10}" for i in range(30)]
+    results = list(ddgs.batch(queries, max_results=20, max_workers=4, max_workers_per_engine={"one": 1}))
+    assert [query for query, _ in results] == queries
+    assert all(isinstance(r, list) and len(r) == 20 for _, r in results)
+    assert max(CountingEngine.searched.values()) == 2  # identical queries are searched once, by 2 engines
+    assert CountingEngine.peak["one"] == 1
+    assert max(CountingEngine.peak.values()) <= 2
+
+
+def test_batch_unordered_with_error(ddgs: DDGS) -> None:
+    results = dict(ddgs.batch(["python", "", "python"], ordered=False))
+    assert isinstance(results[""], DDGSException)
+    assert len(results["python"]) == 10  # type: ignore[arg-type]
+
+
+def test_batch_engines_disabled(ddgs: DDGS) -> None:
+    results = dict(ddgs.batch(["python"], max_workers_per_engine={"one": 0, "two": 0}))
+    assert len(results["python"]) == 10  # type: ignore[arg-type]
+    assert CountingEngine.peak.keys() == {"three"}
+    results = dict(ddgs.batch(["python"], max_workers_per_engine=0))
+    assert isinstance(results["python"], DDGSException)
+
+
+def test_batch_shares_cache_with_search(use_engines: Callable[..., list[FakeEngine]]) -> None:
+    use_engines(CountingEngine, ("one",))
+    CountingEngine.searched.clear()
+    cache = ResultCache()
+    ddgs = DDGS(cache=cache)
+    results = ddgs.text("python")
+    assert dict(ddgs.batch(["python"])) == {"python": results}
+    batch_results = dict(ddgs.batch(["java"]))
+    assert ddgs.text("java") == batch_results["java"]
+    assert CountingEngine.searched == {"python": 1, "java": 1}
+    assert (cache.hits, cache.misses) == (2, 2)
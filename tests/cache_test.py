@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from conftest import FakeEngine, make_results
+
+from ddgs.cache import ResultCache, SQLiteCache, make_cache_key
+from ddgs.ddgs import AsyncDDGS
+from ddgs.results import TextResult
+
+RESULTS = [{"title": f"title {i}", "href": f"https://example.com/{i}"} for i in range(10)]
+
+
+def key(**kwargs: str) -> str:
+    args: dict[str, Any] = {
+        "region": "us-en",
+        "safesearch": "moderate",
+        "timelimit": None,
+        "page": 1,
+        "backend": "auto",
+    }
+    return make_cache_key("text", "python", **{**args, **kwargs})
+
+
+def test_make_cache_key() -> None:
+    assert make_cache_key(
+        "text",
+        "  Python   Programming ",
+        region="US-EN",
+        safesearch="moderate",
+        timelimit=None,
+        page=1,
+        backend="bing, google",
+    ) == make_cache_key(
+        "text",
+        "python programming",
+        region="us-en",
+        safesearch="moderate",
+        timelimit=None,
+        page=1,
+        backend="google,bing",
+    )
+    assert key() != key(region="uk-en")
+    assert key() != key(backend="google")
+
+
+def test_hits_and_misses() -> None:
+    cache = ResultCache()
+    assert cache.get(key(), 10) is None
+    cache.set(key(), "text", 10, RESULTS)
+    assert cache.get(key(), 10) == RESULTS
+    assert cache.get(key(), 5) == RESULTS[:5]
+    assert cache.get(key(), 20) is None  # more results than cached
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_results_are_copied() -> None:
+    cache = ResultCache()
+    cache.set(key(), "text", 10, RESULTS)
+    cache.get(key(), 10)[0]["title"] = "changed"  # type: ignore[index]
+    assert cache.get(key(), 10) == RESULTS
+
+
+def test_ttl_per_category() -> None:
+    cache = ResultCache(ttl={"news": 0.01})
+    cache.set(key(), "text", 10, RESULTS)
+    cache.set("news", "news", 10, RESULTS)
+    time.sleep(0.02)
+    assert cache.get(key(), 10) == RESULTS
+    assert cache.get("news", 10) is None
+
+
+def test_lru_eviction() -> None:
+    cache = ResultCache(maxsize=2)
+    cache.set("a", "text", 10, RESULTS)
+    cache.set("b", "text", 10, RESULTS)
+    cache.get("a", 10)
+    cache.set("c", "text", 10, RESULTS)
+    assert len(cache) == 2
+    assert cache.get("b", 10) is None
+    assert cache.get("a", 10) == RESULTS
+
+
+def test_sqlite_cache(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / "cache.db")
+    assert cache.get(key(), 10) is None
+    cache.set(key(), "text", 10, RESULTS)
+    assert cache.get(key(), 5) == RESULTS[:5]
+    assert cache.get(key(), 20) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+    # shared with other processes
+    other = SQLiteCache(tmp_path / "cache.db")
+    assert other.get(key(), 10) == RESULTS
+    assert other._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    other.close()
+    cache.close()
+
+
+def test_sqlite_cache_eviction(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / "cache.db", ttl={"news": 0.01}, max_size=1, evict_interval=1000)
+    cache.set("old", "text", 10, RESULTS)
+    cache.set("new", "text", 10, RESULTS)
+    cache.set("news", "news", 10, RESULTS)
+    time.sleep(0.02)
+    cache.get("old", 10)
+    cache.max_size = len(cache._conn.execute("SELECT payload FROM results WHERE key = 'old'").fetchone()[0])
+    cache.evict()
+    assert len(cache) == 1
+    assert cache.get("old", 10) == RESULTS
+    cache.close()
+
+
+class ThreadRecordingCache(SQLiteCache):
+    """SQLite cache recording the threads its methods are called from."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.threads: set[int] = set()
+
+    def get(self, key: str, max_results: int | None) -> list[dict[str, Any]] | None:
+        self.threads.add(threading.get_ident())
+        return super().get(key, max_results)
+
+    def set(self, key: str, category: str, max_results: int | None, results: list[dict[str, Any]]) -> None:
+        self.threads.add(threading.get_ident())
+        super().set(key, category, max_results, results)
+
+
+class ResultsEngine(FakeEngine):
+    async def asearch(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401, ARG002
+        return make_results(self.name, query)
+
+
+def test_async_cache_does_not_block_event_loop(tmp_path: Path, use_engines: Callable[..., list[FakeEngine]]) -> None:
+    use_engines(ResultsEngine, ("one",))
+    cache = ThreadRecordingCache(tmp_path / "cache.db")
+
+    async def search() -> list[dict[str, Any]]:
+        addgs = AsyncDDGS(cache=cache)
+        await addgs.text("python", max_results=10)
+        return await addgs.text("python", max_results=10)  # served from the cache
+
+    assert len(asyncio.run(search())) == 10
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.threads
+    assert threading.get_ident() not in cache.threads  # asyncio.run() runs the event loop in this thread
+    cache.close()
@@ -0,0 +1,75 @@
+import socket
+import time
+
+import pytest
+from conftest import FakeEngine
+
+from ddgs.circuit_breaker import CircuitBreaker
+from ddgs.ddgs import DDGS
+from ddgs.exceptions import DDGSException
+from ddgs.stats import EngineStats, engine_key
+
+
+def test_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=30)
+    breaker.record_failure("text:google")
+    breaker.record_failure("text:google")
+    breaker.record_success("text:google")
+    breaker.record_failure("text:google")
+    breaker.record_failure("text:google")
+    assert breaker.allow("text:google")
+    breaker.record_failure("text:google")
+    assert not breaker.allow("text:google")
+    assert not breaker.is_available("text:google")
+    assert breaker.states()["text:google"]["state"] == "open"
+    assert breaker.allow("text:brave")
+
+
+def test_rate_limit_trips_at_once() -> None:
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure("text:bing", trip=True)
+    assert breaker.states()["text:bing"]["state"] == "open"
+
+
+def test_half_open_single_probe() -> None:
+    breaker = CircuitBreaker(cooldown=0.01)
+    breaker.record_failure("text:yahoo", trip=True)
+    time.sleep(0.02)
+    assert breaker.is_available("text:yahoo")
+    assert breaker.allow("text:yahoo")
+    assert not breaker.allow("text:yahoo")  # the probe is in flight
+    breaker.record_success("text:yahoo")
+    assert breaker.states()["text:yahoo"]["state"] == "closed"
+    assert breaker.allow("text:yahoo")
+
+
+def test_exponential_cooldown() -> None:
+    breaker = CircuitBreaker(cooldown=0.01, max_cooldown=0.03)
+    breaker.record_failure("text:mojeek", trip=True)
+    assert breaker.states()["text:mojeek"]["cooldown"] == 0.01
+    time.sleep(0.02)
+    assert breaker.allow("text:mojeek")
+    breaker.record_failure("text:mojeek")  # the probe failed
+    assert breaker.states()["text:mojeek"]["cooldown"] == 0.02
+    time.sleep(0.03)
+    assert breaker.allow("text:mojeek")
+    breaker.record_failure("text:mojeek")
+    state = breaker.states()["text:mojeek"]
+    assert (state["state"], state["trips"], state["cooldown"]) == ("open", 3, 0.03)
+    assert 0 < state["retry_in"] <= 0.03
+
+
+def test_half_open_probe_connection_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(DDGS, "circuit_breaker", CircuitBreaker(cooldown=0.01))
+    monkeypatch.setattr(DDGS, "engine_stats", EngineStats())
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]  # nothing listens on the port once the socket is closed
+    engine = type("UnreachableEngine", (FakeEngine,), {"search_url": f"http://127.0.0.1:{port}/"})()
+    key = engine_key(engine)
+    DDGS.circuit_breaker.record_failure(key, trip=True)
+    time.sleep(0.02)
+    with pytest.raises(DDGSException, match="ConnectError"):
+        DDGS()._timed_search(engine, "python")  # the probe
+    state = DDGS.circuit_breaker.states()[key]
+    assert (state["state"], state["trips"], state["cooldown"]) == ("open", 2, 0.02)
@@ -0,0 +1,69 @@
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import pytest
+
+from ddgs.base import BaseSearchEngine
+from ddgs.ddgs import DDGS
+from ddgs.results import TextResult
+
+
+class FakeResponse:
+    def __init__(self, content: bytes | str, status_code: int = 200, encoding: str = "utf-8") -> None:
+        self.status_code = status_code
+        self.encoding = encoding
+        self.content = content.encode(encoding) if isinstance(content, str) else content
+        self.text = self.content.decode(encoding)
+
+
+class FakeClient:
+    """HTTP client returning `respond`, or `respond(url, kwargs)` if it is callable, and recording the requests."""
+
+    def __init__(self, respond: FakeResponse | Callable[[str, dict[str, Any]], FakeResponse]) -> None:
+        self.respond = respond
+        self.requests: list[tuple[str, dict[str, Any]]] = []
+
+    @property
+    def urls(self) -> list[str]:
+        return [url for url, _ in self.requests]
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:  # noqa: ANN401, ARG002
+        self.requests.append((url, kwargs))
+        return self.respond(url, kwargs) if callable(self.respond) else self.respond
+
+
+class FakeEngine(BaseSearchEngine[TextResult]):
+    """Text engine without HTTP requests. Subclasses override `search`."""
+
+    name = "fake"
+    category = "text"
+    provider = "fake"
+    search_url = ""
+    search_method = "GET"
+
+    def build_payload(self, *args: Any, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401, ARG002
+        return {}
+
+
+def make_results(name: str, query: str, page: int = 1) -> list[TextResult]:
+    """Make a page of 10 results of the engine `name`."""
+    results = []
+    for i in range(10):
+        result = TextResult()
+        result.title = f"{query} {name} {i}"
+        result.href = f"https://{name}.example/{query}/{page}/{i}"
+        result.body = query
+        results.append(result)
+    return results
+
+
+@pytest.fixture
+def use_engines(monkeypatch: pytest.MonkeyPatch) -> Callable[[type[FakeEngine], Iterable[str]], list[FakeEngine]]:
+    """Make DDGS search engines of `engine_class`, one per name."""
+
+    def use(engine_class: type[FakeEngine], names: Iterable[str]) -> list[FakeEngine]:
+        engines = [type(name, (engine_class,), {"name": name, "provider": name})() for name in names]
+        monkeypatch.setattr(DDGS, "_get_engines", lambda _self, _category, _backend: list(engines))
+        return engines
+
+    return use
@@ -1,8 +1,9 @@
+import asyncio
 import time
 
 import pytest
 
-from ddgs import DDGS
+from ddgs import DDGS, AsyncDDGS
 
 
 @pytest.fixture(autouse=True)
@@ -22,6 +23,12 @@ def test_text_search() -> None:
     assert len(results) > 0
 
 
+def test_text_iter() -> None:
+    results = list(DDGS().text_iter("cat", max_results=15))
+    assert 0 < len(results) <= 15
+    assert len({r["href"] for r in results}) == len(results)
+
+
 def test_images_search() -> None:
     results = DDGS().images("tiger")
     assert isinstance(results, list)
@@ -65,3 +72,13 @@ def test_extract_content() -> None:
     result = DDGS().extract("https://httpbin.org/html", fmt="content")
     assert isinstance(result["content"], bytes)
     assert len(result["content"]) > 0
+
+
+def test_async_text_search() -> None:
+    async def search() -> list[dict[str, str]]:
+        async with AsyncDDGS() as addgs:
+            return await addgs.text("fox")
+
+    results = asyncio.run(search())
+    assert isinstance(results, list)
+    assert len(results) > 0
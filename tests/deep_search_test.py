@@ -0,0 +1,68 @@
+import asyncio
+import threading
+from collections import Counter
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+import pytest
+from conftest import FakeEngine, make_results
+
+from ddgs.cache import ResultCache
+from ddgs.ddgs import DDGS, AsyncDDGS
+from ddgs.results import TextResult
+
+LAST_PAGE = 6
+
+
+class PagedEngine(FakeEngine):
+    """Engine with LAST_PAGE pages of 10 results, then the last page again (as some engines do)."""
+
+    lock = threading.Lock()
+    pages: ClassVar[Counter[str]] = Counter()
+
+    def search(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401, ARG002
+        with self.lock:
+            self.pages[self.name] += 1
+        return make_results(self.name, query, min(kwargs.get("page", 1), LAST_PAGE))
+
+    async def asearch(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401
+        return self.search(query, *args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def engines(use_engines: Callable[..., list[FakeEngine]]) -> None:
+    use_engines(PagedEngine, ("one", "two"))
+    PagedEngine.pages.clear()
+
+
+def test_deep_search() -> None:
+    assert len(DDGS().text("python", max_results=200)) == 20
+    results = DDGS().text("python", max_results=200, deep=True)
+    assert len(results) == 2 * LAST_PAGE * 10
+    assert len({r["href"] for r in results}) == len(results)
+
+
+def test_deep_search_stops_at_max_results() -> None:
+    results = DDGS().text("python", max_results=25, deep=True)
+    assert len(results) == 25
+    assert PagedEngine.pages.total() <= 6  # at most 3 pages per engine, the engines may run concurrently
+
+
+def test_deep_search_async() -> None:
+    results = asyncio.run(AsyncDDGS().text("python", max_results=200, deep=True))
+    assert len(results) == 2 * LAST_PAGE * 10
+
+
+def test_deep_search_iter() -> None:
+    assert len(list(DDGS().text_iter("python", max_results=200, deep=True))) == 2 * LAST_PAGE * 10
+
+
+def test_deep_search_cache_key() -> None:
+    ddgs = DDGS(cache=ResultCache())
+    assert [len(ddgs.text("python", max_results=200, deep=deep)) for deep in (False, True)] == [20, 120]
+
+    async def search() -> list[int]:
+        addgs = AsyncDDGS(cache=ResultCache())
+        return [len(await addgs.text("python", max_results=200, deep=deep)) for deep in (False, True)]
+
+    assert asyncio.run(search()) == [20, 120]
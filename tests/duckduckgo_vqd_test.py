@@ -0,0 +1,42 @@
+import time
+from typing import Any
+
+import pytest
+from conftest import FakeClient, FakeResponse
+
+from ddgs.engines.duckduckgo_images import DuckduckgoImages
+from ddgs.engines.duckduckgo_vqd import BaseDuckduckgoVqd
+from ddgs.utils import _TokenCache
+
+
+def test_token_cache() -> None:
+    cache = _TokenCache(ttl=0.01)
+    cache.set("python", "4-123")
+    assert cache.get("python") == "4-123"
+    cache.invalidate("python")
+    assert cache.get("python") is None
+    cache.set("python", "4-123")
+    time.sleep(0.02)
+    assert cache.get("python") is None
+
+
+def test_vqd_is_reused_and_invalidated(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(BaseDuckduckgoVqd, "vqd_cache", _TokenCache(ttl=600))
+    status_code = 200
+
+    def respond(url: str, _kwargs: dict[str, Any]) -> FakeResponse:
+        if url == "https://duckduckgo.com":
+            return FakeResponse('<script>vqd="4-123"</script>')
+        return FakeResponse('{"results": [{"title": "python", "image": "https://x.com/1.png"}]}', status_code)
+
+    engine = DuckduckgoImages()
+    client = FakeClient(respond)
+    engine.http_client = client  # type: ignore[assignment]
+    assert engine.search("python", page=1)
+    assert engine.search("python", page=2)
+    assert client.urls.count("https://duckduckgo.com") == 1
+    status_code = 403
+    assert not engine.search("python", page=3)
+    status_code = 200
+    assert engine.search("python", page=3)
+    assert client.urls.count("https://duckduckgo.com") == 2
@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+from conftest import FakeClient, FakeResponse
+
+import ddgs.base
+from ddgs.base import BaseSearchEngine, compile_xpath
+from ddgs.engines import ENGINES
+from ddgs.results import BaseResult
+from ddgs.utils import _normalize_texts
+
+FIXTURES = sorted(p for p in (Path(__file__).parent / "fixtures").iterdir() if p.suffix in {".html", ".json"})
+RESULTS_PER_PAGE = {
+    "images_duckduckgo": 100,
+    "news_duckduckgo": 30,
+    "videos_duckduckgo": 60,
+    "text_grokipedia": 1,  # best matching article
+    "text_wikipedia": 1,
+}
+
+
+def test_compile_xpath_is_cached_per_thread() -> None:
+    xpath = compile_xpath(".//h2//text()")
+    assert compile_xpath(".//h2//text()") is xpath
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(compile_xpath, ".//h2//text()").result() is not xpath
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.stem)
+def test_extract_results(path: Path) -> None:
+    category, name = path.stem.split("_", 1)
+    engine = ENGINES[category][name]()
+    results = engine.post_extract_results(engine.extract_results(path.read_text(encoding="utf-8")))
+    assert len(results) == RESULTS_PER_PAGE.get(path.stem, 10)
+    for result in results:
+        assert result.title
+        assert result.key().startswith("https://")
+
+
+@pytest.mark.parametrize("path", [p for p in FIXTURES if p.suffix == ".html"], ids=lambda p: p.stem)
+def test_extract_results_normalized_per_page(path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    category, name = path.stem.split("_", 1)
+    engine = ENGINES[category][name]()
+    pages: list[list[str]] = []
+
+    def normalize_texts(raws: list[str]) -> list[str]:
+        pages.append(raws)
+        return _normalize_texts(raws)
+
+    monkeypatch.setattr(ddgs.base, "_normalize_texts", normalize_texts)
+    eager = [r.to_dict() for r in engine.extract_results(path.read_bytes())]
+    monkeypatch.setattr(BaseResult, "lazy", True)
+    lazy = [r.to_dict() for r in engine.extract_results(path.read_bytes())]
+    assert eager == lazy
+    base_methods = (BaseSearchEngine.extract_results, BaseSearchEngine.extract_results_from_tree)
+    if (type(engine).extract_results, type(engine).extract_results_from_tree) == base_methods:
+        assert len(pages) == len(engine.elements_xpath.keys() & engine.result_type._text_fields) > 0
+
+
+YANDEX_HTML = '<ul><li class="serp-item"><h3><a href="https://zürich.example/">Zürich – café</a></h3></li></ul>'  # noqa: RUF001
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp1252"])
+def test_request_body(encoding: str) -> None:
+    engine = ENGINES["text"]["yandex"]()
+    engine.http_client = FakeClient(FakeResponse(YANDEX_HTML, encoding=encoding))  # type: ignore[assignment]
+    results = engine.search("zürich")
+    assert results
+    assert results[0].title == "Zürich – café"  # noqa: RUF001
+
+
+@pytest.mark.parametrize("category", ["images", "news", "videos"])
+def test_search_json(category: str) -> None:
+    path = Path(__file__).parent / "fixtures" / f"{category}_duckduckgo.json"
+    engine = ENGINES[category]["duckduckgo"]()
+    engine.http_client = FakeClient(FakeResponse(path.read_bytes()))  # type: ignore[assignment]
+    results = engine.search("python", vqd="4-123")
+    assert results
+    assert len(results) == RESULTS_PER_PAGE[path.stem]
+
+
+def test_duckduckgo_http_client2() -> None:
+    body = (Path(__file__).parent / "fixtures" / "text_duckduckgo.html").read_bytes()
+    engine = ENGINES["text"]["duckduckgo"]()
+    transport = httpx.MockTransport(
+        lambda _request: httpx.Response(200, content=body, headers={"Content-Type": "text/html; charset=utf-8"})
+    )
+    engine.http_client.client = httpx.Client(transport=transport)  # type: ignore[assignment]
+    results = engine.search("python")
+    assert results
+    assert len(results) == RESULTS_PER_PAGE.get("text_duckduckgo", 10)
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+from collections.abc import Generator
+from contextlib import suppress
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ddgs.exceptions import TimeoutException
+from ddgs.http_client import AsyncHttpClient, HttpClient
+
+BODY = b"<html><body><p>python</p></body></html>"
+
+
+class SlowBodyHandler(BaseHTTPRequestHandler):
+    """Send the headers and the first bytes of the body, then the rest of the body after `/<seconds>`."""
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY[:10])
+        self.wfile.flush()
+        time.sleep(float(self.path.strip("/")))
+        with suppress(OSError):  # the client timed out
+            self.wfile.write(BODY[10:])
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url() -> Generator[str, None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowBodyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_body_does_not_block_event_loop(server_url: str) -> None:
+    async def max_loop_lag() -> float:
+        lag = 0.0
+        for _ in range(30):
+            start = time.monotonic()
+            await asyncio.sleep(0.01)
+            lag = max(lag, time.monotonic() - start - 0.01)
+        return lag
+
+    async def fetch() -> bytes:
+        resp = await AsyncHttpClient().get(f"{server_url}/0.3")
+        return resp.content
+
+    async def main() -> tuple[bytes, float]:
+        return await asyncio.gather(fetch(), max_loop_lag())
+
+    content, lag = asyncio.run(main())
+    assert content == BODY
+    assert lag < 0.2
+
+
+def test_body_timeout_raises_timeout_exception(server_url: str) -> None:
+    with pytest.raises(TimeoutException):
+        HttpClient(timeout=1).get(f"{server_url}/2").content  # noqa: B018
+    with pytest.raises(TimeoutException):
+        asyncio.run(AsyncHttpClient(timeout=1).get(f"{server_url}/2"))
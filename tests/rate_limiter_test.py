@@ -0,0 +1,97 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+import pytest
+from conftest import FakeEngine
+
+from ddgs.circuit_breaker import CircuitBreaker
+from ddgs.ddgs import DDGS
+from ddgs.rate_limiter import RateLimiter
+from ddgs.results import TextResult
+from ddgs.stats import EngineStats, engine_key
+
+
+class FakeGoogle(FakeEngine):
+    name = "google"
+    provider = "google"
+
+
+class FakeStartpage(FakeGoogle):
+    name = "startpage"
+
+
+def test_burst_then_skip() -> None:
+    limiter = RateLimiter(wait=False)
+    limiter.limit_engine("google", rate=1, burst=3)
+    engine = FakeGoogle()
+    assert [limiter.acquire(engine) for _ in range(4)] == [True, True, True, False]
+    assert limiter.acquire(FakeStartpage())  # no limit
+
+
+def test_provider_limit() -> None:
+    limiter = RateLimiter(wait=False)
+    limiter.limit_provider("google", rate=1, burst=1)
+    assert limiter.acquire(FakeGoogle())
+    assert not limiter.acquire(FakeStartpage())
+
+
+def test_wait() -> None:
+    limiter = RateLimiter(wait=True)
+    limiter.limit_engine("google", rate=50, burst=1)
+    engine = FakeGoogle()
+    start = time.monotonic()
+    for _ in range(6):
+        assert limiter.acquire(engine)
+    assert time.monotonic() - start >= 0.09
+
+
+def test_async_wait() -> None:
+    limiter = RateLimiter(wait=True)
+    limiter.limit_engine("google", rate=50, burst=1)
+    engine = FakeGoogle()
+
+    async def acquire_all() -> list[bool]:
+        return await asyncio.gather(*(limiter.aacquire(engine) for _ in range(6)))
+
+    start = time.monotonic()
+    assert all(asyncio.run(acquire_all()))
+    assert time.monotonic() - start >= 0.09
+
+
+class SearchingGoogle(FakeGoogle):
+    def search(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401, ARG002
+        return [TextResult(title=query, href="https://python.org")]
+
+
+@pytest.fixture
+def ddgs(monkeypatch: pytest.MonkeyPatch) -> DDGS:
+    monkeypatch.setattr(DDGS, "rate_limiter", RateLimiter(wait=False))
+    monkeypatch.setattr(DDGS, "engine_stats", EngineStats(min_samples=1))
+    monkeypatch.setattr(DDGS, "circuit_breaker", CircuitBreaker(failure_threshold=1, cooldown=0))
+    return DDGS()
+
+
+def test_skip_is_not_recorded(ddgs: DDGS) -> None:
+    engine = SearchingGoogle()
+    key = engine_key(engine)
+    DDGS.rate_limiter.limit_engine("google", rate=1, burst=1)
+    DDGS.circuit_breaker.record_failure(key)  # half-open after the cooldown of 0s
+    assert ddgs._timed_search(engine, "python")  # the probe closes the circuit
+    DDGS.circuit_breaker.record_failure(key)
+    assert ddgs._timed_search(engine, "python") is None  # skipped, over the rate limit
+    assert DDGS.engine_stats._outcomes[key] == deque([1])
+    assert DDGS.circuit_breaker.states()[key]["state"] == "half-open"
+    assert DDGS.circuit_breaker.is_available(key)  # the probe was released
+
+
+def test_wait_is_not_latency(ddgs: DDGS) -> None:
+    engine = SearchingGoogle()
+    DDGS.rate_limiter.wait = True
+    DDGS.rate_limiter.limit_engine("google", rate=10, burst=1)
+    for _ in range(3):
+        assert ddgs._timed_search(engine, "python")
+    latency = DDGS.engine_stats.latency_percentile(engine_key(engine), 0.99)
+    assert latency is not None
+    assert latency < 0.05
@@ -0,0 +1,230 @@
+import copy
+import pickle
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from conftest import FakeEngine
+
+from ddgs.ddgs import DDGS
+from ddgs.results import BaseResult, NewsResult, ResultsAggregator, TextResult
+from ddgs.utils import _canonicalize_url, _minhash, _normalize_text, _normalize_texts
+
+
+@pytest.fixture
+def lazy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(BaseResult, "lazy", True)
+
+
+def make_result(title: str, href: str, body: str) -> TextResult:
+    result = TextResult()
+    result.title = title
+    result.href = href
+    result.body = body
+    return result
+
+
+def test_eager_normalization() -> None:
+    result = make_result("<b>Python</b> &amp; co", "https://example.com/a%20b", "")
+    assert result._get_raw("title") == "Python & co"
+    assert result.to_dict() == {"title": "Python & co", "href": "https://example.com/a+b", "body": ""}
+
+
+@pytest.mark.usefixtures("lazy")
+def test_lazy_normalization() -> None:
+    result = make_result("<b>Python</b> &amp; co", "https://example.com/a%20b", "")
+    assert result._get_raw("title") == "<b>Python</b> &amp; co"
+    assert result.href == "https://example.com/a+b"
+    assert result._get_raw("title") == "<b>Python</b> &amp; co"
+    assert result.to_dict() == {"title": "Python & co", "href": "https://example.com/a+b", "body": ""}
+    assert result == TextResult(title="Python & co", href="https://example.com/a+b")
+
+
+@pytest.mark.usefixtures("lazy")
+def test_lazy_aggregator() -> None:
+    results_aggregator: ResultsAggregator[TextResult] = ResultsAggregator({"href"})
+    first = make_result("<b>Python</b>", "https://example.com/a%20b", "short")
+    duplicate = make_result("<b>Python</b>", "https://example.com/a b", "<i>longer body</i>")
+    results_aggregator.extend([first, duplicate])
+    assert results_aggregator.extract_dicts() == [
+        {"title": "Python", "href": "https://example.com/a+b", "body": "longer body"}
+    ]
+    assert first._get_raw("title") == "<b>Python</b>"  # the dropped duplicate is not normalized
+
+
+@pytest.mark.usefixtures("lazy")
+def test_lazy_rank_results() -> None:
+    results_aggregator: ResultsAggregator[NewsResult] = ResultsAggregator({"url"})
+    results = [
+        NewsResult(date=f"2024-01-0{i}", title=f"<b>Python</b> {i}", url=f"https://example.com/{i}", image="i.png")
+        for i in range(3)
+    ]
+    results_aggregator.extend(results)
+    ranked = DDGS._rank_results(results_aggregator, "python", 2, None)
+    assert [r["title"] for r in ranked] == ["Python 0", "Python 1"]
+    assert results[2].title == "Python 2"  # read by the ranker
+    assert results[2]._pending  # the date and image of the result cut off by max_results are not normalized
+
+
+def test_slots() -> None:
+    result = make_result("Python", "https://example.com", "body")
+    assert not hasattr(result, "__dict__")
+    assert result.key() == "https://example.com"
+    with pytest.raises(AttributeError):
+        result.snippet = "body"  # type: ignore[attr-defined]
+    assert copy.deepcopy(result) == pickle.loads(pickle.dumps(result)) == result  # noqa: S301
+
+
+@pytest.mark.usefixtures("lazy")
+def test_lazy_copy() -> None:
+    result = make_result("a &amp;amp; b", "https://example.com", "")
+    copied = copy.copy(result)
+    assert copied._get_raw("title") == "a &amp;amp; b"
+    assert copied.title == result.title == "a &amp; b"
+
+
+@pytest.mark.parametrize(
+    ("raw", "text"),
+    [
+        ("Welcome to Python.org", "Welcome to Python.org"),
+        ("  Python \t tutorial\n", "Python tutorial"),  # control characters are removed, not spaces
+        ("<b>Python</b> &amp; co&#10;", "Python & co"),
+        ("&lt;b&gt; tag", "<b> tag"),
+        ("Cafe\u0301\u00a0cr\u00eape\u200b", "Caf\u00e9 cr\u00eape"),
+        ("<br>", ""),
+    ],
+)
+def test_normalize_text(raw: str, text: str) -> None:
+    assert _normalize_text(raw) == text
+    assert _normalize_texts([raw, "GitHub", raw]) == [text, "GitHub", text]
+
+
+@pytest.mark.parametrize(
+    ("url", "canonical"),
+    [
+        ("https://www.Example.com/page/?utm_source=x&b=2&a=1#top", "example.com/page?a=1&b=2"),
+        ("http://example.com/page?a=1&b=2&gclid=abc", "example.com/page?a=1&b=2"),
+        ("https://example.com:443/", "example.com"),
+        ("https://example.com:8080/page", "example.com:8080/page"),
+        ("not a url", "not a url"),
+    ],
+)
+def test_canonicalize_url(url: str, canonical: str) -> None:
+    assert _canonicalize_url(url) == canonical
+
+
+def test_aggregator_canonical_urls() -> None:
+    results_aggregator: ResultsAggregator[TextResult] = ResultsAggregator({"href"})
+    results_aggregator.extend(
+        [
+            make_result("Python", "https://www.python.org/", ""),
+            make_result("Python", "http://python.org?utm_source=google", "The official home of Python"),
+            make_result("Python", "https://python.org/#about", "Python"),
+            make_result("Docs", "https://docs.python.org/3/", "Documentation"),
+        ]
+    )
+    assert len(results_aggregator) == 2
+    assert results_aggregator.extract_dicts()[0] == {
+        "title": "Python",
+        "href": "http://python.org?utm_source=google",
+        "body": "The official home of Python",
+    }
+
+
+BODY = "Python is a programming language that lets you work quickly and integrate systems more effectively."
+
+
+def test_aggregator_near_duplicates() -> None:
+    results_aggregator: ResultsAggregator[TextResult] = ResultsAggregator({"href"}, near_duplicates=True)
+    new_items = results_aggregator.extend(
+        [
+            make_result("Welcome to Python.org", "https://www.python.org", BODY),
+            make_result("Welcome to Python.org | Mirror", "https://mirror.example.com/python", BODY),
+            make_result("Welcome to Python.org", "https://amp.example.com/python", f"{BODY} Read more"),
+            make_result("Python docs", "https://docs.python.org", "The official documentation of the Python language."),
+        ]
+    )
+    assert [item.href for item in new_items] == ["https://www.python.org", "https://docs.python.org"]
+    results_aggregator.append(make_result("Mirror", "https://mirror.example.com/python/", ""))
+    assert results_aggregator._counter.most_common() == [("python.org", 4), ("docs.python.org", 1)]
+    assert results_aggregator.extract_dicts()[0]["href"] == "https://amp.example.com/python"  # the richest variant
+
+    results_aggregator = ResultsAggregator({"href"})
+    results_aggregator.append(make_result("Welcome to Python.org", "https://www.python.org", BODY))
+    results_aggregator.append(make_result("Welcome to Python.org", "https://mirror.example.com/python", BODY))
+    assert len(results_aggregator) == 2
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        (
+            make_result(
+                "Python Tutorial - W3Schools",
+                "https://www.w3schools.com/python/",
+                "Python is a popular programming language. Python can be used on a server to create web applications. "
+                "Start learning Python now.",
+            ),
+            make_result(
+                "Python Tutorial - GeeksforGeeks",
+                "https://www.geeksforgeeks.org/python-programming-language-tutorial/",
+                "Python is a popular programming language. Python can be used on a server to create web applications, "
+                "data science and machine learning. Start learning Python now.",
+            ),
+        ),
+        (
+            make_result(
+                "Download Python | Python.org",
+                "https://www.python.org/downloads/",
+                "The official home of the Python Programming Language. Download the latest version of Python for "
+                "Windows, Linux/UNIX, macOS and other platforms.",
+            ),
+            make_result(
+                "Python Releases for Windows | Python.org",
+                "https://www.python.org/downloads/windows/",
+                "The official home of the Python Programming Language. Download the latest version of Python for "
+                "Windows.",
+            ),
+        ),
+    ],
+)
+def test_aggregator_similar_pages_are_kept(first: TextResult, second: TextResult) -> None:
+    results_aggregator: ResultsAggregator[TextResult] = ResultsAggregator({"href"}, near_duplicates=True)
+    results_aggregator.extend([first, second])
+    assert len(results_aggregator) == 2
+
+
+class MirroredEngine(FakeEngine):
+    def search(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401, ARG002
+        return [make_result("Welcome to Python.org", f"https://{self.name}.example/python", BODY)]
+
+
+def test_near_duplicates_are_opt_in(use_engines: Callable[..., list[FakeEngine]]) -> None:
+    use_engines(MirroredEngine, ("one", "two"))
+    assert len(DDGS().text("python")) == 2
+    assert len(DDGS().text("python", near_duplicates=True)) == 1
+    assert len(list(DDGS().text_iter("python", near_duplicates=True))) == 1
+
+
+def test_minhash_is_stable() -> None:
+    # crc32 of the shingles: the same signature in every process, whatever PYTHONHASHSEED
+    signature = _minhash(f"Welcome to Python.org {BODY}")
+    assert signature
+    assert len(signature) == 128
+    assert signature[:4] == (31239035, 31239035, 31239035, 5672315)
+
+
+def test_aggregator_rrf() -> None:
+    results_aggregator: ResultsAggregator[TextResult] = ResultsAggregator({"href"})
+    hrefs = ["https://b1.example", "https://b2.example", "https://shared.example"]
+    results_aggregator.extend([make_result(h, h, "") for h in [*hrefs, hrefs[0]]], "bing")
+    results_aggregator.extend([make_result(h, h, "") for h in ["https://w.example", hrefs[2]]], "wikipedia", 2)
+    assert results_aggregator.ranks["shared.example"] == {"bing": 3, "wikipedia": 2}
+    assert results_aggregator.ranks["b1.example"] == {"bing": 1}  # the best rank of the engine
+
+    frequency = [r["href"] for r in results_aggregator.extract_dicts()]
+    assert frequency == ["https://b1.example", "https://shared.example", "https://b2.example", "https://w.example"]
+    rrf = [r["href"] for r in results_aggregator.extract_dicts("rrf")]
+    assert rrf == ["https://shared.example", "https://w.example", "https://b1.example", "https://b2.example"]
+    with pytest.raises(ValueError, match="Unknown merge"):
+        results_aggregator.extract_dicts("unknown")
@@ -0,0 +1,88 @@
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+import pytest
+from conftest import FakeEngine, make_results
+
+from ddgs.circuit_breaker import CircuitBreaker
+from ddgs.ddgs import DDGS, AsyncDDGS
+from ddgs.results import TextResult
+from ddgs.stats import EngineStats, engine_key
+
+DELAYS = {"slow": 1.0, "straggler": 1.0}  # seconds, 0.01 for other engines
+
+
+class TimedEngine(FakeEngine):
+    cancelled: ClassVar[set[str]] = set()
+
+    def search(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401, ARG002
+        time.sleep(DELAYS.get(self.name, 0.01))
+        return make_results(self.name, query)
+
+    async def asearch(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401, ARG002
+        try:
+            await asyncio.sleep(DELAYS.get(self.name, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled.add(self.name)
+            raise
+        return make_results(self.name, query)
+
+
+class OverlappingEngine(FakeEngine):
+    def search(self, query: str, *args: Any, **kwargs: Any) -> list[TextResult]:  # noqa: ANN401, ARG002
+        results = make_results(self.name, query)
+        for i, result in enumerate(results[:5]):
+            result.href = f"https://shared.example/{i}"  # returned by every engine
+        return results
+
+
+@pytest.fixture(autouse=True)
+def stats(monkeypatch: pytest.MonkeyPatch) -> EngineStats:
+    engine_stats = EngineStats(min_samples=1)
+    monkeypatch.setattr(DDGS, "engine_stats", engine_stats)
+    monkeypatch.setattr(DDGS, "circuit_breaker", CircuitBreaker())
+    monkeypatch.setattr(DDGS, "adaptive", False)
+    TimedEngine.cancelled.clear()
+    return engine_stats
+
+
+def test_hedged_engine_is_abandoned(
+    monkeypatch: pytest.MonkeyPatch, use_engines: Callable[..., list[FakeEngine]], stats: EngineStats
+) -> None:
+    slow, _ = use_engines(TimedEngine, ("slow", "fast"))
+    stats.record(engine_key(slow), 0.05, 10)  # usually answers in 50ms
+    monkeypatch.setattr(DDGS, "threads", 1)
+    start = time.monotonic()
+    results = DDGS(hedge_percentile=0.5).text("python", max_results=10)
+    assert time.monotonic() - start < 0.5
+    assert {r["href"].split("/")[2] for r in results} == {"fast.example"}
+
+
+def test_text_does_not_wait_for_stragglers(use_engines: Callable[..., list[FakeEngine]]) -> None:
+    use_engines(TimedEngine, ("straggler", "fast"))
+    start = time.monotonic()
+    results = DDGS().text("python", max_results=10)
+    assert time.monotonic() - start < 0.5
+    assert len(results) == 10
+
+
+def test_text_iter_yields_unique_hrefs(use_engines: Callable[..., list[FakeEngine]]) -> None:
+    use_engines(OverlappingEngine, ("one", "two", "three"))
+    hrefs = [r["href"] for r in DDGS().text_iter("python", max_results=None)]
+    assert len(hrefs) == len(set(hrefs)) == 5 + 3 * 5
+
+
+def test_async_cancels_pending_engines(use_engines: Callable[..., list[FakeEngine]]) -> None:
+    use_engines(TimedEngine, ("straggler", "fast"))
+
+    async def search() -> list[dict[str, Any]]:
+        results = await AsyncDDGS().text("python", max_results=10)
+        await asyncio.sleep(0)  # let the cancelled task run its cancellation
+        assert TimedEngine.cancelled == {"straggler"}
+        return results
+
+    start = time.monotonic()
+    assert len(asyncio.run(search())) == 10
+    assert time.monotonic() - start < 0.5
@@ -0,0 +1,64 @@
+import pytest
+
+from ddgs.ddgs import DDGS
+from ddgs.exceptions import DDGSException
+from ddgs.results import ResultsAggregator, TextResult
+from ddgs.similarity import BM25Ranker, SimpleFilterRanker
+
+DOCS = [
+    {"title": "Javascript frameworks", "href": "https://a.example", "body": "React, Vue and Svelte for javascript."},
+    {"title": "Travel to Java", "href": "https://b.example", "body": "Java is an island of Indonesia."},
+    {"title": "Category:Java - Wikimedia Commons", "href": "https://c.example", "body": "Java."},
+    {"title": "Python tutorial", "href": "https://d.example", "body": "Learn the Python programming language."},
+    {
+        "title": "Java programming language",
+        "href": "https://e.example",
+        "body": "Java is a programming language. Java runs on the JVM.",
+    },
+]
+
+
+def test_bm25_ranker() -> None:
+    ranked = BM25Ranker().rank(DOCS, "java programming language")
+    assert [doc["href"] for doc in ranked] == [
+        "https://e.example",  # all terms, in the title and body
+        "https://d.example",  # "programming language"
+        "https://b.example",  # "java" in the title and body
+        "https://a.example",  # "javascript" is not "java"
+    ]
+
+
+def test_bm25_ranker_ties_keep_order() -> None:
+    docs = [{"title": f"doc {i}", "href": f"https://{i}.example", "body": "unrelated"} for i in range(5)]
+    assert BM25Ranker().rank(docs, "java") == docs
+    assert BM25Ranker().rank(docs, "") == docs
+
+
+def test_bm25_ranker_description() -> None:
+    docs = [{"title": "A", "description": "cats"}, {"title": "B", "description": "dogs and more dogs"}]
+    assert BM25Ranker().rank(docs, "dogs")[0]["title"] == "B"
+
+
+def test_simple_filter_ranker_substrings() -> None:
+    ranked = SimpleFilterRanker().rank(DOCS, "java programming language")
+    assert len(ranked) == 4
+    assert ranked[0]["href"] == "https://a.example"  # "java" is a substring of "javascript"
+
+
+@pytest.mark.parametrize("ranker", ["simple", "bm25"])
+def test_rank_results(ranker: str) -> None:
+    results_aggregator: ResultsAggregator[TextResult] = ResultsAggregator({"href"})
+    results_aggregator.extend([TextResult(**doc) for doc in DOCS])
+    results = DDGS._rank_results(results_aggregator, "java programming language", 2, None, ranker=ranker)
+    expected = {"simple": "https://a.example", "bm25": "https://e.example"}
+    assert len(results) == 2
+    assert results[0]["href"] == expected[ranker]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "available"), [({"ranker": "x"}, "simple, bm25"), ({"merge": "x"}, "frequency, rrf")]
+)
+def test_unknown_ranking(monkeypatch: pytest.MonkeyPatch, kwargs: dict[str, str], available: str) -> None:
+    monkeypatch.setattr(DDGS, "_get_engines", lambda *_args: pytest.fail("engines must not be searched"))
+    with pytest.raises(DDGSException, match=f"Available: {available}"):
+        DDGS().text("java", **kwargs)
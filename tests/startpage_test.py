@@ -0,0 +1,30 @@
+from typing import Any
+
+from conftest import FakeClient, FakeResponse
+
+from ddgs.engines.startpage import Startpage
+
+HOMEPAGE = '<form id="search"><input name="sc" value="abc123"></form>'
+RESULTS = '<div class="result"><a href="https://python.org"><h2>Python</h2></a><p>body</p></div>'
+
+
+def test_sc_is_reused_and_refreshed() -> None:
+    results = RESULTS
+
+    def respond(url: str, kwargs: dict[str, Any]) -> FakeResponse:
+        if url == "https://www.startpage.com/":
+            return FakeResponse(HOMEPAGE)
+        assert kwargs["data"]["sc"] == "abc123"
+        return FakeResponse(results)
+
+    engine = Startpage()
+    client = FakeClient(respond)
+    engine.http_client = client  # type: ignore[assignment]
+    assert engine.search("python")
+    assert engine.search("python", page=2)
+    assert client.urls.count("https://www.startpage.com/") == 1
+    results = "<html></html>"  # e.g. the sc param expired
+    assert not engine.search("python", page=3)
+    results = RESULTS
+    assert engine.search("python", page=3)
+    assert client.urls.count("https://www.startpage.com/") == 2
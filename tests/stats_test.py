@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from ddgs.stats import EngineStats
+
+
+def test_latency_percentile() -> None:
+    stats = EngineStats(window=100, min_samples=10)
+    assert stats.latency_percentile("text:google", 0.9) is None
+    for i in range(1, 101):
+        stats.record("text:google", i / 100, 10)
+    assert stats.latency_percentile("text:google", 0.5) == 0.51
+    assert stats.latency_percentile("text:google", 0.9) == 0.91
+
+
+def test_latency_window() -> None:
+    stats = EngineStats(window=10, min_samples=1)
+    for _ in range(10):
+        stats.record("text:brave", 5.0, 10)
+    for _ in range(10):
+        stats.record("text:brave", 0.1, 10)
+    assert stats.latency_percentile("text:brave", 0.99) == 0.1
+
+
+def test_sample_score_prefers_productive_engines() -> None:
+    stats = EngineStats()
+    for _ in range(50):
+        stats.record("text:good", 0.5, 10)
+        stats.record("text:empty", 0.5, 0)
+        stats.record("text:broken", None, 0)
+    good = sum(stats.sample_score("text:good") for _ in range(100))
+    assert good > sum(stats.sample_score("text:empty") for _ in range(100))
+    assert good > sum(stats.sample_score("text:broken") for _ in range(100))
+
+
+def test_save_load(tmp_path: Path) -> None:
+    stats = EngineStats()
+    stats.record("text:google", 0.3, 10)
+    stats.record("text:google", None, 0)
+    stats.save(tmp_path / "stats.json")
+    loaded = EngineStats(min_samples=1)
+    loaded.load(tmp_path / "stats.json")
+    assert loaded.latency_percentile("text:google", 0.5) == 0.3
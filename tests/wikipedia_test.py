@@ -0,0 +1,30 @@
+import json
+
+from conftest import FakeClient, FakeResponse
+
+from ddgs.engines.wikipedia import Wikipedia
+
+
+def wikipedia_client(pages: list[dict[str, str]]) -> FakeClient:
+    return FakeClient(FakeResponse(json.dumps({"query": {"pages": pages}} if pages else {"batchcomplete": True})))
+
+
+def test_single_request() -> None:
+    engine = Wikipedia()
+    page = {"title": "Python", "fullurl": "https://de.wikipedia.org/wiki/Python", "extract": "Python ist ..."}
+    client = wikipedia_client([page])
+    engine.http_client = client  # type: ignore[assignment]
+    results = engine.search("python", region="de-de")
+    assert results
+    assert (results[0].title, results[0].href, results[0].body) == (page["title"], page["fullurl"], page["extract"])
+    assert len(client.requests) == 1
+    assert client.requests[0][0] == "https://de.wikipedia.org/w/api.php"
+    assert engine.search_url == "https://{lang}.wikipedia.org/w/api.php"
+
+
+def test_no_results() -> None:
+    engine = Wikipedia()
+    engine.http_client = wikipedia_client([])  # type: ignore[assignment]
+    assert engine.search("xyzzy") == []
+    engine.http_client = wikipedia_client([{"title": "Python", "fullurl": "", "extract": "Python may refer to:"}])  # type: ignore[assignment]
+    assert engine.search("python") == []